@@ -39,6 +39,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "task_manager.middleware.RequestMetricsMiddleware",
+    "task_manager.middleware.DatabaseUnavailableMiddleware",
+    "task_manager.middleware.ReplicaPinningMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -114,3 +117,80 @@ AUTH_USER_MODEL = "task_manager.Worker"
 LOGIN_REDIRECT_URL = "/"
 
 CRISPY_TEMPLATE_PACK = "bootstrap4"
+
+# Seconds the index page statistics may be served from the cache.
+# Model saves and deletes invalidate them earlier.
+DASHBOARD_STATS_CACHE_TIMEOUT = int(
+    os.environ.get("DASHBOARD_STATS_CACHE_TIMEOUT", 60)
+)
+
+# Seconds a user's team memberships may be served from the cache.
+# Changes to Team.members invalidate them earlier.
+MEMBERSHIP_CACHE_TIMEOUT = int(
+    os.environ.get("MEMBERSHIP_CACHE_TIMEOUT", 300)
+)
+
+# Sessions are stored in the database; production reads them through the
+# cache when REDIS_URL is set. CachedModelBackend caches the logged-in
+# worker for USER_CACHE_TIMEOUT seconds, but only when CACHES is shared by
+# every process (REDIS_URL); otherwise it loads the worker on every request.
+SESSION_ENGINE = os.environ.get(
+    "SESSION_ENGINE", "django.contrib.sessions.backends.db"
+)
+AUTHENTICATION_BACKENDS = ["task_manager.auth.CachedModelBackend"]
+USER_CACHE_TIMEOUT = int(os.environ.get("USER_CACHE_TIMEOUT", 300))
+
+# Background jobs processed by `manage.py run_worker`. A claimed job is
+# handed to another worker if it is not finished within the visibility
+# timeout; failed attempts are retried after an exponentially growing
+# delay.
+JOB_MAX_ATTEMPTS = int(os.environ.get("JOB_MAX_ATTEMPTS", 5))
+JOB_RETRY_DELAY = int(os.environ.get("JOB_RETRY_DELAY", 30))
+JOB_VISIBILITY_TIMEOUT = int(
+    os.environ.get("JOB_VISIBILITY_TIMEOUT", 300)
+)
+
+# Deadline reminders sent by `manage.py send_deadline_reminders`: open
+# tasks due within DEADLINE_REMINDER_HOURS are reported as due soon, tasks
+# that became overdue within DEADLINE_LOOKBACK_DAYS as overdue.
+DEADLINE_REMINDER_HOURS = int(
+    os.environ.get("DEADLINE_REMINDER_HOURS", 24)
+)
+DEADLINE_LOOKBACK_DAYS = int(os.environ.get("DEADLINE_LOOKBACK_DAYS", 7))
+
+DEFAULT_FROM_EMAIL = os.environ.get(
+    "DEFAULT_FROM_EMAIL", "task-manager@localhost"
+)
+
+# Read replicas, see "Read Replicas" in the README. The database aliases
+# in DATABASE_REPLICAS receive the reads of requests; a browser that wrote
+# reads from the primary for DATABASE_REPLICA_PIN_SECONDS. Replicas are
+# checked every DATABASE_REPLICA_CHECK_INTERVAL seconds and skipped while
+# they lag more than DATABASE_REPLICA_MAX_LAG seconds.
+DATABASE_ROUTERS = ["task_manager.routers.ReplicaRouter"]
+DATABASE_REPLICAS = []
+DATABASE_REPLICA_PIN_SECONDS = int(
+    os.environ.get("DATABASE_REPLICA_PIN_SECONDS", 10)
+)
+DATABASE_REPLICA_MAX_LAG = float(
+    os.environ.get("DATABASE_REPLICA_MAX_LAG", 5)
+)
+DATABASE_REPLICA_CHECK_INTERVAL = float(
+    os.environ.get("DATABASE_REPLICA_CHECK_INTERVAL", 10)
+)
+
+# Per-request query/timing instrumentation. Requests above any of these
+# thresholds are logged; aggregated numbers are served to staff users at
+# /metrics/requests/.
+REQUEST_METRICS_SERVER_TIMING = (
+    os.environ.get("REQUEST_METRICS_SERVER_TIMING", "False") == "True"
+)
+REQUEST_METRICS_MAX_QUERIES = int(
+    os.environ.get("REQUEST_METRICS_MAX_QUERIES", 30)
+)
+REQUEST_METRICS_MAX_DB_MS = int(
+    os.environ.get("REQUEST_METRICS_MAX_DB_MS", 200)
+)
+REQUEST_METRICS_MAX_TOTAL_MS = int(
+    os.environ.get("REQUEST_METRICS_MAX_TOTAL_MS", 1000)
+)
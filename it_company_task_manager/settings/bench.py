@@ -0,0 +1,12 @@
+from .prod import *
+
+# Production settings served over plain HTTP on localhost, for comparing
+# server setups with `manage.py load_test`. Never deploy with these.
+ALLOWED_HOSTS = ["127.0.0.1", "localhost"]
+
+SECURE_SSL_REDIRECT = False
+SESSION_COOKIE_SECURE = False
+CSRF_COOKIE_SECURE = False
+SECURE_HSTS_SECONDS = 0
+SECURE_HSTS_INCLUDE_SUBDOMAINS = False
+SECURE_HSTS_PRELOAD = False
@@ -12,5 +12,17 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
-    }
+    },
+    # Set SQLITE_REPLICA_NAME to a copy of db.sqlite3 to try out replica
+    # reads locally. Tests always run it as a mirror of "default".
+    "replica": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.environ.get("SQLITE_REPLICA_NAME", BASE_DIR / "db.sqlite3"),
+        "TEST": {"MIRROR": "default"},
+    },
 }
+
+if os.environ.get("SQLITE_REPLICA_NAME"):
+    DATABASE_REPLICAS = ["replica"]
+
+EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
@@ -1,3 +1,7 @@
+import importlib.util
+
+from django.core.exceptions import ImproperlyConfigured
+
 from .base import *
 
 # SECURITY WARNING: don't run with debug turned on in production!
@@ -29,3 +33,107 @@ DATABASES = {
         "PORT": int(os.environ["POSTGRES_DB_PORT"]),
     }
 }
+
+# Comma-separated "host" or "host:port" entries, one per streaming
+# replica of the primary above.
+DATABASE_REPLICAS = []
+for index, address in enumerate(
+    filter(None, os.environ.get("POSTGRES_REPLICA_HOSTS", "").split(",")),
+    start=1,
+):
+    host, _, port = address.strip().partition(":")
+    alias = f"replica{index}"
+    DATABASES[alias] = dict(
+        DATABASES["default"],
+        HOST=host,
+        PORT=int(port) if port else DATABASES["default"]["PORT"],
+        TEST={"MIRROR": "default"},
+    )
+    DATABASE_REPLICAS.append(alias)
+
+# Connection handling for the primary and every replica, see "Database
+# Connections" in the README:
+# - "persistent": every gunicorn thread keeps its connection for
+#   POSTGRES_CONN_MAX_AGE seconds and checks it before reuse.
+# - "pool": one psycopg 3 pool per database and gunicorn worker process,
+#   sized by POSTGRES_POOL_MIN_SIZE / POSTGRES_POOL_MAX_SIZE. Needs
+#   `pip install "psycopg[binary,pool]"` instead of psycopg2-binary.
+# - "none": a new connection per request.
+POSTGRES_CONN_MODE = os.environ.get("POSTGRES_CONN_MODE", "persistent")
+
+if POSTGRES_CONN_MODE == "persistent":
+    for database in DATABASES.values():
+        database["CONN_MAX_AGE"] = int(
+            os.environ.get("POSTGRES_CONN_MAX_AGE", 600)
+        )
+        database["CONN_HEALTH_CHECKS"] = True
+elif POSTGRES_CONN_MODE == "pool":
+    if importlib.util.find_spec("psycopg_pool") is None:
+        raise ImproperlyConfigured(
+            'POSTGRES_CONN_MODE="pool" needs psycopg 3 and its pool: '
+            'pip install "psycopg[binary,pool]".'
+        )
+    # Without an explicit size, split the connection budget between the
+    # gunicorn worker processes (WEB_CONCURRENCY) and the databases each
+    # of them keeps a pool for (the primary and every replica).
+    POSTGRES_MAX_CONNECTIONS = int(
+        os.environ.get("POSTGRES_MAX_CONNECTIONS", 0)
+    )
+    WEB_CONCURRENCY = int(os.environ.get("WEB_CONCURRENCY", 1))
+    pool_max_size = int(os.environ.get(
+        "POSTGRES_POOL_MAX_SIZE",
+        max(
+            POSTGRES_MAX_CONNECTIONS // (WEB_CONCURRENCY * len(DATABASES)),
+            1,
+        )
+        if POSTGRES_MAX_CONNECTIONS else 10
+    ))
+    for database in DATABASES.values():
+        database["OPTIONS"] = {
+            "pool": {
+                "min_size": min(
+                    int(os.environ.get("POSTGRES_POOL_MIN_SIZE", 2)),
+                    pool_max_size,
+                ),
+                "max_size": pool_max_size,
+                "timeout": float(
+                    os.environ.get("POSTGRES_POOL_TIMEOUT", 10)
+                ),
+            },
+        }
+elif POSTGRES_CONN_MODE != "none":
+    raise ImproperlyConfigured(
+        f"Unknown POSTGRES_CONN_MODE: {POSTGRES_CONN_MODE!r}."
+    )
+
+# A cache shared by all web and worker processes. Sessions, team
+# memberships and the logged-in worker are only cached across requests when
+# one is configured: a logout in one process must end the session in all.
+REDIS_URL = os.environ.get("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        },
+    }
+    SESSION_ENGINE = os.environ.get(
+        "SESSION_ENGINE", "django.contrib.sessions.backends.cached_db"
+    )
+
+# WhiteNoise only runs synchronously, so under ASGI it moves every request
+# into a thread, the async views included. Set to False when a proxy or a
+# CDN serves STATIC_ROOT instead.
+SERVE_STATIC_FILES = os.environ.get("SERVE_STATIC_FILES", "True") == "True"
+if not SERVE_STATIC_FILES:
+    MIDDLEWARE = [
+        middleware
+        for middleware in MIDDLEWARE
+        if middleware != "whitenoise.middleware.WhiteNoiseMiddleware"
+    ]
+
+EMAIL_HOST = os.environ.get("EMAIL_HOST", "localhost")
+EMAIL_PORT = int(os.environ.get("EMAIL_PORT", 25))
+EMAIL_HOST_USER = os.environ.get("EMAIL_HOST_USER", "")
+EMAIL_HOST_PASSWORD = os.environ.get("EMAIL_HOST_PASSWORD", "")
+EMAIL_USE_TLS = os.environ.get("EMAIL_USE_TLS", "False") == "True"
@@ -0,0 +1,89 @@
+(function () {
+  function debounce(callback, delay) {
+    let timer = null;
+    return (...args) => {
+      clearTimeout(timer);
+      timer = setTimeout(() => callback(...args), delay);
+    };
+  }
+
+  function setUp(select) {
+    const input = document.createElement("input");
+    input.type = "search";
+    input.className = "form-control form-control-sm mb-1 autocomplete-input";
+    input.placeholder = "Type to search...";
+    input.setAttribute("aria-label", select.getAttribute("aria-label") || "Search");
+
+    const results = document.createElement("div");
+    results.className = "list-group autocomplete-results";
+
+    select.before(input);
+    input.after(results);
+
+    function addOption(id, text) {
+      const value = String(id);
+      if (!Array.from(select.options).some((option) => option.value === value)) {
+        select.add(new Option(text, value, true, true));
+      }
+    }
+
+    function render(data, append) {
+      if (!append) {
+        results.innerHTML = "";
+      }
+      const more = results.querySelector("[data-autocomplete-more]");
+      if (more) {
+        more.remove();
+      }
+      data.results.forEach((item) => {
+        const button = document.createElement("button");
+        button.type = "button";
+        button.className = "list-group-item list-group-item-action py-1";
+        button.textContent = item.text;
+        button.addEventListener("click", () => addOption(item.id, item.text));
+        results.append(button);
+      });
+      if (data.next) {
+        const button = document.createElement("button");
+        button.type = "button";
+        button.className = "list-group-item list-group-item-action py-1 text-muted";
+        button.textContent = "Load more";
+        button.dataset.autocompleteMore = "";
+        button.addEventListener("click", () => search(data.next));
+        results.append(button);
+      }
+    }
+
+    function search(cursor) {
+      const params = new URLSearchParams({q: input.value.trim()});
+      if (cursor) {
+        params.set("cursor", cursor);
+      }
+      fetch(`${select.dataset.autocompleteUrl}?${params}`, {credentials: "same-origin"})
+        .then((response) => response.json())
+        .then((data) => render(data, Boolean(cursor)));
+    }
+
+    input.addEventListener("input", debounce(() => search(), 250));
+    input.addEventListener("focus", () => {
+      if (!results.children.length) {
+        search();
+      }
+    });
+
+    // Every listed option is a chosen value; clicking one removes it.
+    select.addEventListener("mousedown", (event) => {
+      if (event.target.tagName === "OPTION") {
+        event.preventDefault();
+        event.target.remove();
+      }
+    });
+    select.closest("form").addEventListener("submit", () => {
+      Array.from(select.options).forEach((option) => {
+        option.selected = true;
+      });
+    });
+  }
+
+  document.querySelectorAll("select[data-autocomplete-url]").forEach(setUp);
+})();
@@ -0,0 +1,90 @@
+(function () {
+  const board = document.querySelector("[data-board]");
+  if (!board) {
+    return;
+  }
+
+  const csrfToken = board.querySelector("[name=csrfmiddlewaretoken]").value;
+  let dragged = null;
+
+  function loadColumn(column, url) {
+    fetch(url, {credentials: "same-origin"})
+      .then((response) => response.text())
+      .then((html) => {
+        const more = column.querySelector("[data-board-more]");
+        if (more) {
+          more.remove();
+        }
+        column
+          .querySelector("[data-board-cards]")
+          .insertAdjacentHTML("beforeend", html);
+      });
+  }
+
+  function updateCounts(counts) {
+    Object.entries(counts).forEach(([key, count]) => {
+      const counter = board.querySelector(`[data-board-count="${key}"]`);
+      if (counter) {
+        counter.textContent = count;
+      }
+    });
+  }
+
+  function moveCard(card, column) {
+    fetch(card.dataset.moveUrl, {
+      method: "POST",
+      credentials: "same-origin",
+      headers: {"X-CSRFToken": csrfToken},
+      body: new URLSearchParams({column: column.dataset.column}),
+    })
+      .then((response) => {
+        if (!response.ok) {
+          throw new Error(response.statusText);
+        }
+        return response.json();
+      })
+      .then((data) => {
+        const cards = column.querySelector("[data-board-cards]");
+        const empty = cards.querySelector(".project-task-empty");
+        if (empty) {
+          empty.remove();
+        }
+        cards.prepend(card);
+        updateCounts(data.counts);
+      });
+  }
+
+  board.querySelectorAll("[data-board-column]").forEach((column) => {
+    loadColumn(column, column.dataset.url);
+  });
+
+  board.addEventListener("click", (event) => {
+    const more = event.target.closest("[data-board-more]");
+    if (more) {
+      loadColumn(more.closest("[data-board-column]"), more.dataset.url);
+    }
+  });
+
+  board.addEventListener("dragstart", (event) => {
+    dragged = event.target.closest("[data-task]");
+  });
+
+  board.addEventListener("dragover", (event) => {
+    if (dragged && event.target.closest("[data-board-column]")) {
+      event.preventDefault();
+    }
+  });
+
+  board.addEventListener("drop", (event) => {
+    const column = event.target.closest("[data-board-column]");
+    const card = dragged;
+    dragged = null;
+    if (!card || !column) {
+      return;
+    }
+    event.preventDefault();
+    if (card.closest("[data-board-column]") !== column) {
+      moveCard(card, column);
+    }
+  });
+})();
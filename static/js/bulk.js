@@ -0,0 +1,14 @@
+(function () {
+  const selectAll = document.querySelector("[data-bulk-all]");
+  if (!selectAll) {
+    return;
+  }
+
+  selectAll.addEventListener("change", () => {
+    document
+      .querySelectorAll('input[name="tasks"][form="bulk-form"]')
+      .forEach((checkbox) => {
+        checkbox.checked = selectAll.checked;
+      });
+  });
+})();
@@ -7,12 +7,31 @@ from .models import (
     Position,
     Project,
     Team,
-    Tag
+    Tag,
+    Job,
+    DeadlineNotice,
 )
+from .reference import (
+    REFERENCE_MODELS,
+    ReferenceChoiceField,
+    ReferenceMultipleChoiceField,
+)
+
+
+class ReferenceChoicesMixin:
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.related_model in REFERENCE_MODELS:
+            kwargs.setdefault("form_class", ReferenceChoiceField)
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+    def formfield_for_manytomany(self, db_field, request, **kwargs):
+        if db_field.related_model in REFERENCE_MODELS:
+            kwargs.setdefault("form_class", ReferenceMultipleChoiceField)
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
 
 
 @admin.register(Worker)
-class WorkerAdmin(UserAdmin):
+class WorkerAdmin(ReferenceChoicesMixin, UserAdmin):
     list_display = UserAdmin.list_display + ("position",)
     fieldsets = UserAdmin.fieldsets + (
         (("Additional info", {"fields": ("position",)}),)
@@ -34,7 +53,7 @@ class WorkerAdmin(UserAdmin):
 
 
 @admin.register(Task)
-class TaskAdmin(admin.ModelAdmin):
+class TaskAdmin(ReferenceChoicesMixin, admin.ModelAdmin):
     list_display = [
         "name",
         "get_tags",
@@ -50,6 +69,27 @@ class TaskAdmin(admin.ModelAdmin):
         return ", ".join(f"#{tag.name}" for tag in obj.tags.all())
 
 
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = [
+        "name",
+        "status",
+        "attempts",
+        "run_after",
+        "locked_by",
+        "updated_at",
+    ]
+    list_filter = ["status", "name"]
+    readonly_fields = ["created_at", "updated_at"]
+
+
+@admin.register(DeadlineNotice)
+class DeadlineNoticeAdmin(admin.ModelAdmin):
+    list_display = ["task", "worker", "kind", "deadline", "sent_at"]
+    list_filter = ["kind"]
+    raw_id_fields = ["task", "worker"]
+
+
 admin.site.register(TaskType)
 admin.site.register(Position)
 admin.site.register(Project)
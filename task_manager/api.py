@@ -0,0 +1,291 @@
+from dataclasses import dataclass, field
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404, JsonResponse
+from django.views import generic
+
+from task_manager.models import (
+    Task,
+    Project,
+    Worker,
+    Team,
+    Position,
+    Tag,
+    TaskType
+)
+from task_manager.pagination import InvalidCursor, KeysetPaginator
+from task_manager.views import (
+    TaskListView,
+    ProjectListView,
+    TeamListView,
+    WorkerListView,
+    PositionListView,
+    TagListView,
+    TaskTypeListView
+)
+
+
+API_VERSION = "v1"
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+
+class ApiError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class Relation:
+    resource: str
+    # Foreign keys are resolved from the id in the primary row ...
+    field: str = None
+    # ... other relations by filtering the related model back on it.
+    lookup: str = None
+
+
+@dataclass(frozen=True)
+class Resource:
+    model: type
+    list_view: type
+    # Public field name -> values() key.
+    fields: dict
+    # Fields annotated by the list view, not available on includes.
+    annotations: tuple = ()
+    relations: dict = field(default_factory=dict)
+
+    @property
+    def plain_fields(self):
+        return [name for name in self.fields if name not in self.annotations]
+
+
+RESOURCES = {
+    "tasks": Resource(
+        model=Task,
+        list_view=TaskListView,
+        fields={
+            "id": "id",
+            "name": "name",
+            "description": "description",
+            "priority": "priority",
+            "deadline": "deadline",
+            "is_completed": "is_completed",
+            "task_type": "task_type_id",
+            "project": "project_id",
+            "assignee_count": "assignee_count",
+        },
+        annotations=("assignee_count",),
+        relations={
+            "task_type": Relation("task-types", field="task_type"),
+            "project": Relation("projects", field="project"),
+            "tags": Relation("tags", lookup="tasks"),
+            "assignees": Relation("workers", lookup="tasks"),
+        },
+    ),
+    "projects": Resource(
+        model=Project,
+        list_view=ProjectListView,
+        fields={
+            "id": "id",
+            "name": "name",
+            "description": "description",
+            "team": "team_id",
+            "task_count": "task_count",
+        },
+        relations={"team": Relation("teams", field="team")},
+    ),
+    "teams": Resource(
+        model=Team,
+        list_view=TeamListView,
+        fields={"id": "id", "name": "name", "member_count": "member_count"},
+        relations={
+            "members": Relation("workers", lookup="teams"),
+            "projects": Relation("projects", lookup="team"),
+        },
+    ),
+    "workers": Resource(
+        model=Worker,
+        list_view=WorkerListView,
+        fields={
+            "id": "id",
+            "username": "username",
+            "first_name": "first_name",
+            "last_name": "last_name",
+            "email": "email",
+            "position": "position_id",
+        },
+        relations={
+            "position": Relation("positions", field="position"),
+            "teams": Relation("teams", lookup="members"),
+        },
+    ),
+    "positions": Resource(
+        model=Position,
+        list_view=PositionListView,
+        fields={"id": "id", "name": "name", "worker_count": "worker_count"},
+    ),
+    "tags": Resource(
+        model=Tag,
+        list_view=TagListView,
+        fields={"id": "id", "name": "name"},
+    ),
+    "task-types": Resource(
+        model=TaskType,
+        list_view=TaskTypeListView,
+        fields={"id": "id", "name": "name"},
+    ),
+}
+
+
+def _split(value):
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def get_resource(name):
+    try:
+        return RESOURCES[name]
+    except KeyError:
+        raise Http404(f"Unknown resource '{name}'.")
+
+
+def selected_fields(params, name, allowed):
+    key = "fields" if name is None else f"fields[{name}]"
+    if not params.get(key):
+        return list(allowed)
+
+    fields = _split(params[key])
+    unknown = [field for field in fields if field not in allowed]
+    if unknown:
+        raise ApiError(f"Unknown field(s) in {key}: {', '.join(unknown)}.")
+    if "id" not in fields:
+        fields.insert(0, "id")
+    return fields
+
+
+def selected_relations(params, resource):
+    relations = _split(params.get("include", ""))
+    unknown = [name for name in relations if name not in resource.relations]
+    if unknown:
+        raise ApiError(f"Unknown include(s): {', '.join(unknown)}.")
+    return {name: resource.relations[name] for name in relations}
+
+
+def serialize(row, resource, fields):
+    return {name: row[resource.fields[name]] for name in fields}
+
+
+def include_relations(params, rows, relations):
+    for name, relation in relations.items():
+        target = RESOURCES[relation.resource]
+        fields = selected_fields(
+            params, relation.resource, target.plain_fields
+        )
+        keys = [target.fields[field] for field in fields]
+
+        if relation.field is not None:
+            ids = {row[relation.field] for row in rows} - {None}
+            related = {
+                item["id"]: serialize(item, target, fields)
+                for item in (
+                    target.model.objects
+                    .filter(pk__in=ids)
+                    .values(*keys)
+                )
+            }
+            for row in rows:
+                row[name] = related.get(row[relation.field])
+            continue
+
+        grouped = {row["id"]: [] for row in rows}
+        for item in (
+            target.model.objects
+            .filter(**{f"{relation.lookup}__in": list(grouped)})
+            .values(relation.lookup, *keys)
+        ):
+            grouped[item[relation.lookup]].append(
+                serialize(item, target, fields)
+            )
+        for row in rows:
+            row[name] = grouped[row["id"]]
+
+
+class ApiView(LoginRequiredMixin, generic.View):
+    # Subclasses implement get_data(resource).
+    def handle_no_permission(self):
+        return JsonResponse({"error": "Login required."}, status=403)
+
+    def get(self, request, *args, **kwargs):
+        resource = kwargs["resource"]
+        try:
+            return JsonResponse(self.get_data(get_resource(resource)))
+        except (ApiError, InvalidCursor) as error:
+            return JsonResponse({"error": str(error)}, status=400)
+        except Http404 as error:
+            return JsonResponse({"error": str(error)}, status=404)
+
+    def get_queryset(self, resource):
+        view = resource.list_view()
+        view.setup(self.request)
+        # Relations are included explicitly in one query each.
+        return view.get_queryset().all().prefetch_related(None)
+
+    def get_fields(self, resource, relations):
+        fields = selected_fields(self.request.GET, None, resource.fields)
+        for relation in relations.values():
+            if relation.field is not None and relation.field not in fields:
+                fields.append(relation.field)
+        return fields
+
+
+class ApiListView(ApiView):
+    def get_data(self, resource):
+        params = self.request.GET
+        relations = selected_relations(params, resource)
+        fields = self.get_fields(resource, relations)
+
+        limit = params.get("limit", str(DEFAULT_LIMIT))
+        # isdecimal(), unlike isdigit(), rejects digits int() can not parse
+        # such as superscripts.
+        if not limit.isdecimal() or not 0 < int(limit) <= MAX_LIMIT:
+            raise ApiError(f"limit must be between 1 and {MAX_LIMIT}.")
+
+        queryset = self.get_queryset(resource)
+        values = [resource.fields[field] for field in fields]
+        if "search_rank" in queryset.query.extra_select:
+            values.append("search_rank")
+        paginator = KeysetPaginator(queryset, limit, values=values)
+        page = paginator.page(params.get("cursor"))
+
+        results = [serialize(row, resource, fields) for row in page]
+        include_relations(params, results, relations)
+        return {
+            "results": results,
+            "next": self.page_url(page.next_cursor),
+            "previous": self.page_url(page.previous_cursor),
+        }
+
+    def page_url(self, cursor):
+        if cursor is None:
+            return None
+        params = self.request.GET.copy()
+        params["cursor"] = cursor
+        return f"{self.request.path}?{params.urlencode()}"
+
+
+class ApiDetailView(ApiView):
+    def get_data(self, resource):
+        params = self.request.GET
+        relations = selected_relations(params, resource)
+        fields = self.get_fields(resource, relations)
+
+        row = (
+            self.get_queryset(resource)
+            .filter(pk=self.kwargs["pk"])
+            .values(*[resource.fields[field] for field in fields])
+            .first()
+        )
+        if row is None:
+            raise Http404("No object found matching the query.")
+
+        result = serialize(row, resource, fields)
+        include_relations(params, [result], relations)
+        return result
@@ -0,0 +1,51 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from task_manager.caching import cache_is_shared
+
+
+def _user_cache_key(user_id):
+    return f"task_manager:user:{user_id}"
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    Serves the logged-in worker, with its position, from a shared cache
+    instead of querying it on every request. Saves and deletes drop the
+    cached entry after they commit, so django.contrib.auth checks the
+    session auth hash against the new password and other sessions are
+    logged out. Without a shared cache it queries like ModelBackend.
+    """
+
+    def get_user(self, user_id):
+        shared = cache_is_shared()
+        key = _user_cache_key(user_id)
+        user = cache.get(key) if shared else None
+        if user is None:
+            user = (
+                get_user_model()._default_manager
+                .using(DEFAULT_DB_ALIAS)
+                .select_related("position")
+                .filter(pk=user_id)
+                .first()
+            )
+            if user is None:
+                return None
+            if shared:
+                cache.set(key, user, settings.USER_CACHE_TIMEOUT)
+        return user if self.user_can_authenticate(user) else None
+
+    async def aget_user(self, user_id):
+        # ModelBackend.aget_user queries directly and would skip the cache.
+        return await sync_to_async(self.get_user)(user_id)
+
+
+def forget_cached_users(user_ids):
+    keys = [_user_cache_key(user_id) for user_id in user_ids]
+    # Deleting before the commit would let a concurrent request cache the
+    # old worker again.
+    transaction.on_commit(lambda: cache.delete_many(keys))
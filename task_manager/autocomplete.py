@@ -0,0 +1,103 @@
+from django import forms
+from django.contrib.auth import get_user_model
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404, JsonResponse
+from django.views import generic
+
+from task_manager.models import Tag, Team
+from task_manager.pagination import InvalidCursor, KeysetPaginator
+
+
+AUTOCOMPLETE_PAGE_SIZE = 20
+
+
+class AutocompleteSelectMultiple(forms.SelectMultiple):
+    """
+    Renders only the selected options and lets autocomplete.js fetch the
+    rest from `url`, so the page no longer grows with the table size.
+    """
+
+    class Media:
+        js = ("js/autocomplete.js",)
+
+    def __init__(self, url, attrs=None):
+        super().__init__(attrs)
+        self.url = url
+
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+        context["widget"]["attrs"]["data-autocomplete-url"] = str(self.url)
+        return context
+
+    def optgroups(self, name, value, attrs=None):
+        choices = self.choices
+        selected_ids = [item for item in value if str(item).isdigit()]
+        self.choices = [
+            choices.choice(obj)
+            for obj in choices.queryset.filter(pk__in=selected_ids)
+        ]
+        try:
+            return super().optgroups(name, value, attrs)
+        finally:
+            self.choices = choices
+
+
+class AutocompleteView(LoginRequiredMixin, generic.View):
+    # Prefix matches use the UPPER(column) pattern indexes on PostgreSQL.
+    queryset = None
+    search_field = None
+    label_fields = ()
+
+    def get_label(self, row):
+        return row[self.search_field]
+
+    def get(self, request, *args, **kwargs):
+        query = request.GET.get("q", "").strip()
+        queryset = self.queryset.all()
+        if query:
+            queryset = queryset.filter(
+                **{f"{self.search_field}__istartswith": query}
+            )
+        paginator = KeysetPaginator(
+            queryset.order_by(self.search_field),
+            AUTOCOMPLETE_PAGE_SIZE,
+            values=("pk", self.search_field, *self.label_fields),
+        )
+        try:
+            page = paginator.page(request.GET.get("cursor"))
+        except InvalidCursor:
+            raise Http404("Invalid page cursor.")
+
+        return JsonResponse({
+            "results": [
+                {"id": row["pk"], "text": self.get_label(row)}
+                for row in page
+            ],
+            "next": page.next_cursor,
+        })
+
+
+class WorkerAutocompleteView(AutocompleteView):
+    queryset = get_user_model().objects.all()
+    search_field = "username"
+    label_fields = ("first_name", "last_name")
+
+    def get_label(self, row):
+        full_name = f"{row['first_name']} {row['last_name']}".strip()
+        if full_name:
+            return f"{row['username']} ({full_name})"
+        return row["username"]
+
+
+class TagAutocompleteView(AutocompleteView):
+    queryset = Tag.objects.all()
+    search_field = "name"
+
+    def get_label(self, row):
+        return f"#{row['name']}"
+
+
+class TeamAutocompleteView(AutocompleteView):
+    queryset = Team.objects.all()
+    search_field = "name"
+
@@ -0,0 +1,5 @@
+def percentile(values, percent):
+    """Nearest-rank percentile of a non-empty sequence of timings."""
+    ordered = sorted(values)
+    index = round(percent / 100 * (len(ordered) - 1))
+    return ordered[index]
@@ -0,0 +1,61 @@
+from django.db.models import Count
+
+from task_manager.models import Task
+
+
+BOARD_PAGE_SIZE = 20
+DONE_COLUMN = "DONE"
+
+# Open tasks are split by priority; completed tasks share one column.
+BOARD_COLUMNS = (
+    *Task.PriorityChoices.choices,
+    (DONE_COLUMN, "Completed"),
+)
+
+
+def is_board_column(column):
+    return column in dict(BOARD_COLUMNS)
+
+
+def column_tasks(project, column):
+    queryset = (
+        Task.objects
+        .filter(project=project)
+        .select_related("task_type")
+        .only(
+            "name",
+            "deadline",
+            "priority",
+            "is_completed",
+            "project_id",
+            "task_type__name",
+        )
+        .order_by("name")
+    )
+    if column == DONE_COLUMN:
+        return queryset.filter(is_completed=True)
+    return queryset.filter(is_completed=False, priority=column)
+
+
+def column_counts(project):
+    counts = dict.fromkeys(dict(BOARD_COLUMNS), 0)
+    rows = (
+        Task.objects
+        .filter(project=project)
+        .order_by()
+        .values_list("is_completed", "priority")
+        .annotate(count=Count("pk"))
+    )
+    for is_completed, priority, count in rows:
+        column = DONE_COLUMN if is_completed else priority
+        counts[column] = counts.get(column, 0) + count
+    return counts
+
+
+def move_task(task, column):
+    task.is_completed = column == DONE_COLUMN
+    fields = ["is_completed", "updated_at"]
+    if not task.is_completed:
+        task.priority = column
+        fields.append("priority")
+    task.save(update_fields=fields)
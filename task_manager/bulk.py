@@ -0,0 +1,162 @@
+from dataclasses import dataclass
+
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from task_manager.membership import get_user_team_ids
+from task_manager.models import MAX_TAGS_PER_TASK, Tag, Task, Team, Worker
+from task_manager.search import refresh_search_documents
+from task_manager.stats import invalidate_dashboard_stats
+from task_manager.versions import bump_versions
+
+
+BULK_MAX_TASKS = 10000
+BULK_ACTIONS = (
+    ("complete", "Mark as completed"),
+    ("reopen", "Mark as in progress"),
+    ("priority", "Set priority"),
+    ("add_tags", "Add tags"),
+    ("add_assignees", "Add assignees"),
+    ("remove_assignees", "Remove assignees"),
+)
+
+
+class BulkActionError(Exception):
+    pass
+
+
+@dataclass
+class BulkResult:
+    action: str
+    tasks: int
+
+
+def editable_task_teams(user, task_ids):
+    return dict(
+        Task.objects
+        .filter(
+            pk__in=task_ids,
+            project__team_id__in=get_user_team_ids(user),
+        )
+        .values_list("pk", "project__team_id")
+    )
+
+
+def _set_fields(task_ids, **fields):
+    Task.objects.filter(pk__in=task_ids).update(
+        updated_at=timezone.now(), **fields
+    )
+
+
+def _add_tags(task_ids, tag_ids):
+    Tagging = Task.tags.through
+    # A task ends up with its current tags plus the selected tags it does
+    # not have yet.
+    overfull = len(tag_ids) > MAX_TAGS_PER_TASK or (
+        Tagging.objects
+        .filter(task_id__in=task_ids)
+        .values("task_id")
+        .annotate(
+            count=Count("pk"),
+            present=Count("pk", filter=Q(tag_id__in=tag_ids)),
+        )
+        .filter(
+            count__gt=MAX_TAGS_PER_TASK - len(tag_ids) + F("present")
+        )
+        .exists()
+    )
+    if overfull:
+        raise BulkActionError(
+            f"A task can not have more than {MAX_TAGS_PER_TASK} tags."
+        )
+
+    Tagging.objects.bulk_create(
+        [
+            Tagging(task_id=task_id, tag_id=tag_id)
+            for task_id in task_ids
+            for tag_id in tag_ids
+        ],
+        ignore_conflicts=True,
+    )
+    _set_fields(task_ids)
+    refresh_search_documents(task_ids)
+    bump_versions(Tag)
+
+
+def _add_assignees(task_ids, worker_ids, team_ids):
+    Membership = Team.members.through
+    memberships = (
+        Membership.objects
+        .filter(team_id__in=team_ids, worker_id__in=worker_ids)
+        .count()
+    )
+    if memberships != len(team_ids) * len(worker_ids):
+        raise BulkActionError(
+            "Only members of every selected task's team can be assigned."
+        )
+
+    Assignment = Task.assignees.through
+    Assignment.objects.bulk_create(
+        [
+            Assignment(task_id=task_id, worker_id=worker_id)
+            for task_id in task_ids
+            for worker_id in worker_ids
+        ],
+        ignore_conflicts=True,
+    )
+    _set_fields(task_ids)
+    bump_versions(Worker)
+
+
+def _remove_assignees(task_ids, worker_ids):
+    Task.assignees.through.objects.filter(
+        task_id__in=task_ids,
+        worker_id__in=worker_ids,
+    ).delete()
+    _set_fields(task_ids)
+    bump_versions(Worker)
+
+
+def apply_bulk_action(
+    user, task_ids, action, priority=None, tag_ids=(), worker_ids=()
+):
+    task_ids = sorted(set(task_ids))
+    if not task_ids:
+        raise BulkActionError("Select at least one task.")
+    if len(task_ids) > BULK_MAX_TASKS:
+        raise BulkActionError(
+            f"Select at most {BULK_MAX_TASKS} tasks at a time."
+        )
+
+    with transaction.atomic():
+        task_teams = editable_task_teams(user, task_ids)
+        if len(task_teams) != len(task_ids):
+            raise PermissionDenied(
+                "You can only change tasks of your own teams."
+            )
+
+        if action == "complete":
+            _set_fields(task_ids, is_completed=True)
+        elif action == "reopen":
+            _set_fields(task_ids, is_completed=False)
+        elif action == "priority":
+            _set_fields(task_ids, priority=priority)
+        elif action == "add_tags":
+            _add_tags(task_ids, sorted(set(tag_ids)))
+        elif action == "add_assignees":
+            _add_assignees(
+                task_ids,
+                sorted(set(worker_ids)),
+                set(task_teams.values()),
+            )
+        elif action == "remove_assignees":
+            _remove_assignees(task_ids, sorted(set(worker_ids)))
+        else:
+            raise BulkActionError(f"Unknown action: {action}.")
+
+        bump_versions(Task)
+
+    invalidate_dashboard_stats()
+    return BulkResult(action, len(task_ids))
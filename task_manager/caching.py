@@ -0,0 +1,15 @@
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+
+def cache_is_shared():
+    """
+    Whether the default cache is seen by every process (web workers and
+    run_worker). Data used for authorization is only cached across
+    requests when it is, because a process-local cache cannot be
+    invalidated from the process that made the change.
+    """
+    return not isinstance(
+        caches[DEFAULT_CACHE_ALIAS], (DummyCache, LocMemCache)
+    )
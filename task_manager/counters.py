@@ -0,0 +1,57 @@
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from task_manager.models import Task, Team, Worker, Position, Project
+
+
+# Counter column of each model -> (counter field, counted model, lookup
+# from the counted model back to the counter's row).
+COUNTERS = {
+    Team: ("member_count", Team.members.through, "team"),
+    Project: ("task_count", Task, "project"),
+    Position: ("worker_count", Worker, "position"),
+}
+
+
+def _actual_count(model):
+    _, counted_model, lookup = COUNTERS[model]
+    return Coalesce(
+        Subquery(
+            counted_model._base_manager
+            .filter(**{lookup: OuterRef("pk")})
+            .order_by()
+            .values(lookup)
+            .annotate(count=Count("pk"))
+            .values("count")
+        ),
+        Value(0)
+    )
+
+
+def recount(model, ids=None):
+    field = COUNTERS[model][0]
+    queryset = model.objects.all()
+    if ids is not None:
+        ids = [pk for pk in ids if pk is not None]
+        if not ids:
+            return 0
+        queryset = queryset.filter(pk__in=ids)
+
+    drifted = (
+        queryset
+        .annotate(actual_count=_actual_count(model))
+        .exclude(**{field: F("actual_count")})
+        .values("pk")
+    )
+    return model.objects.filter(pk__in=drifted).update(
+        **{field: _actual_count(model)}
+    )
+
+
+def adjust_count(model, pk, delta):
+    if pk is None or not delta:
+        return
+    field = COUNTERS[model][0]
+    model.objects.filter(pk=pk).update(
+        **{field: Greatest(F(field) + delta, Value(0))}
+    )
@@ -0,0 +1,174 @@
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.mail import EmailMessage, get_connection
+from django.db.models import F, Q
+from django.utils import dateformat, timezone
+
+from task_manager.models import DeadlineNotice, Task
+
+
+DEADLINE_SCAN_CHUNK_SIZE = 2000
+REMINDER_WORKER_CHUNK_SIZE = 200
+
+
+def _due_task_chunks(now, window, lookback, chunk_size):
+    # Range over the partial task_open_deadline_idx index, walked with a
+    # (deadline, pk) keyset so memory stays bounded by chunk_size.
+    tasks = (
+        Task.objects
+        .filter(
+            is_completed=False,
+            deadline__gte=now - lookback,
+            deadline__lt=now + window,
+        )
+        .order_by("deadline", "pk")
+    )
+    after = None
+    while True:
+        chunk = tasks
+        if after is not None:
+            pk, deadline = after
+            chunk = chunk.filter(
+                Q(deadline__gt=deadline) | Q(deadline=deadline, pk__gt=pk)
+            )
+        rows = list(chunk.values_list("pk", "deadline")[:chunk_size])
+        if not rows:
+            return
+        yield rows
+        after = rows[-1]
+
+
+def scan_deadlines(
+    now=None,
+    window=None,
+    lookback=None,
+    chunk_size=DEADLINE_SCAN_CHUNK_SIZE
+):
+    if now is None:
+        now = timezone.now()
+    if window is None:
+        window = timedelta(hours=settings.DEADLINE_REMINDER_HOURS)
+    if lookback is None:
+        lookback = timedelta(days=settings.DEADLINE_LOOKBACK_DAYS)
+    Assignment = Task.assignees.through
+    scanned = 0
+
+    for rows in _due_task_chunks(now, window, lookback, chunk_size):
+        deadlines = dict(rows)
+        assignments = Assignment.objects.filter(
+            task_id__in=deadlines
+        ).values_list("task_id", "worker_id")
+        DeadlineNotice.objects.bulk_create(
+            [
+                DeadlineNotice(
+                    task_id=task_id,
+                    worker_id=worker_id,
+                    kind=(
+                        DeadlineNotice.KindChoices.OVERDUE
+                        if deadlines[task_id] < now
+                        else DeadlineNotice.KindChoices.DUE_SOON
+                    ),
+                    deadline=deadlines[task_id],
+                )
+                for task_id, worker_id in assignments
+            ],
+            ignore_conflicts=True,
+        )
+        scanned += len(rows)
+
+    return scanned
+
+
+def _format_deadline(notice):
+    return dateformat.format(
+        timezone.localtime(notice.deadline), "d M Y H:i"
+    )
+
+
+def _reminder_message(worker, notices):
+    overdue = sum(
+        notice.kind == DeadlineNotice.KindChoices.OVERDUE
+        for notice in notices
+    )
+    due_soon = len(notices) - overdue
+    summary = ", ".join(
+        part for part in (
+            f"{overdue} overdue" if overdue else "",
+            f"{due_soon} due soon" if due_soon else "",
+        )
+        if part
+    )
+    lines = [
+        f"- {notice.get_kind_display()}: {notice.task.name} "
+        f"({notice.task.project.name}), due {_format_deadline(notice)}"
+        for notice in notices
+    ]
+    return EmailMessage(
+        subject=f"Task deadlines: {summary}",
+        body=(
+            f"Hi {worker.get_full_name() or worker.username},\n\n"
+            "These tasks assigned to you need attention:\n\n"
+            + "\n".join(lines)
+            + "\n"
+        ),
+        to=[worker.email],
+    )
+
+
+def send_deadline_reminders(chunk_size=REMINDER_WORKER_CHUNK_SIZE):
+    pending = DeadlineNotice.objects.filter(sent_at__isnull=True)
+    pending.filter(
+        Q(task__is_completed=True) | ~Q(task__deadline=F("deadline"))
+    ).delete()
+
+    messages_sent = notices_sent = 0
+    last_worker_id = None
+    with get_connection() as connection:
+        while True:
+            workers_pending = pending.order_by("worker_id")
+            if last_worker_id is not None:
+                workers_pending = workers_pending.filter(
+                    worker_id__gt=last_worker_id
+                )
+            worker_ids = list(
+                workers_pending
+                .values_list("worker_id", flat=True)
+                .distinct()[:chunk_size]
+            )
+            if not worker_ids:
+                break
+            last_worker_id = worker_ids[-1]
+
+            notices_by_worker = defaultdict(list)
+            for notice in (
+                pending
+                .filter(worker_id__in=worker_ids)
+                .select_related("task__project")
+                .order_by("deadline", "pk")
+            ):
+                notices_by_worker[notice.worker_id].append(notice)
+
+            messages = [
+                _reminder_message(worker, notices_by_worker[worker.pk])
+                for worker in get_user_model().objects.filter(
+                    pk__in=notices_by_worker
+                )
+                if worker.email
+            ]
+            connection.send_messages(messages)
+
+            notice_ids = [
+                notice.pk
+                for notices in notices_by_worker.values()
+                for notice in notices
+            ]
+            DeadlineNotice.objects.filter(pk__in=notice_ids).update(
+                sent_at=timezone.now()
+            )
+            messages_sent += len(messages)
+            notices_sent += len(notice_ids)
+
+    return messages_sent, notices_sent
@@ -0,0 +1,173 @@
+import csv
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Prefetch
+
+from task_manager.membership import get_user_team_ids
+from task_manager.models import Task, Project, Team, Tag
+from task_manager.search import search_tasks
+
+
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_FORMATS = ("csv", "jsonl")
+
+TASK_FIELDS = (
+    "id",
+    "name",
+    "description",
+    "priority",
+    "deadline",
+    "is_completed",
+    "task_type",
+    "project",
+    "team",
+    "tags",
+    "assignees",
+)
+PROJECT_FIELDS = ("id", "name", "description", "team", "task_count")
+WORKER_FIELDS = (
+    "id",
+    "username",
+    "first_name",
+    "last_name",
+    "email",
+    "position",
+    "teams",
+)
+
+
+def _sees_all_teams(user):
+    return user is None or user.is_superuser or user.is_staff
+
+
+def visible_tasks(user=None, query=""):
+    queryset = (
+        Task.objects
+        .select_related("task_type", "project__team")
+        .prefetch_related(
+            Prefetch("tags", queryset=Tag.objects.only("name")),
+            Prefetch(
+                "assignees",
+                queryset=get_user_model().objects.only("username")
+            ),
+        )
+    )
+    if not _sees_all_teams(user):
+        queryset = queryset.filter(
+            project__team_id__in=get_user_team_ids(user)
+        )
+    if query:
+        return search_tasks(queryset, query)
+    return queryset.order_by("pk")
+
+
+def visible_projects(user=None, query=""):
+    queryset = (
+        Project.objects
+        .select_related("team")
+        .order_by("pk")
+    )
+    if not _sees_all_teams(user):
+        queryset = queryset.filter(team_id__in=get_user_team_ids(user))
+    if query:
+        queryset = queryset.filter(name__icontains=query)
+    return queryset
+
+
+def visible_workers(user=None, query=""):
+    queryset = (
+        get_user_model().objects
+        .select_related("position")
+        .prefetch_related(
+            Prefetch("teams", queryset=Team.objects.only("name"))
+        )
+        .order_by("pk")
+    )
+    if query:
+        queryset = queryset.filter(username__icontains=query)
+    return queryset
+
+
+def task_rows(queryset):
+    for task in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield {
+            "id": task.pk,
+            "name": task.name,
+            "description": task.description,
+            "priority": task.get_priority_display(),
+            "deadline": task.deadline,
+            "is_completed": task.is_completed,
+            "task_type": task.task_type.name if task.task_type else None,
+            "project": task.project.name,
+            "team": task.project.team.name,
+            "tags": [tag.name for tag in task.tags.all()],
+            "assignees": [
+                worker.username for worker in task.assignees.all()
+            ],
+        }
+
+
+def project_rows(queryset):
+    for project in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield {
+            "id": project.pk,
+            "name": project.name,
+            "description": project.description,
+            "team": project.team.name,
+            "task_count": project.task_count,
+        }
+
+
+def worker_rows(queryset):
+    for worker in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield {
+            "id": worker.pk,
+            "username": worker.username,
+            "first_name": worker.first_name,
+            "last_name": worker.last_name,
+            "email": worker.email,
+            "position": worker.position.name if worker.position else None,
+            "teams": [team.name for team in worker.teams.all()],
+        }
+
+
+EXPORTS = {
+    "tasks": (visible_tasks, task_rows, TASK_FIELDS),
+    "projects": (visible_projects, project_rows, PROJECT_FIELDS),
+    "workers": (visible_workers, worker_rows, WORKER_FIELDS),
+}
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+def _csv_value(value):
+    if isinstance(value, list):
+        return ", ".join(value)
+    if value is None:
+        return ""
+    return value
+
+
+def csv_lines(rows, fields):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(fields)
+    for row in rows:
+        yield writer.writerow([_csv_value(row[field]) for field in fields])
+
+
+def jsonl_lines(rows):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+
+
+def export_lines(kind, export_format, user=None, query=""):
+    get_queryset, get_rows, fields = EXPORTS[kind]
+    rows = get_rows(get_queryset(user, query))
+    if export_format == "jsonl":
+        return jsonl_lines(rows)
+    return csv_lines(rows, fields)
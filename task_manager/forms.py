@@ -2,9 +2,21 @@ from django import forms
 from django.contrib.auth import get_user_model
 from django.contrib.auth.forms import UserCreationForm
 from django.core.exceptions import ValidationError
+from django.urls import reverse_lazy
 from django.utils import timezone
 
-from task_manager.models import Team, Task, Tag, Project, TaskType, Position
+from task_manager.autocomplete import AutocompleteSelectMultiple
+from task_manager.bulk import BULK_ACTIONS
+from task_manager.models import (
+    MAX_TAGS_PER_TASK,
+    Team,
+    Task,
+    Tag,
+    Project,
+    TaskType,
+    Position,
+)
+from task_manager.reference import ReferenceChoiceField
 
 
 class WorkerUsernameSearchForm(forms.Form):
@@ -25,12 +37,17 @@ class WorkerCreationForm(UserCreationForm):
             "email",
             "position",
         )
+        field_classes = {
+            **UserCreationForm.Meta.field_classes,
+            "position": ReferenceChoiceField,
+        }
 
 
 class WorkerPositionUpdateForm(forms.ModelForm):
     class Meta:
         model = get_user_model()
         fields = ["position"]
+        field_classes = {"position": ReferenceChoiceField}
 
 
 class TaskNameSearchForm(forms.Form):
@@ -88,7 +105,9 @@ class TaskForm(forms.ModelForm):
     )
     tags = forms.ModelMultipleChoiceField(
         queryset=Tag.objects.all(),
-        widget=forms.CheckboxSelectMultiple,
+        widget=AutocompleteSelectMultiple(
+            reverse_lazy("task-manager:tag-autocomplete")
+        ),
         required=False
     )
     deadline = forms.DateTimeField(
@@ -112,6 +131,7 @@ class TaskForm(forms.ModelForm):
             "tags",
             "is_completed",
         )
+        field_classes = {"task_type": ReferenceChoiceField}
 
     def __init__(self, *args, **kwargs):
         self.project = kwargs.pop("project", None)
@@ -143,9 +163,9 @@ class TaskForm(forms.ModelForm):
 
     def clean_tags(self):
         tags = self.cleaned_data["tags"]
-        if tags.count() > 10:
+        if tags.count() > MAX_TAGS_PER_TASK:
             raise ValidationError(
-                "You can not select more than 10 tags"
+                f"You can not select more than {MAX_TAGS_PER_TASK} tags"
             )
         return tags
 
@@ -171,7 +191,9 @@ class TeamNameSearchForm(forms.Form):
 class TeamCreateForm(forms.ModelForm):
     members = forms.ModelMultipleChoiceField(
         queryset=get_user_model().objects.all(),
-        widget=forms.CheckboxSelectMultiple,
+        widget=AutocompleteSelectMultiple(
+            reverse_lazy("task-manager:worker-autocomplete")
+        ),
         required=False
     )
 
@@ -193,7 +215,9 @@ class TeamCreateForm(forms.ModelForm):
 class TeamUpdateForm(forms.ModelForm):
     members = forms.ModelMultipleChoiceField(
         queryset=get_user_model().objects.all().order_by("username"),
-        widget=forms.CheckboxSelectMultiple,
+        widget=AutocompleteSelectMultiple(
+            reverse_lazy("task-manager:worker-autocomplete")
+        ),
         required=False
     )
 
@@ -310,3 +334,60 @@ class PositionForm(forms.ModelForm):
             )
 
         return name
+
+
+class TaskImportForm(forms.Form):
+    file = forms.FileField(
+        help_text="CSV with a header row, or JSON lines (.jsonl). "
+                  "Columns: name, description, priority, deadline, "
+                  "is_completed, task_type, tags, assignees."
+    )
+
+
+class IdListField(forms.Field):
+    widget = forms.MultipleHiddenInput
+
+    def to_python(self, value):
+        if not value:
+            return []
+        if not isinstance(value, (list, tuple)):
+            value = [value]
+        try:
+            return sorted({int(item) for item in value})
+        except (TypeError, ValueError):
+            raise ValidationError("Enter a list of ids.")
+
+
+class TaskBulkForm(forms.Form):
+    tasks = IdListField()
+    action = forms.ChoiceField(choices=BULK_ACTIONS)
+    priority = forms.ChoiceField(
+        choices=Task.PriorityChoices.choices,
+        required=False
+    )
+    tags = forms.ModelMultipleChoiceField(
+        queryset=Tag.objects.all(),
+        widget=AutocompleteSelectMultiple(
+            reverse_lazy("task-manager:tag-autocomplete")
+        ),
+        required=False
+    )
+    assignees = forms.ModelMultipleChoiceField(
+        queryset=get_user_model().objects.all(),
+        widget=forms.MultipleHiddenInput,
+        required=False
+    )
+
+    required_fields = {
+        "priority": "priority",
+        "add_tags": "tags",
+        "add_assignees": "assignees",
+        "remove_assignees": "assignees",
+    }
+
+    def clean(self):
+        cleaned_data = super().clean()
+        field = self.required_fields.get(cleaned_data.get("action"))
+        if field and not cleaned_data.get(field):
+            self.add_error(field, "This action needs a value.")
+        return cleaned_data
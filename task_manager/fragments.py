@@ -0,0 +1,32 @@
+import hashlib
+
+from django.db.models import Model
+from django.utils import timezone
+
+from task_manager.versions import bump_versions
+
+
+def _object_version(obj):
+    updated_at = obj.updated_at.timestamp() if obj.updated_at else ""
+    return f"{obj._meta.label_lower}:{obj.pk}:{updated_at}"
+
+
+def fragment_version(*objects):
+    parts = []
+    for obj in objects:
+        if obj is None:
+            parts.append("-")
+        elif isinstance(obj, Model):
+            parts.append(_object_version(obj))
+        else:
+            parts.append(",".join(_object_version(item) for item in obj))
+    return hashlib.md5(
+        "|".join(parts).encode(), usedforsecurity=False
+    ).hexdigest()
+
+
+def touch(model, ids):
+    ids = [pk for pk in ids if pk is not None]
+    if ids:
+        model.objects.filter(pk__in=ids).update(updated_at=timezone.now())
+        bump_versions(model)
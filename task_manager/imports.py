@@ -0,0 +1,213 @@
+import csv
+import json
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from task_manager.counters import adjust_count
+from task_manager.models import (
+    MAX_TAGS_PER_TASK,
+    Task,
+    Project,
+    Tag,
+    TaskType,
+)
+from task_manager.search import refresh_search_documents
+from task_manager.stats import invalidate_dashboard_stats
+from task_manager.versions import bump_versions
+
+
+IMPORT_BATCH_SIZE = 1000
+IMPORT_FORMATS = ("csv", "jsonl")
+
+TRUE_VALUES = {"1", "true", "yes", "y"}
+FALSE_VALUES = {"", "0", "false", "no", "n"}
+
+NAME_MAX_LENGTH = Task._meta.get_field("name").max_length
+
+
+class InvalidRow(Exception):
+    pass
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    errors: list = field(default_factory=list)
+
+
+def guess_format(filename):
+    if filename.lower().endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    return "csv"
+
+
+def read_rows(lines, import_format):
+    if import_format == "jsonl":
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                yield line_number, None
+                continue
+            yield line_number, row if isinstance(row, dict) else None
+        return
+
+    # Line 1 is the header, so data rows start at line 2.
+    for line_number, row in enumerate(csv.DictReader(lines), start=2):
+        yield line_number, row
+
+
+class TaskImporter:
+    def __init__(self, project, batch_size=IMPORT_BATCH_SIZE):
+        self.project = project
+        self.batch_size = batch_size
+        self.tag_ids = dict(Tag.objects.values_list("name", "id"))
+        self.task_type_ids = dict(TaskType.objects.values_list("name", "id"))
+        self.member_ids = dict(
+            project.team.members.values_list("username", "id")
+        )
+        self.priorities = {}
+        for value, label in Task.PriorityChoices.choices:
+            self.priorities[value.lower()] = value
+            self.priorities[label.lower()] = value
+
+    def run(self, rows):
+        result = ImportResult()
+        batch = []
+        for line_number, row in rows:
+            try:
+                batch.append(self.build(row))
+            except InvalidRow as error:
+                result.errors.append((line_number, str(error)))
+                continue
+
+            if len(batch) >= self.batch_size:
+                result.created += self.save(batch)
+                batch = []
+        if batch:
+            result.created += self.save(batch)
+
+        if result.created:
+            invalidate_dashboard_stats()
+        return result
+
+    def build(self, row):
+        if row is None:
+            raise InvalidRow("Row is not a JSON object.")
+
+        name = str(row.get("name") or "").strip()
+        if not name:
+            raise InvalidRow("Name is required.")
+        if len(name) > NAME_MAX_LENGTH:
+            raise InvalidRow(
+                f"Name is longer than {NAME_MAX_LENGTH} characters."
+            )
+
+        tag_ids = self.lookup(row.get("tags"), self.tag_ids, "tag")
+        if len(tag_ids) > MAX_TAGS_PER_TASK:
+            raise InvalidRow(
+                f"You can not select more than {MAX_TAGS_PER_TASK} tags."
+            )
+        assignee_ids = self.lookup(
+            row.get("assignees"), self.member_ids, "team member"
+        )
+
+        task_type_id = None
+        task_type = str(row.get("task_type") or "").strip()
+        if task_type:
+            if task_type not in self.task_type_ids:
+                raise InvalidRow(f"Unknown task type: {task_type}.")
+            task_type_id = self.task_type_ids[task_type]
+
+        task = Task(
+            name=name,
+            description=str(row.get("description") or ""),
+            priority=self.parse_priority(row.get("priority")),
+            deadline=self.parse_deadline(row.get("deadline")),
+            is_completed=self.parse_bool(row.get("is_completed")),
+            task_type_id=task_type_id,
+            project=self.project,
+        )
+        return task, tag_ids, assignee_ids
+
+    @staticmethod
+    def lookup(value, ids, label):
+        if value is None:
+            return []
+        if isinstance(value, str):
+            value = value.split(",")
+        elif not isinstance(value, list):
+            raise InvalidRow(
+                f"Expected a list or a comma-separated string of {label}s."
+            )
+        names = [str(name).strip() for name in value if str(name).strip()]
+        unknown = [name for name in names if name not in ids]
+        if unknown:
+            raise InvalidRow(f"Unknown {label}: {', '.join(unknown)}.")
+        return list(dict.fromkeys(ids[name] for name in names))
+
+    def parse_priority(self, value):
+        if not value:
+            return Task.PriorityChoices.MEDIUM
+        try:
+            return self.priorities[str(value).strip().lower()]
+        except KeyError:
+            raise InvalidRow(f"Unknown priority: {value}.")
+
+    @staticmethod
+    def parse_deadline(value):
+        if not value:
+            return None
+        try:
+            deadline = parse_datetime(str(value).strip())
+        except ValueError:
+            deadline = None
+        if deadline is None:
+            raise InvalidRow(f"Invalid deadline: {value}.")
+        if timezone.is_naive(deadline):
+            deadline = timezone.make_aware(deadline)
+        return deadline
+
+    @staticmethod
+    def parse_bool(value):
+        if isinstance(value, bool):
+            return value
+        value = str(value or "").strip().lower()
+        if value in TRUE_VALUES:
+            return True
+        if value in FALSE_VALUES:
+            return False
+        raise InvalidRow(f"Invalid is_completed value: {value}.")
+
+    @staticmethod
+    def save(batch):
+        Assignment = Task.assignees.through
+        Tagging = Task.tags.through
+
+        with transaction.atomic():
+            tasks = Task.objects.bulk_create([task for task, _, _ in batch])
+            Tagging.objects.bulk_create([
+                Tagging(task_id=task.pk, tag_id=tag_id)
+                for task, tag_ids, _ in batch
+                for tag_id in tag_ids
+            ])
+            Assignment.objects.bulk_create([
+                Assignment(task_id=task.pk, worker_id=worker_id)
+                for task, _, assignee_ids in batch
+                for worker_id in assignee_ids
+            ])
+            adjust_count(Project, tasks[0].project_id, len(tasks))
+            bump_versions(Task, Project)
+        refresh_search_documents(task.pk for task in tasks)
+        return len(tasks)
+
+
+def import_tasks(project, lines, import_format="csv", **kwargs):
+    return TaskImporter(project, **kwargs).run(
+        read_rows(lines, import_format)
+    )
@@ -0,0 +1,143 @@
+import logging
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from task_manager.membership import drop_stale_assignments
+from task_manager.models import Job, Team
+
+logger = logging.getLogger(__name__)
+
+JOB_HANDLERS = {}
+
+
+def job_handler(name):
+    def register(func):
+        JOB_HANDLERS[name] = func
+        return func
+    return register
+
+
+def enqueue(name, run_after=None, **payload):
+    if name not in JOB_HANDLERS:
+        raise ValueError(f"Unknown job: {name}.")
+    return Job.objects.create(
+        name=name,
+        payload=payload,
+        run_after=run_after or timezone.now(),
+        max_attempts=settings.JOB_MAX_ATTEMPTS,
+    )
+
+
+def _claimable(now):
+    return (
+        Q(status=Job.StatusChoices.QUEUED, run_after__lte=now)
+        | Q(status=Job.StatusChoices.RUNNING, locked_until__lt=now)
+    )
+
+
+def claim_jobs(worker_id, limit):
+    now = timezone.now()
+    Job.objects.filter(
+        status=Job.StatusChoices.RUNNING,
+        locked_until__lt=now,
+        attempts__gte=F("max_attempts"),
+    ).update(
+        status=Job.StatusChoices.FAILED,
+        locked_by="",
+        locked_until=None,
+        last_error="Visibility timeout expired on the last attempt.",
+        updated_at=now,
+    )
+
+    candidates = list(
+        Job.objects
+        .filter(_claimable(now))
+        .values_list("pk", flat=True)[:limit]
+    )
+    locked_until = now + timedelta(seconds=settings.JOB_VISIBILITY_TIMEOUT)
+    claimed = [
+        pk for pk in candidates
+        if Job.objects.filter(_claimable(now), pk=pk).update(
+            status=Job.StatusChoices.RUNNING,
+            attempts=F("attempts") + 1,
+            locked_by=worker_id,
+            locked_until=locked_until,
+            updated_at=now,
+        )
+    ]
+    return list(Job.objects.filter(pk__in=claimed, locked_by=worker_id))
+
+
+def _finish(job, worker_id, **fields):
+    finished = Job.objects.filter(
+        pk=job.pk,
+        status=Job.StatusChoices.RUNNING,
+        locked_by=worker_id,
+    ).update(
+        locked_by="",
+        locked_until=None,
+        updated_at=timezone.now(),
+        **fields,
+    )
+    if not finished:
+        logger.warning("Job %s was reclaimed before it finished", job)
+
+
+def run_job(job, worker_id):
+    try:
+        handler = JOB_HANDLERS[job.name]
+        with transaction.atomic():
+            handler(**job.payload)
+    except Exception:
+        logger.exception("Job %s failed", job)
+        if job.attempts >= job.max_attempts:
+            _finish(
+                job,
+                worker_id,
+                status=Job.StatusChoices.FAILED,
+                last_error=traceback.format_exc(),
+            )
+        else:
+            delay = settings.JOB_RETRY_DELAY * 2 ** (job.attempts - 1)
+            _finish(
+                job,
+                worker_id,
+                status=Job.StatusChoices.QUEUED,
+                run_after=timezone.now() + timedelta(seconds=delay),
+                last_error=traceback.format_exc(),
+            )
+        return False
+
+    _finish(job, worker_id, status=Job.StatusChoices.DONE, last_error="")
+    return True
+
+
+def run_pending_jobs(worker_id="inline", limit=100):
+    return [run_job(job, worker_id) for job in claim_jobs(worker_id, limit)]
+
+
+def purge_finished_jobs(older_than):
+    deleted, _ = Job.objects.filter(
+        status=Job.StatusChoices.DONE,
+        updated_at__lt=timezone.now() - older_than,
+    ).delete()
+    return deleted
+
+
+@job_handler("drop_stale_assignments")
+def drop_stale_assignments_job(team_id, member_ids):
+    team = Team.objects.filter(pk=team_id).first()
+    if team is None:
+        return
+    current_member_ids = set(team.members.values_list("pk", flat=True))
+    drop_stale_assignments(team, set(member_ids) - current_member_ids)
+
+
+@job_handler("delete_empty_teams")
+def delete_empty_teams_job(team_ids):
+    Team.objects.filter(pk__in=team_ids, member_count=0).delete()
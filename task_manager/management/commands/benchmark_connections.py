@@ -0,0 +1,122 @@
+import copy
+import importlib.util
+import json
+import statistics
+from pathlib import Path
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.utils import load_backend
+
+from task_manager.benchmarks import percentile
+
+
+MODES = ("new", "persistent", "pool")
+
+
+def _pool_available(vendor):
+    return (
+        vendor == "postgresql"
+        and importlib.util.find_spec("psycopg_pool") is not None
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the per-request cost of opening a new database connection "
+        "with persistent and pooled connections."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200)
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+        parser.add_argument(
+            "--modes",
+            nargs="+",
+            choices=MODES,
+            default=list(MODES),
+        )
+        parser.add_argument(
+            "--output",
+            default=None,
+            help="Optional JSON file to write the results to.",
+        )
+
+    def settings_for(self, mode, base):
+        settings_dict = copy.deepcopy(base)
+        options = settings_dict.setdefault("OPTIONS", {})
+        pool = options.pop("pool", None)
+        settings_dict["CONN_MAX_AGE"] = 0
+        settings_dict["CONN_HEALTH_CHECKS"] = False
+        if mode == "persistent":
+            settings_dict["CONN_MAX_AGE"] = None
+            settings_dict["CONN_HEALTH_CHECKS"] = True
+        elif mode == "pool":
+            options["pool"] = pool if isinstance(pool, dict) else {
+                "min_size": 1,
+                "max_size": 4,
+            }
+        return settings_dict
+
+    def measure(self, mode, alias, requests):
+        base = connections[alias].settings_dict
+        settings_dict = self.settings_for(mode, base)
+        backend = load_backend(settings_dict["ENGINE"])
+        wrapper = backend.DatabaseWrapper(
+            settings_dict, f"{alias}-benchmark-{mode}"
+        )
+
+        durations = []
+        try:
+            for _ in range(requests):
+                start = perf_counter()
+                # The same calls Django makes around every request.
+                wrapper.close_if_unusable_or_obsolete()
+                with wrapper.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                    cursor.fetchone()
+                wrapper.close_if_unusable_or_obsolete()
+                durations.append((perf_counter() - start) * 1000)
+        finally:
+            wrapper.close()
+            if mode == "pool":
+                wrapper.close_pool()
+
+        return {
+            "requests": requests,
+            "total_ms": round(sum(durations), 3),
+            "mean_ms": round(statistics.fmean(durations), 3),
+            "p95_ms": round(percentile(durations, 95), 3),
+        }
+
+    def handle(self, *args, **options):
+        alias = options["database"]
+        vendor = connections[alias].vendor
+        results = {}
+        for mode in options["modes"]:
+            if mode == "pool" and not _pool_available(vendor):
+                self.stdout.write(
+                    "pool        skipped (needs PostgreSQL and "
+                    "psycopg[pool])"
+                )
+                continue
+            results[mode] = self.measure(mode, alias, options["requests"])
+            self.stdout.write(
+                f"{mode:10}  mean={results[mode]['mean_ms']:8.3f} ms  "
+                f"p95={results[mode]['p95_ms']:8.3f} ms"
+            )
+
+        baseline = results.get("new")
+        if baseline and baseline["mean_ms"]:
+            for mode, result in results.items():
+                result["saved_per_request_ms"] = round(
+                    baseline["mean_ms"] - result["mean_ms"], 3
+                )
+
+        if options["output"]:
+            Path(options["output"]).write_text(json.dumps({
+                "vendor": vendor,
+                "results": results,
+            }, indent=2))
+            self.stdout.write(f"Results written to {options['output']}")
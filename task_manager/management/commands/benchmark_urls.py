@@ -0,0 +1,190 @@
+import json
+import statistics
+from pathlib import Path
+from time import perf_counter
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from task_manager import urls as task_manager_urls
+from task_manager.benchmarks import percentile
+from task_manager.board import BOARD_COLUMNS
+from task_manager.models import Position, Project, Tag, TaskType, Team
+
+
+POST_ONLY_URLS = {"task-change-status", "task-move", "task-bulk"}
+
+
+def _default_host():
+    for host in settings.ALLOWED_HOSTS:
+        if host != "*":
+            return host.lstrip(".")
+    return "localhost"
+
+
+class Command(BaseCommand):
+    help = (
+        "Time every named task manager URL and record latency percentiles "
+        "and query counts as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--username",
+            help="Worker to log in as. Defaults to a member of a team "
+                 "with tasks.",
+        )
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--warmup", type=int, default=2)
+        parser.add_argument("--host", default=None)
+        parser.add_argument(
+            "--output",
+            default=None,
+            help="JSON file to write. Defaults to "
+                 "benchmark-<timestamp>.json in the current directory.",
+        )
+
+    def handle(self, *args, **options):
+        user = self.get_user(options["username"])
+        samples = self.get_samples(user)
+
+        client = Client(
+            HTTP_HOST=options["host"] or _default_host(),
+            secure=getattr(settings, "SECURE_SSL_REDIRECT", False),
+        )
+        client.force_login(user)
+
+        results = {}
+        for name, url in self.get_urls(samples):
+            results[name] = self.measure(
+                client, url, options["iterations"], options["warmup"]
+            )
+            self.stdout.write(
+                f"{name:32} p50={results[name]['p50_ms']:8.2f} ms  "
+                f"p95={results[name]['p95_ms']:8.2f} ms  "
+                f"queries={results[name]['queries']}"
+            )
+
+        output = Path(options["output"] or (
+            f"benchmark-{timezone.now():%Y%m%d-%H%M%S}.json"
+        ))
+        output.write_text(json.dumps({
+            "created_at": timezone.now().isoformat(),
+            "database": connection.vendor,
+            "username": user.username,
+            "iterations": options["iterations"],
+            "results": results,
+        }, indent=2))
+        self.stdout.write(self.style.SUCCESS(f"Results saved to {output}"))
+
+    @staticmethod
+    def get_user(username):
+        workers = get_user_model().objects
+        if username:
+            try:
+                return workers.get(username=username)
+            except workers.model.DoesNotExist:
+                raise CommandError(f"Worker '{username}' does not exist.")
+
+        team = (
+            Team.objects
+            .filter(projects__tasks__isnull=False)
+            .order_by("-pk")
+            .first()
+        )
+        user = team.members.first() if team else None
+        if user is None:
+            raise CommandError(
+                "No team member with tasks found. Run generate_load_data "
+                "first or pass --username."
+            )
+        return user
+
+    @staticmethod
+    def get_samples(user):
+        project = (
+            Project.objects
+            .filter(team__members=user, tasks__isnull=False)
+            .first()
+        )
+        if project is None:
+            raise CommandError(
+                f"'{user.username}' has no project with tasks to sample."
+            )
+        return {
+            "worker": user,
+            "team": project.team,
+            "project": project,
+            "task": project.tasks.first(),
+            "position": Position.objects.first(),
+            "tag": Tag.objects.first(),
+            "task-type": TaskType.objects.first(),
+        }
+
+    @staticmethod
+    def get_urls(samples):
+        for pattern in task_manager_urls.urlpatterns:
+            name = pattern.name
+            if not name or name in POST_ONLY_URLS:
+                continue
+
+            kwargs = {}
+            for kwarg in pattern.pattern.converters:
+                if kwarg == "column":
+                    kwargs[kwarg] = BOARD_COLUMNS[0][0]
+                    continue
+                if kwarg == "team_pk":
+                    obj = samples["team"]
+                elif kwarg == "project_pk":
+                    obj = samples["project"]
+                else:
+                    prefix = max(
+                        (p for p in samples if name.startswith(p)),
+                        key=len,
+                        default=None,
+                    )
+                    obj = samples.get(prefix)
+                if obj is None:
+                    break
+                kwargs[kwarg] = obj.pk
+            else:
+                url = reverse(
+                    f"{task_manager_urls.app_name}:{name}", kwargs=kwargs
+                )
+                if name == "task-create-select-project":
+                    url += f"?team={samples['team'].pk}"
+                yield name, url
+
+    @staticmethod
+    def measure(client, url, iterations, warmup):
+        for _ in range(warmup):
+            client.get(url)
+
+        timings = []
+        query_counts = []
+        status_code = None
+        for _ in range(iterations):
+            with CaptureQueriesContext(connection) as queries:
+                start = perf_counter()
+                response = client.get(url)
+                timings.append((perf_counter() - start) * 1000)
+            query_counts.append(len(queries))
+            status_code = response.status_code
+
+        return {
+            "url": url,
+            "status_code": status_code,
+            "queries": max(query_counts),
+            "mean_ms": round(statistics.fmean(timings), 3),
+            "p50_ms": round(percentile(timings, 50), 3),
+            "p90_ms": round(percentile(timings, 90), 3),
+            "p95_ms": round(percentile(timings, 95), 3),
+            "p99_ms": round(percentile(timings, 99), 3),
+            "max_ms": round(max(timings), 3),
+        }
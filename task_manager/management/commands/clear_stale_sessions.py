@@ -0,0 +1,43 @@
+from time import sleep
+
+from django.contrib.sessions.models import Session
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired sessions in small batches instead of one large "
+        "DELETE, so the sessions table is never locked for long."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0,
+            help="Seconds to wait between batches.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        expired = Session.objects.filter(expire_date__lt=timezone.now())
+        deleted = 0
+        while True:
+            keys = list(
+                expired.order_by()
+                .values_list("session_key", flat=True)[:batch_size]
+            )
+            if keys:
+                deleted += Session.objects.filter(
+                    session_key__in=keys
+                ).delete()[0]
+            if len(keys) < batch_size:
+                break
+            if options["pause"]:
+                sleep(options["pause"])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Deleted {deleted} expired session(s).")
+        )
@@ -0,0 +1,51 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.exports import EXPORTS, EXPORT_FORMATS, export_lines
+
+
+class Command(BaseCommand):
+    help = "Stream tasks, projects or workers as CSV or JSON lines."
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=sorted(EXPORTS))
+        parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+        parser.add_argument(
+            "--search",
+            default="",
+            help="Same search as the list page of the exported kind.",
+        )
+        parser.add_argument(
+            "--username",
+            help="Only export what this worker can see in their teams.",
+        )
+        parser.add_argument(
+            "--output",
+            default=None,
+            help="File to write. Defaults to stdout.",
+        )
+
+    def handle(self, *args, **options):
+        user = None
+        if options["username"]:
+            workers = get_user_model().objects
+            try:
+                user = workers.get(username=options["username"])
+            except workers.model.DoesNotExist:
+                raise CommandError(
+                    f"Worker '{options['username']}' does not exist."
+                )
+
+        lines = export_lines(
+            options["kind"], options["format"], user, options["search"]
+        )
+        if options["output"] is None:
+            for line in lines:
+                self.stdout.write(line, ending="")
+            return
+
+        with open(options["output"], "w", newline="") as output:
+            output.writelines(lines)
+        self.stdout.write(self.style.SUCCESS(
+            f"Exported {options['kind']} to {options['output']}."
+        ))
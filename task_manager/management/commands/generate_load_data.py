@@ -0,0 +1,232 @@
+import random
+import uuid
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from task_manager.counters import COUNTERS, recount
+from task_manager.models import (
+    Position,
+    Worker,
+    Team,
+    Project,
+    Task,
+    Tag,
+    TaskType,
+)
+from task_manager.reference import REFERENCE_MODELS
+from task_manager.search import refresh_search_documents
+from task_manager.stats import invalidate_dashboard_stats
+from task_manager.versions import (
+    VERSIONED_MODELS,
+    bump_row_versions,
+    bump_versions,
+)
+
+
+PRIORITY_WEIGHTS = {
+    Task.PriorityChoices.URGENT: 5,
+    Task.PriorityChoices.HIGH: 20,
+    Task.PriorityChoices.MEDIUM: 50,
+    Task.PriorityChoices.LOW: 25,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate synthetic positions, workers, teams, projects, tags, "
+        "task types and tasks for load testing and benchmarks."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--positions", type=int, default=10)
+        parser.add_argument("--workers", type=int, default=200)
+        parser.add_argument("--teams", type=int, default=20)
+        parser.add_argument("--projects", type=int, default=60)
+        parser.add_argument("--tasks", type=int, default=5000)
+        parser.add_argument("--tags", type=int, default=40)
+        parser.add_argument("--task-types", type=int, default=8)
+        parser.add_argument(
+            "--password",
+            default="loadtest12345",
+            help="Password of every generated worker.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=None,
+            help="Seed for reproducible distributions.",
+        )
+
+    def handle(self, *args, **options):
+        self.random = random.Random(options["seed"])
+        self.batch_size = options["batch_size"]
+        self.prefix = uuid.uuid4().hex[:6]
+        self.now = timezone.now()
+
+        with transaction.atomic():
+            positions = self.create_positions(options["positions"])
+            workers = self.create_workers(
+                options["workers"], positions, options["password"]
+            )
+            teams = self.create_teams(options["teams"], workers)
+            projects = self.create_projects(options["projects"], teams)
+            tags = self.create_named(Tag, "tag", options["tags"])
+            task_types = self.create_named(
+                TaskType, "Type", options["task_types"]
+            )
+            tasks = self.create_tasks(
+                options["tasks"], projects, tags, task_types
+            )
+
+        for model in COUNTERS:
+            recount(model)
+        refresh_search_documents(task.pk for task in tasks)
+        invalidate_dashboard_stats()
+        bump_versions(*VERSIONED_MODELS)
+        bump_row_versions(*REFERENCE_MODELS)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {len(positions)} positions, {len(workers)} workers, "
+            f"{len(teams)} teams, {len(projects)} projects, "
+            f"{len(tags)} tags, {len(task_types)} task types and "
+            f"{len(tasks)} tasks (prefix {self.prefix})."
+        ))
+
+    def bulk_create(self, model, objects):
+        return model.objects.bulk_create(objects, batch_size=self.batch_size)
+
+    def create_named(self, model, label, count):
+        return self.bulk_create(model, [
+            model(name=f"{label}-{self.prefix}-{index}")
+            for index in range(count)
+        ])
+
+    def create_positions(self, count):
+        return self.create_named(Position, "Position", count)
+
+    def create_workers(self, count, positions, password):
+        password = make_password(password)
+        workers = []
+        for index in range(count):
+            workers.append(Worker(
+                username=f"load_{self.prefix}_{index}",
+                first_name=f"Worker{index}",
+                last_name=self.prefix.capitalize(),
+                email=f"load_{self.prefix}_{index}@example.com",
+                password=password,
+                position=(
+                    self.random.choice(positions)
+                    if positions and self.random.random() < 0.9
+                    else None
+                ),
+            ))
+        return self.bulk_create(Worker, workers)
+
+    def create_teams(self, count, workers):
+        teams = self.create_named(Team, "Team", count)
+        if not workers:
+            return teams
+
+        Membership = Team.members.through
+        memberships = []
+        for team in teams:
+            size = min(
+                len(workers),
+                max(1, int(self.random.lognormvariate(2, 0.6)))
+            )
+            memberships.extend(
+                Membership(team_id=team.pk, worker_id=worker.pk)
+                for worker in self.random.sample(workers, size)
+            )
+        self.bulk_create(Membership, memberships)
+        return teams
+
+    def create_projects(self, count, teams):
+        if not teams:
+            return []
+        return self.bulk_create(Project, [
+            Project(
+                name=f"Project-{self.prefix}-{index}",
+                description=f"Synthetic project {index}",
+                team=self.random.choice(teams),
+            )
+            for index in range(count)
+        ])
+
+    def create_tasks(self, count, projects, tags, task_types):
+        if not projects:
+            return []
+
+        # A few projects carry most of the work, like in real backlogs.
+        project_weights = [
+            self.random.paretovariate(1.2) for _ in projects
+        ]
+        member_ids = self.team_member_ids(projects)
+        priorities = list(PRIORITY_WEIGHTS)
+        priority_weights = list(PRIORITY_WEIGHTS.values())
+
+        tasks = []
+        for index in range(count):
+            project = self.random.choices(projects, project_weights)[0]
+            deadline = None
+            if self.random.random() < 0.7:
+                deadline = self.now + timedelta(
+                    days=self.random.randint(-60, 120)
+                )
+            tasks.append(Task(
+                name=f"Task {index} {self.prefix}",
+                description=f"Synthetic task {index} for {project.name}",
+                priority=self.random.choices(
+                    priorities, priority_weights
+                )[0],
+                deadline=deadline,
+                is_completed=self.random.random() < 0.4,
+                task_type=(
+                    self.random.choice(task_types)
+                    if task_types and self.random.random() < 0.85
+                    else None
+                ),
+                project=project,
+            ))
+        tasks = self.bulk_create(Task, tasks)
+
+        Assignment = Task.assignees.through
+        Tagging = Task.tags.through
+        assignments = []
+        taggings = []
+        for task in tasks:
+            candidates = member_ids[task.project.team_id]
+            assignees = self.random.sample(
+                candidates,
+                min(len(candidates), self.random.randint(0, 3))
+            )
+            assignments.extend(
+                Assignment(task_id=task.pk, worker_id=worker_id)
+                for worker_id in assignees
+            )
+            task_tags = self.random.sample(
+                tags, min(len(tags), self.random.randint(0, 3))
+            )
+            taggings.extend(
+                Tagging(task_id=task.pk, tag_id=tag.pk) for tag in task_tags
+            )
+        self.bulk_create(Assignment, assignments)
+        self.bulk_create(Tagging, taggings)
+        return tasks
+
+    @staticmethod
+    def team_member_ids(projects):
+        team_ids = {project.team_id for project in projects}
+        member_ids = {team_id: [] for team_id in team_ids}
+        for team_id, worker_id in (
+            Team.members.through.objects
+            .filter(team_id__in=team_ids)
+            .values_list("team_id", "worker_id")
+        ):
+            member_ids[team_id].append(worker_id)
+        return member_ids
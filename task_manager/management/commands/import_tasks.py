@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.imports import (
+    IMPORT_BATCH_SIZE,
+    IMPORT_FORMATS,
+    guess_format,
+    import_tasks,
+)
+from task_manager.models import Project
+
+
+class Command(BaseCommand):
+    help = (
+        "Import tasks into a project from a CSV or JSON lines file. "
+        "Invalid rows are reported and skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("project_id", type=int)
+        parser.add_argument("path")
+        parser.add_argument(
+            "--format",
+            choices=IMPORT_FORMATS,
+            default=None,
+            help="Defaults to jsonl for .jsonl/.ndjson files, else csv.",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=IMPORT_BATCH_SIZE
+        )
+
+    def handle(self, *args, **options):
+        try:
+            project = Project.objects.select_related("team").get(
+                pk=options["project_id"]
+            )
+        except Project.DoesNotExist:
+            raise CommandError(
+                f"Project {options['project_id']} does not exist."
+            )
+
+        import_format = options["format"] or guess_format(options["path"])
+        with open(
+            options["path"], encoding="utf-8-sig", newline=""
+        ) as lines:
+            result = import_tasks(
+                project,
+                lines,
+                import_format,
+                batch_size=options["batch_size"],
+            )
+
+        for line, error in result.errors:
+            self.stderr.write(f"Line {line}: {error}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {result.created} task(s) into '{project.name}', "
+            f"skipped {len(result.errors)} invalid row(s)."
+        ))
@@ -0,0 +1,159 @@
+import json
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from time import perf_counter
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin
+from urllib.request import Request, urlopen
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from task_manager.benchmarks import percentile
+from task_manager.management.commands.benchmark_urls import (
+    Command as BenchmarkUrlsCommand,
+)
+
+
+READ_URLS = (
+    "index",
+    "task-list",
+    "project-list",
+    "team-list",
+    "worker-list",
+    "task-detail",
+    "project-detail",
+    "team-detail",
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Send concurrent GET requests for the read-heavy pages to a "
+        "running server and record throughput and latency as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "base_url",
+            help="Server to load, e.g. http://127.0.0.1:8000",
+        )
+        parser.add_argument(
+            "--username",
+            help="Worker to log in as. Defaults to a member of a team "
+                 "with tasks.",
+        )
+        parser.add_argument("--concurrency", type=int, default=50)
+        parser.add_argument("--requests", type=int, default=1000)
+        parser.add_argument("--timeout", type=float, default=30)
+        parser.add_argument(
+            "--label",
+            default="",
+            help="Name of the server setup, stored in the report.",
+        )
+        parser.add_argument(
+            "--output",
+            default=None,
+            help="JSON file to write. Defaults to "
+                 "load-<timestamp>.json in the current directory.",
+        )
+
+    def handle(self, *args, **options):
+        if options["concurrency"] < 1 or options["requests"] < 1:
+            raise CommandError(
+                "--concurrency and --requests must be positive."
+            )
+
+        user = BenchmarkUrlsCommand.get_user(options["username"])
+        urls = self.get_urls(BenchmarkUrlsCommand.get_samples(user))
+        cookie = self.get_session_cookie(user)
+        targets = [
+            urljoin(options["base_url"], urls[index % len(urls)])
+            for index in range(options["requests"])
+        ]
+
+        start = perf_counter()
+        with ThreadPoolExecutor(options["concurrency"]) as executor:
+            samples = list(executor.map(
+                lambda url: self.fetch(url, cookie, options["timeout"]),
+                targets,
+            ))
+        duration = perf_counter() - start
+
+        report = self.summarize(samples, duration)
+        self.stdout.write(
+            f"{report['requests']} requests in {duration:.2f} s: "
+            f"{report['requests_per_second']} req/s  "
+            f"p50={report['p50_ms']} ms  p95={report['p95_ms']} ms  "
+            f"errors={report['errors']}"
+        )
+
+        output = Path(options["output"] or (
+            f"load-{timezone.now():%Y%m%d-%H%M%S}.json"
+        ))
+        output.write_text(json.dumps({
+            "created_at": timezone.now().isoformat(),
+            "label": options["label"],
+            "base_url": options["base_url"],
+            "username": user.username,
+            "concurrency": options["concurrency"],
+            "urls": urls,
+            "results": report,
+        }, indent=2))
+        self.stdout.write(self.style.SUCCESS(f"Results saved to {output}"))
+
+    @staticmethod
+    def get_urls(samples):
+        kwargs = {
+            "task-detail": samples["task"].pk,
+            "project-detail": samples["project"].pk,
+            "team-detail": samples["team"].pk,
+        }
+        return [
+            reverse(
+                f"task-manager:{name}",
+                kwargs={"pk": kwargs[name]} if name in kwargs else None,
+            )
+            for name in READ_URLS
+        ]
+
+    @staticmethod
+    def get_session_cookie(user):
+        client = Client()
+        client.force_login(user)
+        name = settings.SESSION_COOKIE_NAME
+        return f"{name}={client.cookies[name].value}"
+
+    @staticmethod
+    def fetch(url, cookie, timeout):
+        request = Request(url, headers={"Cookie": cookie})
+        start = perf_counter()
+        try:
+            with urlopen(request, timeout=timeout) as response:
+                response.read()
+                status = response.status
+        except HTTPError as error:
+            status = error.code
+        except (URLError, TimeoutError):
+            status = None
+        return status, (perf_counter() - start) * 1000
+
+    @staticmethod
+    def summarize(samples, duration):
+        timings = [elapsed for _, elapsed in samples]
+        return {
+            "requests": len(samples),
+            "errors": sum(1 for status, _ in samples if status != 200),
+            "duration_s": round(duration, 3),
+            "requests_per_second": round(len(samples) / duration, 2),
+            "mean_ms": round(statistics.fmean(timings), 3),
+            "p50_ms": round(percentile(timings, 50), 3),
+            "p90_ms": round(percentile(timings, 90), 3),
+            "p95_ms": round(percentile(timings, 95), 3),
+            "p99_ms": round(percentile(timings, 99), 3),
+            "max_ms": round(max(timings), 3),
+        }
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from task_manager.search import refresh_search_documents
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search documents of all tasks."
+
+    def handle(self, *args, **options):
+        refreshed = refresh_search_documents()
+        self.stdout.write(
+            self.style.SUCCESS(f"Indexed {refreshed} task(s).")
+        )
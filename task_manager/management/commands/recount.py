@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from task_manager.counters import COUNTERS, recount
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the member, task and worker counters of teams, "
+        "projects and positions."
+    )
+
+    def handle(self, *args, **options):
+        for model, (field, _, _) in COUNTERS.items():
+            fixed = recount(model)
+            self.stdout.write(
+                f"{model._meta.verbose_name_plural}.{field}: "
+                f"fixed {fixed} row(s)"
+            )
+        self.stdout.write(self.style.SUCCESS("Counters are up to date."))
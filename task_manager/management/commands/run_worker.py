@@ -0,0 +1,102 @@
+import os
+import socket
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connections
+
+from task_manager.jobs import claim_jobs, purge_finished_jobs, run_job
+
+
+PURGE_INTERVAL = 3600
+
+
+class Command(BaseCommand):
+    help = (
+        "Process queued background jobs with a pool of threads. "
+        "Run one or more of these next to the web server."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=4,
+            help="Number of jobs processed at the same time.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait before looking for new jobs.",
+        )
+        parser.add_argument(
+            "--keep-days",
+            type=int,
+            default=7,
+            help="Days finished jobs are kept before they are deleted.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Process the jobs that are due and exit.",
+        )
+
+    def run(self, job, worker_id):
+        try:
+            return run_job(job, worker_id)
+        finally:
+            connections.close_all()
+
+    def handle(self, *args, **options):
+        threads = max(options["threads"], 1)
+        worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        keep = timedelta(days=options["keep_days"])
+        processed = failed = 0
+        last_purge = None
+        pending = set()
+
+        self.stdout.write(f"Worker {worker_id} started ({threads} threads).")
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            try:
+                while True:
+                    close_old_connections()
+                    if (
+                        last_purge is None
+                        or time.monotonic() - last_purge > PURGE_INTERVAL
+                    ):
+                        purge_finished_jobs(keep)
+                        last_purge = time.monotonic()
+
+                    if len(pending) < threads:
+                        for job in claim_jobs(
+                            worker_id, threads - len(pending)
+                        ):
+                            pending.add(
+                                executor.submit(self.run, job, worker_id)
+                            )
+
+                    if not pending:
+                        if options["once"]:
+                            break
+                        time.sleep(options["poll_interval"])
+                        continue
+
+                    done, pending = wait(
+                        pending,
+                        timeout=options["poll_interval"],
+                        return_when=FIRST_COMPLETED,
+                    )
+                    for future in done:
+                        processed += 1
+                        failed += not future.result()
+            except KeyboardInterrupt:
+                self.stdout.write("Stopping, waiting for running jobs...")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Processed {processed} job(s), {failed} failed."
+            )
+        )
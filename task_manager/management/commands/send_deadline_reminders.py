@@ -0,0 +1,40 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from task_manager.deadlines import scan_deadlines, send_deadline_reminders
+
+
+class Command(BaseCommand):
+    help = (
+        "Email assignees one reminder listing their tasks that are due "
+        "soon or overdue. Safe to run repeatedly, e.g. from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--window-hours",
+            type=int,
+            default=settings.DEADLINE_REMINDER_HOURS,
+            help="Remind about open tasks due within this many hours.",
+        )
+        parser.add_argument(
+            "--lookback-days",
+            type=int,
+            default=settings.DEADLINE_LOOKBACK_DAYS,
+            help="Report tasks that became overdue within this many days.",
+        )
+
+    def handle(self, *args, **options):
+        scanned = scan_deadlines(
+            window=timedelta(hours=options["window_hours"]),
+            lookback=timedelta(days=options["lookback_days"]),
+        )
+        messages, notices = send_deadline_reminders()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Scanned {scanned} task(s), sent {messages} reminder(s) "
+                f"covering {notices} deadline(s)."
+            )
+        )
@@ -0,0 +1,101 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils import timezone
+
+from task_manager.caching import cache_is_shared
+from task_manager.models import Task, Team, Worker
+from task_manager.versions import bump_versions
+
+
+ASSIGNMENT_DELETE_BATCH_SIZE = 500
+
+
+def _team_ids_cache_key(user_id, date_joined):
+    # Primary keys can be reused after deletes, date_joined tells the
+    # previous owner of the same pk apart.
+    return f"task_manager:team-ids:{user_id}:{date_joined.timestamp()}"
+
+
+def get_user_team_ids(user):
+    if not user.is_authenticated:
+        return frozenset()
+
+    team_ids = getattr(user, "_team_ids", None)
+    if team_ids is not None:
+        return team_ids
+
+    # Team ids decide write access, so they are only cached across
+    # requests when every process sees the invalidation.
+    shared = cache_is_shared()
+    key = _team_ids_cache_key(user.pk, user.date_joined)
+    team_ids = cache.get(key) if shared else None
+    if team_ids is None:
+        team_ids = frozenset(
+            Team.members.through.objects
+            .using(DEFAULT_DB_ALIAS)
+            .filter(worker_id=user.pk)
+            .values_list("team_id", flat=True)
+        )
+        if shared:
+            cache.set(key, team_ids, settings.MEMBERSHIP_CACHE_TIMEOUT)
+
+    user._team_ids = team_ids
+    return team_ids
+
+
+def is_team_member(user, team_id):
+    return team_id in get_user_team_ids(user)
+
+
+def invalidate_user_team_ids(user_ids):
+    user_ids = list(user_ids)
+    if not user_ids:
+        return
+    keys = [
+        _team_ids_cache_key(user_id, date_joined)
+        for user_id, date_joined in (
+            Worker.objects
+            .filter(pk__in=user_ids)
+            .values_list("pk", "date_joined")
+        )
+    ]
+    # Deleting before the commit would let a concurrent request cache the
+    # old memberships again.
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def forget_user_team_ids(user):
+    user.__dict__.pop("_team_ids", None)
+    key = _team_ids_cache_key(user.pk, user.date_joined)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+def drop_stale_assignments(team, removed_member_ids):
+    removed_member_ids = sorted(removed_member_ids)
+    if not removed_member_ids:
+        return 0
+
+    Assignment = Task.assignees.through
+    dropped = 0
+
+    with transaction.atomic():
+        for start in range(
+            0, len(removed_member_ids), ASSIGNMENT_DELETE_BATCH_SIZE
+        ):
+            batch = removed_member_ids[
+                start:start + ASSIGNMENT_DELETE_BATCH_SIZE
+            ]
+            Task.objects.filter(
+                project__team=team,
+                assignees__in=batch,
+            ).update(updated_at=timezone.now())
+            deleted, _ = Assignment.objects.filter(
+                task__project__team=team,
+                worker_id__in=batch,
+            ).delete()
+            dropped += deleted
+        if dropped:
+            bump_versions(Task, Worker)
+
+    return dropped
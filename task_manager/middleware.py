@@ -0,0 +1,359 @@
+import logging
+import threading
+from bisect import bisect_left
+from contextlib import ExitStack
+from contextvars import ContextVar
+from functools import partial
+from time import perf_counter
+
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from django.conf import settings
+from django.db import OperationalError, connections
+from django.http import HttpResponse
+
+from task_manager.routers import replica_reads
+
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_current_metrics = ContextVar("request_metrics", default=None)
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.query_count = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.query_count += 1
+            self.db_time += perf_counter() - start
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = {}
+
+    def record(self, view_name, metrics, duration):
+        duration_ms = duration * 1000
+        bucket = bisect_left(LATENCY_BUCKETS_MS, duration_ms)
+        with self._lock:
+            stats = self._views.setdefault(view_name, {
+                "requests": 0,
+                "queries": 0,
+                "max_queries": 0,
+                "db_ms": 0.0,
+                "template_ms": 0.0,
+                "total_ms": 0.0,
+                "latency_buckets": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+            })
+            stats["requests"] += 1
+            stats["queries"] += metrics.query_count
+            stats["max_queries"] = max(
+                stats["max_queries"], metrics.query_count
+            )
+            stats["db_ms"] += metrics.db_time * 1000
+            stats["template_ms"] += metrics.template_time * 1000
+            stats["total_ms"] += duration_ms
+            stats["latency_buckets"][bucket] += 1
+
+    def snapshot(self):
+        with self._lock:
+            views = {
+                name: dict(stats, latency_buckets=list(
+                    stats["latency_buckets"]
+                ))
+                for name, stats in self._views.items()
+            }
+
+        bucket_labels = [f"<={limit}ms" for limit in LATENCY_BUCKETS_MS]
+        bucket_labels.append(f">{LATENCY_BUCKETS_MS[-1]}ms")
+
+        result = {}
+        for name, stats in sorted(views.items()):
+            requests = stats["requests"]
+            result[name] = {
+                "requests": requests,
+                "avg_queries": round(stats["queries"] / requests, 2),
+                "max_queries": stats["max_queries"],
+                "avg_db_ms": round(stats["db_ms"] / requests, 2),
+                "avg_template_ms": round(stats["template_ms"] / requests, 2),
+                "avg_total_ms": round(stats["total_ms"] / requests, 2),
+                "latency_histogram": dict(
+                    zip(bucket_labels, stats["latency_buckets"])
+                ),
+            }
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+
+
+metrics_registry = MetricsRegistry()
+
+
+def _count_queries(metrics):
+    stack = ExitStack()
+    for connection in connections.all():
+        stack.enter_context(connection.execute_wrapper(metrics))
+    return stack
+
+
+class SyncAndAsyncMiddleware:
+    """
+    Runs in the mode of the handler it wraps, so under ASGI an async view
+    is not moved into a thread by this middleware. Subclasses implement
+    __call__ for sync handlers, starting with the dispatch to __acall__.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+
+class RequestMetricsMiddleware(SyncAndAsyncMiddleware):
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = _current_metrics.set(metrics)
+        start = perf_counter()
+        try:
+            with _count_queries(metrics):
+                response = self.get_response(request)
+        finally:
+            _current_metrics.reset(token)
+        return self.finish(request, response, metrics, start)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = _current_metrics.set(metrics)
+        start = perf_counter()
+        # Connections belong to a thread, and the async ORM queries in the
+        # request's sync thread, so the wrappers are installed there.
+        queries = await sync_to_async(_count_queries)(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(queries.close)()
+            _current_metrics.reset(token)
+        return self.finish(request, response, metrics, start)
+
+    def finish(self, request, response, metrics, start):
+        def record():
+            self.record(request, metrics, perf_counter() - start)
+
+        if response.streaming:
+            # The body is produced while the server iterates it, after this
+            # method returned, so the request is recorded once it is done.
+            # Server-Timing can only cover the work before the body.
+            response.streaming_content = self.measure_stream(
+                response.streaming_content, metrics, record
+            )
+        else:
+            record()
+
+        if settings.REQUEST_METRICS_SERVER_TIMING:
+            response["Server-Timing"] = self.server_timing(
+                metrics, perf_counter() - start
+            )
+        return response
+
+    def process_template_response(self, request, response):
+        metrics = _current_metrics.get()
+        if metrics is None:
+            return response
+
+        start = perf_counter()
+
+        def rendered(response):
+            metrics.template_time += perf_counter() - start
+
+        response.add_post_render_callback(rendered)
+        return response
+
+    @staticmethod
+    def measure_stream(content, metrics, record):
+        with _count_queries(metrics):
+            try:
+                yield from content
+            finally:
+                record()
+
+    def record(self, request, metrics, duration):
+        resolver_match = getattr(request, "resolver_match", None)
+        view_name = getattr(resolver_match, "view_name", None) or "unresolved"
+
+        metrics_registry.record(view_name, metrics, duration)
+        self.log_offender(request, view_name, metrics, duration)
+
+    @staticmethod
+    def log_offender(request, view_name, metrics, duration):
+        if (
+            metrics.query_count <= settings.REQUEST_METRICS_MAX_QUERIES
+            and metrics.db_time * 1000 <= settings.REQUEST_METRICS_MAX_DB_MS
+            and duration * 1000 <= settings.REQUEST_METRICS_MAX_TOTAL_MS
+        ):
+            return
+
+        logger.warning(
+            "Slow request %s %s (%s): %d queries, %.1f ms db, "
+            "%.1f ms templates, %.1f ms total",
+            request.method,
+            request.path,
+            view_name,
+            metrics.query_count,
+            metrics.db_time * 1000,
+            metrics.template_time * 1000,
+            duration * 1000,
+        )
+
+    @staticmethod
+    def server_timing(metrics, duration):
+        return ", ".join([
+            f'db;dur={metrics.db_time * 1000:.1f};'
+            f'desc="{metrics.query_count} queries"',
+            f"tpl;dur={metrics.template_time * 1000:.1f}",
+            f"total;dur={duration * 1000:.1f}",
+        ])
+
+
+def _watch_connections(failed):
+    # Adds to `failed` the alias of every connection that could not be
+    # opened. Errors of queries on an open connection are not a capacity
+    # problem and are not collected.
+    stack = ExitStack()
+    for connection in connections.all():
+        previous = connection.__dict__.get("ensure_connection")
+        connection.ensure_connection = partial(
+            _ensure_connection,
+            connection,
+            connection.ensure_connection,
+            failed,
+        )
+        stack.callback(_restore_connection, connection, previous)
+    return stack
+
+
+def _restore_connection(connection, previous):
+    if previous is None:
+        del connection.ensure_connection
+    else:
+        connection.ensure_connection = previous
+
+
+def _ensure_connection(connection, ensure_connection, failed):
+    opening = connection.connection is None
+    try:
+        ensure_connection()
+    except OperationalError:
+        if opening:
+            failed.add(connection.alias)
+        raise
+
+
+class DatabaseUnavailableMiddleware(SyncAndAsyncMiddleware):
+    """
+    Answers 503 with Retry-After instead of a 500 when a connection to the
+    primary or a replica could not be opened, e.g. the server ran out of
+    connection slots or the pool timed out, so clients and load balancers
+    back off.
+    """
+
+    retry_after = 5
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        request.failed_database_aliases = set()
+        with _watch_connections(request.failed_database_aliases):
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        request.failed_database_aliases = set()
+        watch = await sync_to_async(_watch_connections)(
+            request.failed_database_aliases
+        )
+        try:
+            return await self.get_response(request)
+        finally:
+            await sync_to_async(watch.close)()
+
+    def process_exception(self, request, exception):
+        if not isinstance(exception, OperationalError):
+            return None
+        failed = getattr(request, "failed_database_aliases", None)
+        if not failed:
+            return None
+
+        logger.error(
+            "Database %s unavailable for %s %s: %s",
+            ", ".join(sorted(failed)),
+            request.method,
+            request.path,
+            exception,
+        )
+        response = HttpResponse(
+            "The service is temporarily overloaded, please retry shortly.",
+            status=503,
+            content_type="text/plain",
+        )
+        response["Retry-After"] = str(self.retry_after)
+        return response
+
+
+class ReplicaPinningMiddleware(SyncAndAsyncMiddleware):
+    """
+    Lets a request read from the replicas unless it is a write request or
+    the same browser wrote within the last DATABASE_REPLICA_PIN_SECONDS, so
+    a redirect after a create or update always sees the new data.
+    """
+
+    cookie_name = "pin_primary"
+    safe_methods = ("GET", "HEAD", "OPTIONS")
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with replica_reads(pinned=self.is_pinned(request)) as state:
+            response = self.get_response(request)
+        return self.pin(state, response)
+
+    async def __acall__(self, request):
+        with replica_reads(pinned=self.is_pinned(request)) as state:
+            response = await self.get_response(request)
+        return self.pin(state, response)
+
+    def is_pinned(self, request):
+        return (
+            request.method not in self.safe_methods
+            or self.cookie_name in request.COOKIES
+        )
+
+    def pin(self, state, response):
+        if state.wrote and settings.DATABASE_REPLICAS:
+            response.set_cookie(
+                self.cookie_name,
+                "1",
+                max_age=settings.DATABASE_REPLICA_PIN_SECONDS,
+                secure=settings.SESSION_COOKIE_SECURE,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
@@ -0,0 +1,129 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+DOCUMENT_TABLE = "task_manager_tasksearchdocument"
+FTS_TABLE = f"{DOCUMENT_TABLE}_fts"
+DOCUMENT_COLUMNS = "name, task_type, tags, description"
+OLD_VALUES = "old.name, old.task_type, old.tags, old.description"
+NEW_VALUES = "new.name, new.task_type, new.tags, new.description"
+BATCH_SIZE = 500
+
+SQLITE_FORWARD = [
+    f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+    f"{DOCUMENT_COLUMNS}, "
+    f"content='{DOCUMENT_TABLE}', content_rowid='task_id')",
+    f"CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON {DOCUMENT_TABLE} BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, {DOCUMENT_COLUMNS}) "
+    f"VALUES (new.task_id, {NEW_VALUES}); END",
+    f"CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON {DOCUMENT_TABLE} BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {DOCUMENT_COLUMNS}) "
+    f"VALUES ('delete', old.task_id, {OLD_VALUES}); END",
+    f"CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE ON {DOCUMENT_TABLE} BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {DOCUMENT_COLUMNS}) "
+    f"VALUES ('delete', old.task_id, {OLD_VALUES}); "
+    f"INSERT INTO {FTS_TABLE}(rowid, {DOCUMENT_COLUMNS}) "
+    f"VALUES (new.task_id, {NEW_VALUES}); END",
+]
+SQLITE_BACKWARD = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+POSTGRES_FORWARD = [
+    f"CREATE INDEX {DOCUMENT_TABLE}_vector_gin ON {DOCUMENT_TABLE} "
+    f"USING GIN (("
+    f"setweight(to_tsvector('simple', name), 'A') || "
+    f"setweight(to_tsvector('simple', task_type), 'B') || "
+    f"setweight(to_tsvector('simple', tags), 'C') || "
+    f"setweight(to_tsvector('simple', description), 'D')"
+    f"))",
+]
+POSTGRES_BACKWARD = [
+    f"DROP INDEX IF EXISTS {DOCUMENT_TABLE}_vector_gin",
+]
+
+
+def _run(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        _run(schema_editor, SQLITE_FORWARD)
+    elif vendor == "postgresql":
+        _run(schema_editor, POSTGRES_FORWARD)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        _run(schema_editor, SQLITE_BACKWARD)
+    elif vendor == "postgresql":
+        _run(schema_editor, POSTGRES_BACKWARD)
+
+
+def build_search_documents(apps, schema_editor):
+    Task = apps.get_model("task_manager", "Task")
+    TaskSearchDocument = apps.get_model("task_manager", "TaskSearchDocument")
+    db_alias = schema_editor.connection.alias
+    documents = TaskSearchDocument.objects.using(db_alias)
+
+    tasks = (
+        Task.objects.using(db_alias)
+        .select_related("task_type")
+        .prefetch_related("tags")
+        .order_by("pk")
+    )
+    # Written chunk by chunk, so a large table is never held in memory.
+    batch = []
+    for task in tasks.iterator(chunk_size=BATCH_SIZE):
+        batch.append(TaskSearchDocument(
+            task_id=task.pk,
+            name=task.name,
+            task_type=task.task_type.name if task.task_type else "",
+            tags=" ".join(tag.name for tag in task.tags.all()),
+            description=task.description,
+        ))
+        if len(batch) == BATCH_SIZE:
+            documents.bulk_create(batch)
+            batch = []
+    if batch:
+        documents.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskSearchDocument",
+            fields=[
+                (
+                    "task",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="search_document",
+                        serialize=False,
+                        to="task_manager.task",
+                    ),
+                ),
+                ("name", models.TextField(blank=True)),
+                ("task_type", models.TextField(blank=True)),
+                ("tags", models.TextField(blank=True)),
+                ("description", models.TextField(blank=True)),
+            ],
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(
+            build_search_documents, migrations.RunPython.noop
+        ),
+    ]
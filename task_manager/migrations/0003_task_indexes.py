@@ -0,0 +1,76 @@
+from django.db import migrations, models
+
+
+# icontains is compiled to UPPER(column::text) LIKE UPPER(%s) on
+# PostgreSQL, so the trigram indexes cover that exact expression.
+TRIGRAM_INDEXES = [
+    ("task_manager_project", "name"),
+    ("task_manager_team", "name"),
+    ("task_manager_worker", "username"),
+]
+
+POSTGRES_FORWARD = ["CREATE EXTENSION IF NOT EXISTS pg_trgm"] + [
+    f"CREATE INDEX IF NOT EXISTS {table}_{column}_trgm ON {table} "
+    f"USING GIN ((UPPER({column}::text)) gin_trgm_ops)"
+    for table, column in TRIGRAM_INDEXES
+]
+POSTGRES_BACKWARD = [
+    f"DROP INDEX IF EXISTS {table}_{column}_trgm"
+    for table, column in TRIGRAM_INDEXES
+]
+
+
+def _run(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        _run(schema_editor, POSTGRES_FORWARD)
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        _run(schema_editor, POSTGRES_BACKWARD)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0002_task_search_document"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["is_completed", "name"],
+                name="task_status_name_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["project", "is_completed", "name"],
+                name="task_project_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_completed", False)),
+                fields=["deadline"],
+                name="task_open_deadline_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_completed", False)),
+                fields=["priority"],
+                name="task_open_priority_idx",
+            ),
+        ),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,55 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def _count(model, lookup):
+    return Coalesce(
+        Subquery(
+            model.objects
+            .filter(**{lookup: OuterRef("pk")})
+            .order_by()
+            .values(lookup)
+            .annotate(count=Count("pk"))
+            .values("count")
+        ),
+        Value(0)
+    )
+
+
+def populate_counters(apps, schema_editor):
+    Team = apps.get_model("task_manager", "Team")
+    Project = apps.get_model("task_manager", "Project")
+    Position = apps.get_model("task_manager", "Position")
+    Task = apps.get_model("task_manager", "Task")
+    Worker = apps.get_model("task_manager", "Worker")
+
+    Team.objects.update(member_count=_count(Team.members.through, "team"))
+    Project.objects.update(task_count=_count(Task, "project"))
+    Position.objects.update(worker_count=_count(Worker, "position"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0003_task_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="position",
+            name="worker_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="task_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="team",
+            name="member_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
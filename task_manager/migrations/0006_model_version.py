@@ -0,0 +1,54 @@
+import django.utils.timezone
+from django.db import migrations, models
+
+
+VERSIONED_LABELS = (
+    "task_manager.position",
+    "task_manager.project",
+    "task_manager.tag",
+    "task_manager.task",
+    "task_manager.tasktype",
+    "task_manager.team",
+    "task_manager.worker",
+)
+
+
+def create_versions(apps, schema_editor):
+    ModelVersion = apps.get_model("task_manager", "ModelVersion")
+    ModelVersion.objects.bulk_create(
+        [ModelVersion(label=label) for label in VERSIONED_LABELS],
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0005_updated_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ModelVersion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("label", models.CharField(max_length=100, unique=True)),
+                ("version", models.PositiveBigIntegerField(default=0)),
+                (
+                    "changed_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunPython(create_versions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,71 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0007_job"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DeadlineNotice",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("DUE_SOON", "Due soon"),
+                            ("OVERDUE", "Overdue"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("deadline", models.DateTimeField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("sent_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "task",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="deadline_notices",
+                        to="task_manager.task",
+                    ),
+                ),
+                (
+                    "worker",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="deadline_notices",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("task", "worker", "kind", "deadline"),
+                        name="deadline_notice_unique",
+                    ),
+                ],
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(sent_at__isnull=True),
+                        fields=["worker"],
+                        name="deadline_notice_pending_idx",
+                    ),
+                ],
+            },
+        ),
+    ]
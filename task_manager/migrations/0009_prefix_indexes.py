@@ -0,0 +1,48 @@
+from django.db import migrations
+
+
+# Autocomplete filters with istartswith, i.e. UPPER(column::text) LIKE
+# UPPER('prefix%'). A btree with text_pattern_ops answers that with an
+# index range scan even for one or two characters, where the trigram
+# indexes from 0003 do not help.
+PREFIX_INDEXES = [
+    ("task_manager_worker", "username"),
+    ("task_manager_team", "name"),
+    ("task_manager_tag", "name"),
+]
+
+POSTGRES_FORWARD = [
+    f"CREATE INDEX IF NOT EXISTS {table}_{column}_prefix ON {table} "
+    f"((UPPER({column}::text)) text_pattern_ops)"
+    for table, column in PREFIX_INDEXES
+]
+POSTGRES_BACKWARD = [
+    f"DROP INDEX IF EXISTS {table}_{column}_prefix"
+    for table, column in PREFIX_INDEXES
+]
+
+
+def _run(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        _run(schema_editor, POSTGRES_FORWARD)
+
+
+def drop_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        _run(schema_editor, POSTGRES_BACKWARD)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0008_deadline_notice"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_indexes, drop_prefix_indexes),
+    ]
@@ -1,7 +1,19 @@
+from asgiref.sync import sync_to_async
+from django.contrib.messages import get_messages
+from django.http import Http404
 from django.shortcuts import resolve_url
-from django.utils.http import url_has_allowed_host_and_scheme
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, url_has_allowed_host_and_scheme
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 
+from task_manager.pagination import KeysetPaginator, InvalidCursor
+from task_manager.versions import (
+    aget_versions,
+    get_versions,
+    versions_etag,
+    versions_last_modified,
+)
+
 
 class NextUrlRedirectMixin:
     def get_success_url(self):
@@ -25,3 +37,161 @@ class StaffRequiredMixin(LoginRequiredMixin, UserPassesTestMixin):
 
     def test_func(self):
         return self.request.user.is_staff
+
+
+class AsyncLoginRequiredMixin(LoginRequiredMixin):
+    async def dispatch(self, request, *args, **kwargs):
+        # Loaded once here, so code running later in the event loop never
+        # touches the lazy request.user.
+        request.user = await request.auser()
+        if not request.user.is_authenticated:
+            return self.handle_no_permission()
+        return await super(LoginRequiredMixin, self).dispatch(
+            request, *args, **kwargs
+        )
+
+
+class KeysetPaginationMixin:
+    paginator_class = KeysetPaginator
+    cursor_kwarg = "cursor"
+    paginate_with_count = False
+
+    def paginate_queryset(self, queryset, page_size):
+        if getattr(self, "_paginated", None) is not None:
+            return self._paginated
+        paginator = self.get_paginator(queryset, page_size)
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidCursor:
+            raise Http404("Invalid page cursor.")
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    async def apaginate_queryset(self, queryset, page_size):
+        # Fetches the page in the event loop; get_context_data() then gets
+        # it from paginate_queryset() without querying again.
+        paginator = self.get_paginator(queryset, page_size)
+        try:
+            page = await paginator.apage(
+                self.request.GET.get(self.cursor_kwarg)
+            )
+        except InvalidCursor:
+            raise Http404("Invalid page cursor.")
+        self._paginated = (
+            paginator, page, page.object_list, page.has_other_pages()
+        )
+        return self._paginated
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["paginate_with_count"] = self.paginate_with_count
+        return context
+
+
+class BaseConditionalGetMixin:
+    conditional_models = ()
+
+    def get_etag(self, versions):
+        user = self.request.user
+        return versions_etag(
+            versions,
+            user.pk,
+            user.get_username(),
+            user.is_staff,
+            self.request.META.get("CSRF_COOKIE", ""),
+        )
+
+    def is_conditional(self, request):
+        # Pending flash messages are rendered once, so the page must be
+        # rebuilt even if nothing else changed.
+        return bool(self.conditional_models) and not len(
+            get_messages(request)
+        )
+
+    def get_validators(self, versions):
+        last_modified = versions_last_modified(versions)
+        if last_modified is not None:
+            last_modified = int(last_modified.timestamp())
+        return self.get_etag(versions), last_modified
+
+    @staticmethod
+    def set_validators(response, etag, last_modified):
+        response.headers.setdefault("ETag", etag)
+        if last_modified is not None:
+            response.headers.setdefault(
+                "Last-Modified", http_date(last_modified)
+            )
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+class ConditionalGetMixin(BaseConditionalGetMixin):
+    def get(self, request, *args, **kwargs):
+        if not self.is_conditional(request):
+            return super().get(request, *args, **kwargs)
+
+        etag, last_modified = self.get_validators(
+            get_versions(*self.conditional_models)
+        )
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        return self.set_validators(response, etag, last_modified)
+
+
+class AsyncConditionalGetMixin(BaseConditionalGetMixin):
+    async def get(self, request, *args, **kwargs):
+        if not await sync_to_async(self.is_conditional)(request):
+            return await super().get(request, *args, **kwargs)
+
+        etag, last_modified = self.get_validators(
+            await aget_versions(*self.conditional_models)
+        )
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = await super().get(request, *args, **kwargs)
+        return self.set_validators(response, etag, last_modified)
+
+
+class AsyncListMixin:
+    """
+    The get() of ListView for async views. Only the page is fetched in the
+    event loop; building the queryset and the context, which may run
+    further queries, happens in a thread.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        self.object_list = await sync_to_async(self.get_queryset)()
+        page_size = self.get_paginate_by(self.object_list)
+        if page_size:
+            await self.apaginate_queryset(self.object_list, page_size)
+        context = await sync_to_async(self.get_context_data)()
+        return self.render_to_response(context)
+
+
+class AsyncDetailMixin:
+    """
+    The get() of DetailView for async views, looking the object up by the
+    pk URL keyword argument.
+    """
+
+    async def aget_object(self, queryset=None):
+        if queryset is None:
+            queryset = self.get_queryset()
+        try:
+            return await queryset.aget(pk=self.kwargs[self.pk_url_kwarg])
+        except queryset.model.DoesNotExist:
+            raise Http404(
+                f"No {queryset.model._meta.verbose_name} found matching "
+                f"the query"
+            )
+
+    async def get(self, request, *args, **kwargs):
+        self.object = await self.aget_object()
+        context = await sync_to_async(self.get_context_data)(
+            object=self.object
+        )
+        return self.render_to_response(context)
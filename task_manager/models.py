@@ -3,10 +3,12 @@ from django.db import models
 
 from django.conf import settings
 from django.urls import reverse
+from django.utils import timezone
 
 
 class TaskType(models.Model):
     name = models.CharField(max_length=255, unique=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ("name",)
@@ -17,6 +19,8 @@ class TaskType(models.Model):
 
 class Position(models.Model):
     name = models.CharField(max_length=255, unique=True)
+    worker_count = models.PositiveIntegerField(default=0, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ("name",)
@@ -33,6 +37,7 @@ class Worker(AbstractUser):
         blank=True,
         related_name="workers"
     )
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "worker"
@@ -58,6 +63,8 @@ class Team(models.Model):
         related_name="teams",
         blank=True,
     )
+    member_count = models.PositiveIntegerField(default=0, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ("name",)
@@ -74,6 +81,8 @@ class Project(models.Model):
         on_delete=models.CASCADE,
         related_name="projects",
     )
+    task_count = models.PositiveIntegerField(default=0, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ("name",)
@@ -84,6 +93,7 @@ class Project(models.Model):
 
 class Tag(models.Model):
     name = models.CharField(max_length=100, unique=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ("name",)
@@ -92,10 +102,33 @@ class Tag(models.Model):
         return self.name
 
 
+MAX_TAGS_PER_TASK = 10
+
+
 class Task(models.Model):
 
     class Meta:
         ordering = ("is_completed", "name")
+        indexes = [
+            models.Index(
+                fields=["is_completed", "name"],
+                name="task_status_name_idx",
+            ),
+            models.Index(
+                fields=["project", "is_completed", "name"],
+                name="task_project_status_idx",
+            ),
+            models.Index(
+                fields=["deadline"],
+                condition=models.Q(is_completed=False),
+                name="task_open_deadline_idx",
+            ),
+            models.Index(
+                fields=["priority"],
+                condition=models.Q(is_completed=False),
+                name="task_open_priority_idx",
+            ),
+        ]
 
     class PriorityChoices(models.TextChoices):
         URGENT = "URGENT", "Urgent"
@@ -116,6 +149,7 @@ class Task(models.Model):
         blank=True
     )
     is_completed = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     task_type = models.ForeignKey(
         TaskType,
@@ -142,3 +176,103 @@ class Task(models.Model):
 
     def __str__(self):
         return self.name
+
+
+class TaskSearchDocument(models.Model):
+    task = models.OneToOneField(
+        Task,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="search_document",
+    )
+    name = models.TextField(blank=True)
+    task_type = models.TextField(blank=True)
+    tags = models.TextField(blank=True)
+    description = models.TextField(blank=True)
+
+    def __str__(self):
+        return f"Search document for task #{self.task_id}"
+
+
+class ModelVersion(models.Model):
+    label = models.CharField(max_length=100, unique=True)
+    version = models.PositiveBigIntegerField(default=0)
+    changed_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.label} v{self.version}"
+
+
+class Job(models.Model):
+    class StatusChoices(models.TextChoices):
+        QUEUED = "QUEUED", "Queued"
+        RUNNING = "RUNNING", "Running"
+        DONE = "DONE", "Done"
+        FAILED = "FAILED", "Failed"
+
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(
+        max_length=10,
+        choices=StatusChoices.choices,
+        default=StatusChoices.QUEUED,
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ("run_after", "id")
+        indexes = [
+            models.Index(
+                fields=["status", "run_after"],
+                name="job_status_run_after_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status})"
+
+
+class DeadlineNotice(models.Model):
+    class KindChoices(models.TextChoices):
+        DUE_SOON = "DUE_SOON", "Due soon"
+        OVERDUE = "OVERDUE", "Overdue"
+
+    task = models.ForeignKey(
+        Task,
+        on_delete=models.CASCADE,
+        related_name="deadline_notices"
+    )
+    worker = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="deadline_notices"
+    )
+    kind = models.CharField(max_length=10, choices=KindChoices.choices)
+    deadline = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["task", "worker", "kind", "deadline"],
+                name="deadline_notice_unique",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["worker"],
+                condition=models.Q(sent_at__isnull=True),
+                name="deadline_notice_pending_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()}: {self.task} -> {self.worker}"
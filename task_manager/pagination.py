@@ -0,0 +1,273 @@
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from functools import partial
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+def encode_cursor(data):
+    raw = json.dumps(data, cls=DjangoJSONEncoder, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token):
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursor("Cursor is not valid.")
+    if not isinstance(data, dict):
+        raise InvalidCursor("Cursor is not valid.")
+    return data
+
+
+class KeysetPage(Sequence):
+    def __init__(
+        self,
+        object_list,
+        paginator,
+        next_cursor=None,
+        previous_cursor=None
+    ):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self):
+        return f"<KeysetPage of {len(self.object_list)} object(s)>"
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    """
+    Paginates on the queryset ordering (plus the primary key as a
+    tie-breaker) instead of OFFSET, so every page costs the same and no
+    COUNT(*) is issued. Querysets ordered by something other than plain
+    model fields (e.g. a search rank) fall back to offset cursors.
+    """
+
+    count_limit = 1000
+    # Offset cursors are only used for ranked search results, which nobody
+    # pages this deep into.
+    max_offset = 100_000
+
+    def __init__(self, object_list, per_page, values=None, **kwargs):
+        self.per_page = int(per_page)
+        self.ordering = self._get_keyset_ordering(object_list)
+        if values is not None:
+            # Rows become dicts; the ordering columns are always selected
+            # so that cursors can be built from them.
+            object_list = object_list.values(
+                *dict.fromkeys([*values, *self.key_attnames])
+            )
+        self.object_list = object_list
+
+    @property
+    def is_keyset(self):
+        return self.ordering is not None
+
+    @property
+    def key_attnames(self):
+        if not self.is_keyset:
+            return []
+        return [field.attname for field, _ in self.ordering]
+
+    @staticmethod
+    def _get_keyset_ordering(queryset):
+        query = queryset.query
+        if query.extra_order_by:
+            return None
+
+        opts = queryset.model._meta
+        ordering = list(query.order_by)
+        if not ordering and query.default_ordering:
+            ordering = list(opts.ordering)
+
+        fields = []
+        for name in ordering:
+            if not isinstance(name, str):
+                return None
+            descending = name.startswith("-")
+            name = name.lstrip("-")
+            if name == "pk":
+                name = opts.pk.name
+            try:
+                field = opts.get_field(name)
+            except FieldDoesNotExist:
+                return None
+            if not field.concrete or field.null:
+                return None
+            fields.append((field, descending))
+
+        if not any(field.primary_key for field, _ in fields):
+            fields.append((opts.pk, False))
+        return fields
+
+    def _order_by(self, reverse=False):
+        return [
+            f"{'-' if descending != reverse else ''}{field.attname}"
+            for field, descending in self.ordering
+        ]
+
+    def _values(self, obj):
+        if isinstance(obj, dict):
+            return [obj[attname] for attname in self.key_attnames]
+        return [getattr(obj, attname) for attname in self.key_attnames]
+
+    def _seek(self, values, forward):
+        if (
+            not isinstance(values, list)
+            or len(values) != len(self.ordering)
+        ):
+            raise InvalidCursor("Cursor does not match the list ordering.")
+
+        try:
+            values = [
+                self._clean_value(field, value)
+                for (field, _), value in zip(self.ordering, values)
+            ]
+        except (ValidationError, TypeError, ValueError, OverflowError):
+            raise InvalidCursor("Cursor does not match the list ordering.")
+
+        condition = Q()
+        for index, (field, descending) in enumerate(self.ordering):
+            lookup = "lt" if descending == forward else "gt"
+            step = Q(**{f"{field.attname}__{lookup}": values[index]})
+            for (previous, _), value in zip(self.ordering[:index], values):
+                step &= Q(**{previous.attname: value})
+            condition |= step
+        return condition
+
+    @staticmethod
+    def _clean_value(field, value):
+        if isinstance(value, (dict, list)):
+            raise ValidationError("Cursor values must be scalars.")
+        value = field.to_python(value)
+        field.run_validators(value)
+        return value
+
+    def page(self, cursor=None):
+        queryset, build = self._page_query(cursor)
+        return build(list(queryset))
+
+    async def apage(self, cursor=None):
+        queryset, build = self._page_query(cursor)
+        rows = [
+            row
+            async for row in queryset.aiterator(chunk_size=self.per_page + 1)
+        ]
+        return build(rows)
+
+    def _page_query(self, cursor):
+        # Returns the queryset of the page, with one extra row that tells
+        # whether there is a next page, and the function building the page
+        # from its rows, so that sync and async pages share everything but
+        # the fetch.
+        data = decode_cursor(cursor) if cursor else {}
+        if self.is_keyset:
+            return self._keyset_query(data)
+        return self._offset_query(data)
+
+    def _keyset_query(self, data):
+        values = data.get("k")
+        forward = data.get("d", "n") != "p"
+        queryset = self.object_list.order_by(
+            *self._order_by(reverse=not forward)
+        )
+        if values is not None:
+            queryset = queryset.filter(self._seek(values, forward))
+        return (
+            queryset[:self.per_page + 1],
+            partial(self._keyset_page, forward, values is not None),
+        )
+
+    def _keyset_page(self, forward, seeking, rows):
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if not forward:
+            rows.reverse()
+
+        has_next = has_more if forward else True
+        has_previous = seeking if forward else has_more
+
+        next_cursor = previous_cursor = None
+        if rows and has_next:
+            next_cursor = encode_cursor({"k": self._values(rows[-1])})
+        if rows and has_previous:
+            previous_cursor = encode_cursor(
+                {"k": self._values(rows[0]), "d": "p"}
+            )
+        return KeysetPage(rows, self, next_cursor, previous_cursor)
+
+    def _offset_query(self, data):
+        offset = data.get("o", 0)
+        if (
+            not isinstance(offset, int)
+            or isinstance(offset, bool)
+            or not 0 <= offset <= self.max_offset
+        ):
+            raise InvalidCursor("Cursor offset is not valid.")
+        return (
+            self.object_list[offset:offset + self.per_page + 1],
+            partial(self._offset_page, offset),
+        )
+
+    def _offset_page(self, offset, rows):
+        has_next = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        next_cursor = previous_cursor = None
+        if has_next:
+            next_cursor = encode_cursor({"o": offset + self.per_page})
+        if offset > 0:
+            previous_cursor = encode_cursor(
+                {"o": max(offset - self.per_page, 0)}
+            )
+        return KeysetPage(rows, self, next_cursor, previous_cursor)
+
+    @cached_property
+    def approximate_count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == "postgresql":
+            sql, params = queryset.query.sql_with_params()
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+        return queryset.order_by()[:self.count_limit].count()
+
+    @cached_property
+    def approximate_count_is_capped(self):
+        vendor = connections[self.object_list.db].vendor
+        return (
+            vendor != "postgresql"
+            and self.approximate_count >= self.count_limit
+        )
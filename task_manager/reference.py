@@ -0,0 +1,128 @@
+from collections import defaultdict
+from dataclasses import dataclass
+
+from django import forms
+from django.db import DEFAULT_DB_ALIAS
+from django.forms.models import ModelChoiceIterator
+
+from task_manager.models import Position, Tag, Task, TaskType
+from task_manager.versions import get_row_versions
+
+
+REFERENCE_MODELS = (Position, TaskType, Tag)
+
+
+@dataclass(frozen=True)
+class ReferenceTable:
+    version: tuple
+    objects: tuple
+    by_id: dict
+    positions: dict
+
+
+# Process-local snapshots keyed by model label. A snapshot is reused for
+# as long as the shared row version of its model is unchanged, so a save
+# or delete in any process invalidates it everywhere, while retagging
+# tasks does not. The cached
+# instances are shared between requests and must be treated as read-only.
+_tables = {}
+
+
+def reference_tables(*models):
+    versions = get_row_versions(*models)
+    tables = {}
+    for model in models:
+        label = model._meta.label_lower
+        table = _tables.get(label)
+        if table is None or table.version != versions[label]:
+            objects = tuple(model.objects.using(DEFAULT_DB_ALIAS))
+            table = ReferenceTable(
+                version=versions[label],
+                objects=objects,
+                by_id={obj.pk: obj for obj in objects},
+                positions={obj.pk: index for index, obj in enumerate(objects)},
+            )
+            _tables[label] = table
+        tables[model] = table
+    return tables
+
+
+def reference_table(model):
+    return reference_tables(model)[model]
+
+
+def get_reference_or_none(model, pk):
+    return reference_table(model).by_id.get(pk)
+
+
+def _attach_foreign_key(objects, field, table):
+    for obj in objects:
+        related = table.by_id.get(getattr(obj, field.attname))
+        if related is not None:
+            field.set_cached_value(obj, related)
+
+
+def attach_references(objects, *field_names):
+    objects = list(objects)
+    if not objects:
+        return objects
+    meta = type(objects[0])._meta
+    fields = [meta.get_field(name) for name in field_names]
+    tables = reference_tables(*(field.related_model for field in fields))
+    for field in fields:
+        _attach_foreign_key(objects, field, tables[field.related_model])
+    return objects
+
+
+def attach_task_references(tasks):
+    """
+    Fill task.task_type and task.tag_list from the reference tables, so
+    task lists no longer join task types or tags.
+    """
+    tasks = list(tasks)
+    if not tasks:
+        return tasks
+    tables = reference_tables(TaskType, Tag)
+    _attach_foreign_key(
+        tasks,
+        Task._meta.get_field("task_type"),
+        tables[TaskType]
+    )
+
+    tags = tables[Tag]
+    tag_ids = defaultdict(list)
+    assignments = Task.tags.through.objects.filter(
+        task_id__in=[task.pk for task in tasks]
+    ).values_list("task_id", "tag_id")
+    for task_id, tag_id in assignments:
+        if tag_id in tags.by_id:
+            tag_ids[task_id].append(tag_id)
+    for task in tasks:
+        task.tag_list = [
+            tags.by_id[tag_id]
+            for tag_id in sorted(tag_ids[task.pk], key=tags.positions.get)
+        ]
+    return tasks
+
+
+class ReferenceChoiceIterator(ModelChoiceIterator):
+    # Only valid for fields whose queryset is the unfiltered table.
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for obj in reference_table(self.queryset.model).objects:
+            yield self.choice(obj)
+
+    def __len__(self):
+        return (
+            len(reference_table(self.queryset.model).objects)
+            + (self.field.empty_label is not None)
+        )
+
+
+class ReferenceChoiceField(forms.ModelChoiceField):
+    iterator = ReferenceChoiceIterator
+
+
+class ReferenceMultipleChoiceField(forms.ModelMultipleChoiceField):
+    iterator = ReferenceChoiceIterator
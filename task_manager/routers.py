@@ -0,0 +1,127 @@
+import itertools
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds since the last replayed transaction, or 0 while the replica has
+# replayed everything it received (an idle primary writes no transactions).
+POSTGRES_LAG_SQL = """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+"""
+
+
+class ReplicaState:
+    def __init__(self, pinned=False):
+        self.pinned = pinned
+        self.wrote = False
+        self.replica = None
+
+
+_replica_state = ContextVar("replica_state", default=None)
+
+
+@contextmanager
+def replica_reads(pinned=False):
+    """
+    Allow reads inside the block to go to the replicas, unless `pinned`.
+    Reads are pinned to the primary as soon as the block writes anything.
+    """
+    state = ReplicaState(pinned)
+    token = _replica_state.set(state)
+    try:
+        yield state
+    finally:
+        _replica_state.reset(token)
+
+
+def measure_replica_lag(alias):
+    connection = connections[alias]
+    if connection.vendor != "postgresql":
+        return 0.0
+    with connection.cursor() as cursor:
+        cursor.execute(POSTGRES_LAG_SQL)
+        lag = cursor.fetchone()[0]
+    return float(lag or 0)
+
+
+class ReplicaRouter:
+    """
+    Sends reads made inside `replica_reads()` (every request, see
+    ReplicaPinningMiddleware) to one of settings.DATABASE_REPLICAS, chosen
+    round-robin per block so all reads of a request see the same state.
+    Writes, select_for_update() and reads after a write go to the
+    primary. A replica that lags more than DATABASE_REPLICA_MAX_LAG seconds
+    or fails its check is skipped until the next check. Reads that fill
+    process-wide or shared caches use the primary explicitly.
+    """
+
+    def __init__(self):
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._checked = {}
+
+    def is_available(self, alias):
+        now = monotonic()
+        with self._lock:
+            checked = self._checked.get(alias)
+        if (
+            checked is not None
+            and now - checked[0] < settings.DATABASE_REPLICA_CHECK_INTERVAL
+        ):
+            return checked[1]
+
+        try:
+            lag = self.measure_lag(alias)
+        except DatabaseError as error:
+            logger.warning("Replica %s is unavailable: %s", alias, error)
+            available = False
+        else:
+            available = lag <= settings.DATABASE_REPLICA_MAX_LAG
+            if not available:
+                logger.warning("Replica %s lags %.1f s", alias, lag)
+
+        with self._lock:
+            self._checked[alias] = (now, available)
+        return available
+
+    def measure_lag(self, alias):
+        return measure_replica_lag(alias)
+
+    def db_for_read(self, model, **hints):
+        state = _replica_state.get()
+        if state is None or state.pinned or not settings.DATABASE_REPLICAS:
+            return None
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db:
+            return None
+
+        if state.replica is None:
+            replicas = [
+                alias for alias in settings.DATABASE_REPLICAS
+                if self.is_available(alias)
+            ] or [DEFAULT_DB_ALIAS]
+            state.replica = replicas[next(self._counter) % len(replicas)]
+        return state.replica
+
+    def db_for_write(self, model, **hints):
+        state = _replica_state.get()
+        if state is not None:
+            state.pinned = state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
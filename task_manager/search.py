@@ -0,0 +1,133 @@
+import re
+
+from django.db import connections
+from django.db.models import Q
+
+from task_manager.models import Task, TaskSearchDocument
+
+
+DOCUMENT_TABLE = TaskSearchDocument._meta.db_table
+FTS_TABLE = f"{DOCUMENT_TABLE}_fts"
+TASK_TABLE = Task._meta.db_table
+
+DOCUMENT_FIELDS = ("name", "task_type", "tags", "description")
+REFRESH_BATCH_SIZE = 500
+
+# Relative weight of each document column when the engine ranks matches,
+# so that a hit in the task name outranks a hit in its type, tags or text.
+SQLITE_RANK = f"bm25({FTS_TABLE}, 10.0, 5.0, 3.0, 1.0)"
+POSTGRES_VECTOR = (
+    f"(setweight(to_tsvector('simple', {DOCUMENT_TABLE}.name), 'A') || "
+    f"setweight(to_tsvector('simple', {DOCUMENT_TABLE}.task_type), 'B') || "
+    f"setweight(to_tsvector('simple', {DOCUMENT_TABLE}.tags), 'C') || "
+    f"setweight(to_tsvector('simple', {DOCUMENT_TABLE}.description), 'D'))"
+)
+
+
+def build_search_document(task, tag_names=None):
+    if tag_names is None:
+        tag_names = [tag.name for tag in task.tags.all()]
+    return TaskSearchDocument(
+        task_id=task.pk,
+        name=task.name,
+        task_type=task.task_type.name if task.task_type else "",
+        tags=" ".join(tag_names),
+        description=task.description,
+    )
+
+
+def refresh_search_documents(task_ids=None):
+    if task_ids is None:
+        return _refresh(Task.objects.all())
+
+    task_ids = list(task_ids)
+    refreshed = 0
+    for start in range(0, len(task_ids), REFRESH_BATCH_SIZE):
+        refreshed += _refresh(
+            Task.objects.filter(
+                pk__in=task_ids[start:start + REFRESH_BATCH_SIZE]
+            )
+        )
+    return refreshed
+
+
+def _refresh(tasks):
+    tasks = (
+        tasks
+        .select_related("task_type")
+        .prefetch_related("tags")
+        .order_by("pk")
+    )
+    refreshed = 0
+    batch = []
+    for task in tasks.iterator(chunk_size=REFRESH_BATCH_SIZE):
+        batch.append(build_search_document(task))
+        if len(batch) >= REFRESH_BATCH_SIZE:
+            refreshed += _save_documents(batch)
+            batch = []
+    if batch:
+        refreshed += _save_documents(batch)
+    return refreshed
+
+
+def _save_documents(documents):
+    TaskSearchDocument.objects.bulk_create(
+        documents,
+        update_conflicts=True,
+        unique_fields=["task"],
+        update_fields=list(DOCUMENT_FIELDS),
+    )
+    return len(documents)
+
+
+def _search_terms(query):
+    return re.findall(r"\w+", query.lower())
+
+
+def search_tasks(queryset, query):
+    terms = _search_terms(query)
+    if not terms:
+        return queryset
+
+    vendor = connections[queryset.db].vendor
+
+    if vendor == "sqlite":
+        return queryset.extra(
+            select={"search_rank": SQLITE_RANK},
+            tables=[FTS_TABLE],
+            where=[
+                f"{FTS_TABLE}.rowid = {TASK_TABLE}.id",
+                f"{FTS_TABLE} MATCH %s",
+            ],
+            params=[" ".join(f"{term}*" for term in terms)],
+            order_by=["search_rank", "name"],
+        )
+
+    if vendor == "postgresql":
+        ts_query = " & ".join(f"{term}:*" for term in terms)
+        return queryset.extra(
+            select={
+                "search_rank": (
+                    f"ts_rank({POSTGRES_VECTOR}, "
+                    f"to_tsquery('simple', %s))"
+                )
+            },
+            select_params=[ts_query],
+            tables=[DOCUMENT_TABLE],
+            where=[
+                f"{DOCUMENT_TABLE}.task_id = {TASK_TABLE}.id",
+                f"{POSTGRES_VECTOR} @@ to_tsquery('simple', %s)",
+            ],
+            params=[ts_query],
+            order_by=["-search_rank", "name"],
+        )
+
+    condition = Q()
+    for term in terms:
+        term_condition = Q()
+        for field in DOCUMENT_FIELDS:
+            term_condition |= Q(
+                **{f"search_document__{field}__icontains": term}
+            )
+        condition &= term_condition
+    return queryset.filter(condition).order_by("name")
@@ -0,0 +1,323 @@
+from django.db.models.signals import (
+    pre_save,
+    post_save,
+    pre_delete,
+    post_delete,
+    m2m_changed,
+)
+from django.dispatch import receiver
+
+from task_manager.models import (
+    Task,
+    Tag,
+    TaskType,
+    Team,
+    Worker,
+    Position,
+    Project,
+)
+from task_manager.auth import forget_cached_users
+from task_manager.counters import adjust_count, recount
+from task_manager.fragments import touch
+from task_manager.membership import (
+    invalidate_user_team_ids,
+    forget_user_team_ids,
+)
+from task_manager.search import refresh_search_documents
+from task_manager.stats import invalidate_dashboard_stats
+from task_manager.versions import bump_row_versions, bump_versions
+
+
+SEARCH_FIELDS = {"name", "description", "task_type", "task_type_id"}
+
+# Model -> (model holding its counter, foreign key column pointing at it).
+COUNTED_PARENTS = {
+    Task: (Project, "project_id"),
+    Worker: (Position, "position_id"),
+}
+UNTRACKED = object()
+
+
+@receiver(post_save, sender=Task)
+def index_saved_task(sender, instance, raw, update_fields, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and not SEARCH_FIELDS & set(update_fields):
+        return
+    refresh_search_documents([instance.pk])
+
+
+@receiver(m2m_changed, sender=Task.tags.through)
+def index_retagged_tasks(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            refresh_search_documents([instance.pk])
+        return
+
+    if action == "pre_clear":
+        instance._search_task_ids = list(
+            instance.tasks.values_list("id", flat=True)
+        )
+    elif action == "post_clear":
+        refresh_search_documents(getattr(instance, "_search_task_ids", []))
+    elif action in ("post_add", "post_remove"):
+        refresh_search_documents(pk_set)
+
+
+@receiver(post_save, sender=Tag)
+def index_renamed_tag(sender, instance, created, raw, **kwargs):
+    if raw or created:
+        return
+    refresh_search_documents(instance.tasks.values_list("id", flat=True))
+
+
+@receiver(post_save, sender=TaskType)
+def index_renamed_task_type(sender, instance, created, raw, **kwargs):
+    if raw or created:
+        return
+    refresh_search_documents(
+        Task.objects.filter(task_type=instance).values_list("id", flat=True)
+    )
+
+
+@receiver(pre_delete, sender=Tag)
+@receiver(pre_delete, sender=TaskType)
+def remember_indexed_tasks(sender, instance, **kwargs):
+    if sender is Tag:
+        tasks = instance.tasks.all()
+    else:
+        tasks = Task.objects.filter(task_type=instance)
+    instance._search_task_ids = list(tasks.values_list("id", flat=True))
+
+
+@receiver(post_delete, sender=Tag)
+@receiver(post_delete, sender=TaskType)
+def index_tasks_of_deleted_lookup(sender, instance, **kwargs):
+    task_ids = getattr(instance, "_search_task_ids", [])
+    refresh_search_documents(task_ids)
+    touch(Task, task_ids)
+
+
+@receiver(post_save, sender=Team)
+@receiver(post_save, sender=Worker)
+@receiver(post_save, sender=Position)
+@receiver(post_save, sender=Project)
+def invalidate_stats_on_create(sender, created, **kwargs):
+    if created:
+        invalidate_dashboard_stats()
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=Team)
+@receiver(post_delete, sender=Worker)
+@receiver(post_delete, sender=Position)
+@receiver(post_delete, sender=Project)
+def invalidate_stats_on_change(sender, **kwargs):
+    invalidate_dashboard_stats()
+
+
+@receiver(m2m_changed, sender=Team.members.through)
+def invalidate_changed_memberships(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            forget_user_team_ids(instance)
+        return
+
+    if action == "pre_clear":
+        instance._member_ids = list(
+            instance.members.values_list("id", flat=True)
+        )
+    elif action == "post_clear":
+        invalidate_user_team_ids(getattr(instance, "_member_ids", []))
+    elif action in ("post_add", "post_remove"):
+        invalidate_user_team_ids(pk_set)
+
+
+@receiver(pre_delete, sender=Team)
+def remember_team_members(sender, instance, **kwargs):
+    instance._member_ids = list(
+        instance.members.values_list("id", flat=True)
+    )
+
+
+@receiver(post_delete, sender=Team)
+def invalidate_deleted_team_memberships(sender, instance, **kwargs):
+    invalidate_user_team_ids(getattr(instance, "_member_ids", []))
+
+
+@receiver(m2m_changed, sender=Team.members.through)
+def update_team_members(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            recount(Team, [instance.pk])
+            touch(Team, [instance.pk])
+        return
+
+    if action == "pre_clear":
+        instance._counted_team_ids = list(
+            instance.teams.values_list("id", flat=True)
+        )
+        return
+
+    team_ids = pk_set
+    if action == "post_clear":
+        team_ids = getattr(instance, "_counted_team_ids", [])
+    elif action not in ("post_add", "post_remove"):
+        return
+    recount(Team, team_ids)
+    touch(Team, team_ids)
+
+
+@receiver(pre_save, sender=Task)
+@receiver(pre_save, sender=Worker)
+def remember_counted_parent(sender, instance, raw, update_fields, **kwargs):
+    _, attname = COUNTED_PARENTS[sender]
+    if raw or instance.pk is None:
+        return
+    if update_fields is not None and not {
+        attname, attname.removesuffix("_id")
+    } & set(update_fields):
+        return
+    instance._counted_parent_id = (
+        sender._base_manager
+        .filter(pk=instance.pk)
+        .values_list(attname, flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=Worker)
+def count_saved_child(sender, instance, created, raw, **kwargs):
+    parent, attname = COUNTED_PARENTS[sender]
+    old_parent_id = instance.__dict__.pop("_counted_parent_id", UNTRACKED)
+    if raw:
+        return
+
+    parent_id = getattr(instance, attname)
+    if created:
+        adjust_count(parent, parent_id, 1)
+    elif old_parent_id is not UNTRACKED and old_parent_id != parent_id:
+        adjust_count(parent, old_parent_id, -1)
+        adjust_count(parent, parent_id, 1)
+
+
+@receiver(pre_delete, sender=Project)
+@receiver(pre_delete, sender=Position)
+def remember_deleted_parent(sender, instance, origin=None, **kwargs):
+    # pre_delete runs for the whole cascade before anything is deleted, so
+    # children deleted along with their parent can skip its counter.
+    if origin is not None:
+        origin.__dict__.setdefault("_deleted_parents", set()).add(
+            (sender, instance.pk)
+        )
+
+
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=Worker)
+def count_deleted_child(sender, instance, origin=None, **kwargs):
+    parent, attname = COUNTED_PARENTS[sender]
+    parent_id = getattr(instance, attname)
+    if (parent, parent_id) in getattr(origin, "_deleted_parents", ()):
+        return
+    adjust_count(parent, parent_id, -1)
+
+
+@receiver(pre_delete, sender=Worker)
+def remember_worker_relations(sender, instance, **kwargs):
+    instance._counted_team_ids = list(
+        instance.teams.values_list("id", flat=True)
+    )
+    instance._touched_task_ids = list(
+        instance.tasks.values_list("id", flat=True)
+    )
+
+
+@receiver(post_delete, sender=Worker)
+def update_deleted_worker_relations(sender, instance, **kwargs):
+    # Memberships and assignments are removed by the delete cascade,
+    # which does not send m2m_changed.
+    team_ids = getattr(instance, "_counted_team_ids", [])
+    recount(Team, team_ids)
+    touch(Team, team_ids)
+    touch(Task, getattr(instance, "_touched_task_ids", []))
+
+
+@receiver(m2m_changed, sender=Task.tags.through)
+@receiver(m2m_changed, sender=Task.assignees.through)
+def touch_changed_tasks(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            touch(Task, [instance.pk])
+        return
+
+    if action == "pre_clear":
+        instance._touched_task_ids = list(
+            instance.tasks.values_list("id", flat=True)
+        )
+    elif action == "post_clear":
+        touch(Task, getattr(instance, "_touched_task_ids", []))
+    elif action in ("post_add", "post_remove"):
+        touch(Task, pk_set)
+
+
+@receiver(post_save, sender=Position)
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=Tag)
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=TaskType)
+@receiver(post_save, sender=Team)
+@receiver(post_save, sender=Worker)
+@receiver(post_delete, sender=Position)
+@receiver(post_delete, sender=Project)
+@receiver(post_delete, sender=Tag)
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=TaskType)
+@receiver(post_delete, sender=Team)
+@receiver(post_delete, sender=Worker)
+def bump_changed_model_version(sender, update_fields=None, **kwargs):
+    # Logging in only stamps last_login, which no page renders.
+    if update_fields is not None and set(update_fields) == {"last_login"}:
+        return
+    bump_versions(sender)
+
+
+@receiver(post_save, sender=Position)
+@receiver(post_save, sender=Tag)
+@receiver(post_save, sender=TaskType)
+@receiver(post_delete, sender=Position)
+@receiver(post_delete, sender=Tag)
+@receiver(post_delete, sender=TaskType)
+def bump_changed_reference_rows(sender, **kwargs):
+    bump_row_versions(sender)
+
+
+@receiver(m2m_changed, sender=Task.tags.through)
+@receiver(m2m_changed, sender=Task.assignees.through)
+@receiver(m2m_changed, sender=Team.members.through)
+def bump_related_model_versions(sender, action, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if sender is Team.members.through:
+        bump_versions(Team, Worker)
+    elif sender is Task.assignees.through:
+        bump_versions(Task, Worker)
+    else:
+        bump_versions(Task, Tag)
+
+
+@receiver(post_save, sender=Worker)
+@receiver(post_delete, sender=Worker)
+def forget_changed_worker(sender, instance, **kwargs):
+    forget_cached_users([instance.pk])
+
+
+@receiver(post_save, sender=Position)
+@receiver(pre_delete, sender=Position)
+def forget_workers_of_changed_position(sender, instance, **kwargs):
+    forget_cached_users(instance.workers.values_list("pk", flat=True))
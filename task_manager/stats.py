@@ -0,0 +1,92 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
+
+from task_manager.models import Task, Project, Worker, Team, Position
+
+
+STATS_CACHE_KEY = "task_manager:dashboard-stats"
+
+
+def _table(model):
+    return connection.ops.quote_name(model._meta.db_table)
+
+
+def compute_dashboard_stats():
+    priorities = list(Task.PriorityChoices)
+    priority_columns = ", ".join(
+        "COUNT(CASE WHEN priority = %s THEN 1 END)" for _ in priorities
+    )
+    sql = (
+        f"SELECT "
+        f"(SELECT COUNT(*) FROM {_table(Team)}), "
+        f"(SELECT COUNT(*) FROM {_table(Worker)}), "
+        f"(SELECT COUNT(*) FROM {_table(Position)}), "
+        f"(SELECT COUNT(*) FROM {_table(Project)}), "
+        f"COUNT(*), "
+        f"COUNT(CASE WHEN is_completed = %s THEN 1 END), "
+        f"COUNT(CASE WHEN is_completed = %s AND deadline < %s THEN 1 END), "
+        f"{priority_columns} "
+        f"FROM {_table(Task)}"
+    )
+    params = [True, False, timezone.now(), *[p.value for p in priorities]]
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        row = cursor.fetchone()
+
+    (
+        num_teams,
+        num_workers,
+        num_positions,
+        num_projects,
+        num_tasks,
+        num_completed_tasks,
+        num_overdue_tasks,
+        *priority_counts,
+    ) = row
+
+    return {
+        "num_teams": num_teams,
+        "num_workers": num_workers,
+        "num_positions": num_positions,
+        "num_projects": num_projects,
+        "num_tasks": num_tasks,
+        "num_open_tasks": num_tasks - num_completed_tasks,
+        "num_completed_tasks": num_completed_tasks,
+        "num_overdue_tasks": num_overdue_tasks,
+        "tasks_by_priority": [
+            (priority.label, count)
+            for priority, count in zip(priorities, priority_counts)
+        ],
+    }
+
+
+def get_dashboard_stats():
+    stats = cache.get(STATS_CACHE_KEY)
+    if stats is None:
+        stats = compute_dashboard_stats()
+        cache.set(
+            STATS_CACHE_KEY,
+            stats,
+            settings.DASHBOARD_STATS_CACHE_TIMEOUT
+        )
+    return stats
+
+
+async def aget_dashboard_stats():
+    stats = await cache.aget(STATS_CACHE_KEY)
+    if stats is None:
+        stats = await sync_to_async(compute_dashboard_stats)()
+        await cache.aset(
+            STATS_CACHE_KEY,
+            stats,
+            settings.DASHBOARD_STATS_CACHE_TIMEOUT
+        )
+    return stats
+
+
+def invalidate_dashboard_stats():
+    cache.delete(STATS_CACHE_KEY)
@@ -0,0 +1,11 @@
+from django import template
+
+from task_manager.fragments import fragment_version
+
+
+register = template.Library()
+
+
+@register.simple_tag
+def cache_version(*objects):
+    return fragment_version(*objects)
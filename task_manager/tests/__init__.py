@@ -0,0 +1,16 @@
+import atexit
+import shutil
+import tempfile
+
+
+# A cache shared between processes, for tests of data that is only cached
+# when cache_is_shared(). Each test run gets its own directory.
+SHARED_CACHE_DIR = tempfile.mkdtemp(prefix="task-manager-tests-")
+atexit.register(shutil.rmtree, SHARED_CACHE_DIR, ignore_errors=True)
+
+SHARED_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": SHARED_CACHE_DIR,
+    },
+}
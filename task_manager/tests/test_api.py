@@ -0,0 +1,192 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.models import Team, Project, Task, Tag, TaskType, Position
+
+User = get_user_model()
+
+
+def api_url(resource, pk=None):
+    if pk is None:
+        return reverse("task-manager:api-list", kwargs={"resource": resource})
+    return reverse(
+        "task-manager:api-detail",
+        kwargs={"resource": resource, "pk": pk}
+    )
+
+
+class ApiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
+        cls.member = User.objects.create_user(
+            username="member",
+            password="pass12345",
+            position=cls.position
+        )
+        cls.other = User.objects.create_user(
+            username="other",
+            password="pass12345"
+        )
+        cls.team = Team.objects.create(name="Team")
+        cls.team.members.add(cls.member, cls.other)
+        cls.project = Project.objects.create(name="Project", team=cls.team)
+        cls.tag = Tag.objects.create(name="backend")
+        cls.task_type = TaskType.objects.create(name="Bug")
+
+    def setUp(self):
+        self.client.force_login(self.member)
+
+    def create_tasks(self, count):
+        tasks = []
+        for index in range(count):
+            task = Task.objects.create(
+                name=f"Task {index:02}",
+                project=self.project,
+                task_type=self.task_type
+            )
+            task.tags.add(self.tag)
+            task.assignees.add(self.member, self.other)
+            tasks.append(task)
+        return tasks
+
+    def get(self, url, status_code=200, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status_code)
+        return response.json()
+
+    def test_requires_login(self):
+        self.client.logout()
+
+        self.get(api_url("tasks"), status_code=403)
+
+    def test_unknown_resource(self):
+        self.get(api_url("secrets"), status_code=404)
+
+    def test_list_uses_list_view_queryset(self):
+        self.create_tasks(1)
+
+        data = self.get(api_url("tasks"))
+
+        self.assertEqual(data["results"], [{
+            "id": Task.objects.get().pk,
+            "name": "Task 00",
+            "description": "",
+            "priority": "MEDIUM",
+            "deadline": None,
+            "is_completed": False,
+            "task_type": self.task_type.pk,
+            "project": self.project.pk,
+            "assignee_count": 2,
+        }])
+        self.assertIsNone(data["next"])
+
+    def test_sparse_fields(self):
+        data = self.get(api_url("workers"), fields="username")
+
+        self.assertEqual(data["results"], [
+            {"id": self.member.pk, "username": "member"},
+            {"id": self.other.pk, "username": "other"},
+        ])
+
+    def test_unknown_field_is_rejected(self):
+        data = self.get(api_url("workers"), 400, fields="password")
+
+        self.assertIn("password", data["error"])
+
+    def test_invalid_limit_is_rejected(self):
+        for limit in ("0", "501", "abc", "\u00b2", "-1"):
+            with self.subTest(limit=limit):
+                data = self.get(api_url("tasks"), 400, limit=limit)
+                self.assertIn("limit", data["error"])
+
+    def test_cursor_pagination(self):
+        self.create_tasks(5)
+        url = api_url("tasks")
+
+        names = []
+        params = {"limit": 2, "fields": "name"}
+        while url:
+            data = self.client.get(url, params).json()
+            names.extend(row["name"] for row in data["results"])
+            url, params = data["next"], {}
+
+        self.assertEqual(names, [f"Task {index:02}" for index in range(5)])
+
+    def test_search_reuses_list_view_filters(self):
+        self.create_tasks(2)
+
+        data = self.get(api_url("tasks"), name="01", fields="name")
+
+        self.assertEqual(
+            [row["name"] for row in data["results"]],
+            ["Task 01"]
+        )
+
+    def test_includes_use_one_query_per_relation(self):
+        def count_queries(params):
+            with CaptureQueriesContext(connection) as queries:
+                self.get(api_url("tasks"), **params)
+            return len(queries)
+
+        self.create_tasks(1)
+        params = {"include": "project,task_type,tags,assignees"}
+        count_queries({})
+        baseline = count_queries({})
+        single_row = count_queries(params)
+
+        self.create_tasks(4)
+        self.assertEqual(count_queries(params), single_row)
+        self.assertEqual(single_row, baseline + 4)
+
+    def test_included_objects(self):
+        task = self.create_tasks(1)[0]
+
+        data = self.get(
+            api_url("tasks", task.pk),
+            fields="name",
+            include="project,assignees",
+            **{"fields[workers]": "username"}
+        )
+
+        self.assertEqual(data, {
+            "id": task.pk,
+            "name": "Task 00",
+            "project": {
+                "id": self.project.pk,
+                "name": "Project",
+                "description": "",
+                "team": self.team.pk,
+                "task_count": 1,
+            },
+            "assignees": [
+                {"id": self.member.pk, "username": "member"},
+                {"id": self.other.pk, "username": "other"},
+            ],
+        })
+
+    def test_team_includes(self):
+        data = self.get(
+            api_url("teams", self.team.pk),
+            include="members,projects",
+            **{"fields[workers]": "username", "fields[projects]": "name"}
+        )
+
+        self.assertEqual(data["member_count"], 2)
+        self.assertEqual(
+            [member["username"] for member in data["members"]],
+            ["member", "other"]
+        )
+        self.assertEqual(
+            data["projects"],
+            [{"id": self.project.pk, "name": "Project"}]
+        )
+
+    def test_unknown_include_is_rejected(self):
+        self.get(api_url("tags"), 400, include="tasks")
+
+    def test_missing_object(self):
+        self.get(api_url("projects", 0), status_code=404)
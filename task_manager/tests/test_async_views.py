@@ -0,0 +1,138 @@
+import re
+
+from asgiref.sync import iscoroutinefunction
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import TestCase, modify_settings, override_settings
+from django.urls import resolve, reverse
+
+from task_manager.middleware import (
+    DatabaseUnavailableMiddleware,
+    ReplicaPinningMiddleware,
+    RequestMetricsMiddleware,
+)
+from task_manager.models import Team, Project, Task
+
+User = get_user_model()
+
+ASYNC_VIEWS = (
+    ("index", False),
+    ("task-list", False),
+    ("project-list", False),
+    ("user-project-list", False),
+    ("team-list", False),
+    ("user-team-list", False),
+    ("task-detail", True),
+    ("project-detail", True),
+    ("team-detail", True),
+)
+
+
+# WhiteNoise is sync-only and would run the whole chain in a thread.
+@modify_settings(MIDDLEWARE={
+    "remove": "whitenoise.middleware.WhiteNoiseMiddleware",
+})
+class AsyncViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.user = User.objects.create_user(
+                username="member",
+                password="pass12345"
+            )
+            cls.team = Team.objects.create(name="Team")
+            cls.team.members.add(cls.user)
+            cls.project = Project.objects.create(
+                name="Project", team=cls.team
+            )
+            cls.task = Task.objects.create(
+                name="Async task", project=cls.project
+            )
+        cls.pks = {
+            "task-detail": cls.task.pk,
+            "project-detail": cls.project.pk,
+            "team-detail": cls.team.pk,
+        }
+
+    def url(self, name, detail=False):
+        kwargs = {"pk": self.pks[name]} if detail else {}
+        return reverse(f"task-manager:{name}", kwargs=kwargs)
+
+    def test_read_views_are_async(self):
+        for name, detail in ASYNC_VIEWS:
+            with self.subTest(view=name):
+                view = resolve(self.url(name, detail)).func
+                self.assertTrue(iscoroutinefunction(view))
+
+    def test_middleware_follows_the_handler_mode(self):
+        async def async_view(request):
+            return HttpResponse()
+
+        def sync_view(request):
+            return HttpResponse()
+
+        for middleware in (
+            RequestMetricsMiddleware,
+            DatabaseUnavailableMiddleware,
+            ReplicaPinningMiddleware,
+        ):
+            with self.subTest(middleware=middleware.__name__):
+                self.assertTrue(iscoroutinefunction(middleware(async_view)))
+                self.assertFalse(iscoroutinefunction(middleware(sync_view)))
+
+    async def test_pages_render(self):
+        await self.async_client.aforce_login(self.user)
+
+        for name, detail in ASYNC_VIEWS:
+            with self.subTest(view=name):
+                response = await self.async_client.get(self.url(name, detail))
+                self.assertEqual(response.status_code, 200)
+
+        response = await self.async_client.get(self.url("task-list"))
+        self.assertContains(response, "Async task")
+
+    async def test_unchanged_page_is_not_modified(self):
+        await self.async_client.aforce_login(self.user)
+        # Pick up the CSRF cookie, which is part of the validator.
+        await self.async_client.get(self.url("index"))
+
+        for name in ("task-list", "task-detail"):
+            with self.subTest(view=name):
+                url = self.url(name, name == "task-detail")
+                etag = (await self.async_client.get(url))["ETag"]
+
+                response = await self.async_client.get(
+                    url, headers={"if-none-match": etag}
+                )
+
+                self.assertEqual(response.status_code, 304)
+
+    async def test_anonymous_user_is_redirected_to_login(self):
+        for name, detail in ASYNC_VIEWS:
+            with self.subTest(view=name):
+                response = await self.async_client.get(self.url(name, detail))
+                self.assertEqual(response.status_code, 302)
+                self.assertIn(reverse("login"), response["Location"])
+
+    async def test_missing_object_and_invalid_cursor_return_404(self):
+        await self.async_client.aforce_login(self.user)
+
+        for url in (
+            reverse("task-manager:task-detail", kwargs={"pk": 0}),
+            reverse("task-manager:team-detail", kwargs={"pk": 0}),
+            self.url("task-list") + "?cursor=not-a-cursor",
+        ):
+            with self.subTest(url=url):
+                response = await self.async_client.get(url)
+                self.assertEqual(response.status_code, 404)
+
+    @override_settings(REQUEST_METRICS_SERVER_TIMING=True)
+    async def test_queries_of_async_views_are_counted(self):
+        await self.async_client.aforce_login(self.user)
+
+        response = await self.async_client.get(self.url("task-list"))
+
+        queries = re.search(
+            r'desc="(\d+) queries"', response["Server-Timing"]
+        )
+        self.assertGreater(int(queries.group(1)), 0)
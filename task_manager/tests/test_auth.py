@@ -0,0 +1,142 @@
+from datetime import timedelta
+from importlib import import_module
+from io import StringIO
+
+from django.conf import settings
+from django.contrib.auth import get_user, get_user_model
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+
+from task_manager.models import Position
+from task_manager.tests import SHARED_CACHES
+
+User = get_user_model()
+
+
+@override_settings(
+    CACHES=SHARED_CACHES,
+    SESSION_ENGINE="django.contrib.sessions.backends.cached_db",
+)
+class CachedAuthenticationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
+        cls.member = User.objects.create_user(
+            username="member",
+            password="pass12345",
+            position=cls.position
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.member)
+        self.session_key = self.client.session.session_key
+
+    def tearDown(self):
+        cache.clear()
+
+    def request_user(self):
+        request = RequestFactory().get("/")
+        request.session = import_module(
+            settings.SESSION_ENGINE
+        ).SessionStore(self.session_key)
+        return get_user(request)
+
+    def test_warm_auth_path_runs_no_queries(self):
+        self.request_user()
+
+        with self.assertNumQueries(0):
+            user = self.request_user()
+            self.assertEqual(user, self.member)
+            self.assertEqual(user.position.name, "Developer")
+
+    def test_saved_worker_is_reloaded(self):
+        self.request_user()
+
+        self.member.first_name = "Mia"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.member.save()
+
+        self.assertEqual(self.request_user().first_name, "Mia")
+
+    def test_password_change_ends_other_sessions(self):
+        self.request_user()
+
+        self.member.set_password("changed12345")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.member.save()
+
+        self.assertFalse(self.request_user().is_authenticated)
+
+    def test_deactivated_worker_is_logged_out(self):
+        self.request_user()
+
+        self.member.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.member.save()
+
+        self.assertFalse(self.request_user().is_authenticated)
+
+    def test_renamed_position_is_reloaded(self):
+        self.request_user()
+
+        self.position.name = "Team Lead"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.position.save()
+
+        self.assertEqual(self.request_user().position.name, "Team Lead")
+
+    def test_saved_worker_stays_cached_until_commit(self):
+        self.request_user()
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.member.first_name = "Mia"
+            self.member.save()
+            self.assertEqual(self.request_user().first_name, "")
+
+        self.assertTrue(callbacks)
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            },
+        },
+        SESSION_ENGINE="django.contrib.sessions.backends.db",
+    )
+    def test_process_local_cache_is_not_used(self):
+        self.request_user()
+
+        with self.assertNumQueries(2):
+            self.assertEqual(self.request_user(), self.member)
+
+
+class ClearStaleSessionsTests(TestCase):
+    def test_deletes_expired_sessions_in_batches(self):
+        now = timezone.now()
+        Session.objects.bulk_create(
+            Session(
+                session_key=f"expired{index}",
+                session_data="",
+                expire_date=now - timedelta(days=1)
+            )
+            for index in range(5)
+        )
+        Session.objects.create(
+            session_key="active",
+            session_data="",
+            expire_date=now + timedelta(days=1)
+        )
+        stdout = StringIO()
+
+        with self.assertNumQueries(6):
+            call_command("clear_stale_sessions", batch_size=2, stdout=stdout)
+
+        self.assertEqual(
+            list(Session.objects.values_list("session_key", flat=True)),
+            ["active"]
+        )
+        self.assertIn("Deleted 5 expired session(s).", stdout.getvalue())
@@ -0,0 +1,121 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from task_manager.autocomplete import AUTOCOMPLETE_PAGE_SIZE
+from task_manager.models import Team, Project, Task, Tag
+
+User = get_user_model()
+
+
+class AutocompleteTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.lead = User.objects.create_user(
+            username="lead",
+            password="pass12345",
+            first_name="Lena",
+            last_name="Lead"
+        )
+        User.objects.bulk_create(
+            User(username=f"dev{index:02}")
+            for index in range(AUTOCOMPLETE_PAGE_SIZE + 5)
+        )
+        cls.team = Team.objects.create(name="Backend")
+        cls.team.members.add(cls.lead)
+        Team.objects.create(name="Frontend")
+        cls.project = Project.objects.create(name="Project", team=cls.team)
+        cls.bug = Tag.objects.create(name="bug")
+        Tag.objects.create(name="backlog")
+        Tag.objects.create(name="docs")
+        cls.task = Task.objects.create(name="Task", project=cls.project)
+        cls.task.tags.add(cls.bug)
+
+    def setUp(self):
+        self.client.force_login(self.lead)
+
+    def search(self, name, **params):
+        return self.client.get(
+            reverse(f"task-manager:{name}-autocomplete"), params
+        )
+
+    def test_requires_login(self):
+        self.client.logout()
+
+        self.assertEqual(self.search("worker", q="dev").status_code, 302)
+
+    def test_workers_are_paginated_by_prefix(self):
+        first = self.search("worker", q="DEV").json()
+
+        self.assertEqual(len(first["results"]), AUTOCOMPLETE_PAGE_SIZE)
+        self.assertEqual(first["results"][0]["text"], "dev00")
+
+        second = self.search(
+            "worker", q="dev", cursor=first["next"]
+        ).json()
+        self.assertEqual(
+            [item["text"] for item in second["results"]],
+            [f"dev{index:02}" for index in range(20, 25)]
+        )
+        self.assertIsNone(second["next"])
+
+    def test_worker_label_includes_full_name(self):
+        data = self.search("worker", q="le").json()
+
+        self.assertEqual(data["results"], [
+            {"id": self.lead.pk, "text": "lead (Lena Lead)"}
+        ])
+
+    def test_tags_and_teams(self):
+        tags = self.search("tag", q="b").json()["results"]
+        teams = self.search("team", q="front").json()["results"]
+
+        self.assertEqual(
+            [item["text"] for item in tags], ["#backlog", "#bug"]
+        )
+        self.assertEqual([item["text"] for item in teams], ["Frontend"])
+
+    def test_invalid_cursor(self):
+        self.assertEqual(
+            self.search("tag", cursor="not-a-cursor").status_code, 404
+        )
+
+    def test_team_form_renders_only_selected_members(self):
+        response = self.client.get(
+            reverse("task-manager:team-update", args=[self.team.pk])
+        )
+
+        self.assertContains(
+            response, f'<option value="{self.lead.pk}" selected>'
+        )
+        self.assertNotContains(response, "dev00")
+        self.assertContains(
+            response, reverse("task-manager:worker-autocomplete")
+        )
+        self.assertContains(response, "js/autocomplete.js")
+
+    def test_task_form_renders_only_selected_tags(self):
+        response = self.client.get(
+            reverse("task-manager:task-update", args=[self.task.pk])
+        )
+
+        self.assertContains(response, f'<option value="{self.bug.pk}"')
+        self.assertNotContains(response, "backlog")
+
+    def test_submitted_ids_are_validated(self):
+        worker = User.objects.get(username="dev03")
+
+        response = self.client.post(reverse("task-manager:team-create"), {
+            "name": "Platform",
+            "members": [worker.pk, 999999],
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Team.objects.filter(name="Platform").exists())
+
+        self.client.post(reverse("task-manager:team-create"), {
+            "name": "Platform",
+            "members": [worker.pk],
+        })
+        self.assertEqual(
+            list(Team.objects.get(name="Platform").members.all()), [worker]
+        )
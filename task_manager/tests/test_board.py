@@ -0,0 +1,157 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.board import BOARD_PAGE_SIZE, DONE_COLUMN, column_counts
+from task_manager.models import Team, Project, Task
+
+User = get_user_model()
+
+
+class ProjectBoardTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = User.objects.create_user(
+            username="member",
+            password="pass12345"
+        )
+        cls.outsider = User.objects.create_user(
+            username="outsider",
+            password="pass12345"
+        )
+        cls.team = Team.objects.create(name="Team")
+        cls.team.members.add(cls.member)
+        cls.project = Project.objects.create(name="Project", team=cls.team)
+        cls.urgent = Task.objects.create(
+            name="Urgent task",
+            project=cls.project,
+            priority=Task.PriorityChoices.URGENT
+        )
+        cls.done = Task.objects.create(
+            name="Done task",
+            project=cls.project,
+            priority=Task.PriorityChoices.URGENT,
+            is_completed=True
+        )
+
+    def setUp(self):
+        self.client.force_login(self.member)
+
+    def column_url(self, column):
+        return reverse(
+            "task-manager:project-board-column",
+            kwargs={"pk": self.project.pk, "column": column}
+        )
+
+    def move(self, task, column):
+        return self.client.post(
+            reverse("task-manager:task-move", args=[task.pk]),
+            {"column": column}
+        )
+
+    def test_board_counts_columns_with_one_grouped_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse("task-manager:project-board", args=[self.project.pk])
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            sum("GROUP BY" in query["sql"] for query in queries), 1
+        )
+        columns = {
+            column["key"]: column["count"]
+            for column in response.context["columns"]
+        }
+        self.assertEqual(columns, {
+            "URGENT": 1,
+            "HIGH": 0,
+            "MEDIUM": 0,
+            "LOW": 0,
+            DONE_COLUMN: 1,
+        })
+
+    def test_columns_split_open_and_completed_tasks(self):
+        urgent = self.client.get(self.column_url("URGENT"))
+        done = self.client.get(self.column_url(DONE_COLUMN))
+
+        self.assertEqual(list(urgent.context["task_list"]), [self.urgent])
+        self.assertEqual(list(done.context["task_list"]), [self.done])
+        self.assertContains(
+            self.client.get(self.column_url("LOW")),
+            "No tasks."
+        )
+
+    def test_columns_load_incrementally(self):
+        Task.objects.bulk_create(
+            Task(
+                name=f"Low {index:02}",
+                project=self.project,
+                priority=Task.PriorityChoices.LOW
+            )
+            for index in range(BOARD_PAGE_SIZE + 5)
+        )
+
+        first = self.client.get(self.column_url("LOW"))
+        self.assertEqual(len(first.context["task_list"]), BOARD_PAGE_SIZE)
+        self.assertContains(first, "Load more")
+
+        second = self.client.get(
+            self.column_url("LOW"),
+            {"cursor": first.context["page_obj"].next_cursor}
+        )
+        self.assertEqual(
+            [task.name for task in second.context["task_list"]],
+            [f"Low {index:02}" for index in range(BOARD_PAGE_SIZE, 25)]
+        )
+        self.assertNotContains(second, "Load more")
+        self.assertNotContains(second, "No tasks.")
+
+    def test_unknown_column(self):
+        self.assertEqual(
+            self.client.get(self.column_url("SOMEDAY")).status_code, 404
+        )
+
+    def test_move_updates_a_single_task_row(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.move(self.urgent, DONE_COLUMN)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["counts"]["URGENT"], 0)
+        self.assertEqual(response.json()["counts"][DONE_COLUMN], 2)
+        self.assertEqual(
+            sum(
+                query["sql"].startswith('UPDATE "task_manager_task"')
+                for query in queries
+            ),
+            1
+        )
+        self.urgent.refresh_from_db()
+        self.assertTrue(self.urgent.is_completed)
+
+        self.move(self.urgent, "HIGH")
+
+        self.urgent.refresh_from_db()
+        self.assertFalse(self.urgent.is_completed)
+        self.assertEqual(self.urgent.priority, Task.PriorityChoices.HIGH)
+        self.assertEqual(column_counts(self.project)["HIGH"], 1)
+
+    def test_move_rejects_unknown_column(self):
+        self.assertEqual(self.move(self.urgent, "SOMEDAY").status_code, 400)
+
+    def test_move_requires_team_membership(self):
+        self.client.force_login(self.outsider)
+
+        self.assertEqual(self.move(self.urgent, DONE_COLUMN).status_code, 403)
+        self.urgent.refresh_from_db()
+        self.assertFalse(self.urgent.is_completed)
+
+    def test_outsider_sees_cards_without_dragging(self):
+        self.client.force_login(self.outsider)
+
+        response = self.client.get(self.column_url("URGENT"))
+
+        self.assertContains(response, "Urgent task")
+        self.assertNotContains(response, 'draggable="true"')
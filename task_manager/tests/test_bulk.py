@@ -0,0 +1,211 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.models import MAX_TAGS_PER_TASK, Team, Project, Task, Tag
+from task_manager.search import search_tasks
+
+User = get_user_model()
+
+BULK_URL = reverse("task-manager:task-bulk")
+
+
+class TaskBulkTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = User.objects.create_user(
+            username="member",
+            password="pass12345"
+        )
+        cls.teammate = User.objects.create_user(
+            username="teammate",
+            password="pass12345"
+        )
+        cls.outsider = User.objects.create_user(
+            username="outsider",
+            password="pass12345"
+        )
+        cls.team = Team.objects.create(name="Team")
+        cls.team.members.add(cls.member, cls.teammate)
+        cls.other_team = Team.objects.create(name="Other team")
+        cls.other_team.members.add(cls.outsider)
+        cls.project = Project.objects.create(name="Project", team=cls.team)
+        cls.other_project = Project.objects.create(
+            name="Other project",
+            team=cls.other_team
+        )
+        cls.tasks = [
+            Task.objects.create(name=f"Task {index}", project=cls.project)
+            for index in range(3)
+        ]
+        cls.foreign_task = Task.objects.create(
+            name="Foreign",
+            project=cls.other_project
+        )
+        cls.tag = Tag.objects.create(name="triaged")
+
+    def setUp(self):
+        self.client.force_login(self.member)
+
+    def post_json(self, payload):
+        return self.client.post(
+            BULK_URL,
+            json.dumps(payload),
+            content_type="application/json"
+        )
+
+    def task_ids(self, tasks=None):
+        return [task.pk for task in tasks or self.tasks]
+
+    def test_form_post_updates_tasks_and_redirects(self):
+        response = self.client.post(BULK_URL, {
+            "tasks": self.task_ids(),
+            "action": "complete",
+            "next": "/tasks/?name=Task",
+        })
+
+        self.assertRedirects(
+            response, "/tasks/?name=Task", fetch_redirect_response=False
+        )
+        self.assertEqual(
+            Task.objects.filter(project=self.project, is_completed=True)
+            .count(),
+            3
+        )
+
+    def test_query_count_does_not_grow_with_selection(self):
+        def count_queries(tasks):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.post_json({
+                    "tasks": self.task_ids(tasks),
+                    "action": "priority",
+                    "priority": "URGENT",
+                })
+            self.assertEqual(response.status_code, 200)
+            return len(queries)
+
+        count_queries(self.tasks[:1])
+        few = count_queries(self.tasks[:1])
+        more = Task.objects.bulk_create(
+            Task(name=f"Extra {index}", project=self.project)
+            for index in range(20)
+        )
+
+        self.assertEqual(count_queries(self.tasks + more), few)
+        self.assertEqual(
+            Task.objects.filter(priority="URGENT").count(), 23
+        )
+
+    def test_updated_at_is_bumped(self):
+        before = {task.pk: task.updated_at for task in self.tasks}
+
+        self.post_json({"tasks": self.task_ids(), "action": "complete"})
+
+        for task in Task.objects.filter(pk__in=before):
+            self.assertGreater(task.updated_at, before[task.pk])
+
+    def test_foreign_task_rejects_whole_request(self):
+        response = self.post_json({
+            "tasks": self.task_ids() + [self.foreign_task.pk],
+            "action": "complete",
+        })
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(Task.objects.filter(is_completed=True).exists())
+
+    def test_add_tags_is_idempotent_and_indexed(self):
+        payload = {
+            "tasks": self.task_ids(),
+            "action": "add_tags",
+            "tags": [self.tag.pk],
+        }
+
+        self.assertEqual(self.post_json(payload).status_code, 200)
+        self.assertEqual(self.post_json(payload).status_code, 200)
+
+        self.assertEqual(self.tag.tasks.count(), 3)
+        self.assertEqual(
+            search_tasks(Task.objects.all(), "triaged").count(), 3
+        )
+
+    def test_tag_limit_is_checked_before_writing(self):
+        tags = Tag.objects.bulk_create(
+            Tag(name=f"tag {index}") for index in range(MAX_TAGS_PER_TASK)
+        )
+        self.tasks[0].tags.add(*tags)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post_json({
+                "tasks": self.task_ids(),
+                "action": "add_tags",
+                "tags": [self.tag.pk],
+            })
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(self.tag.tasks.exists())
+        self.assertFalse(
+            any(query["sql"].startswith("INSERT") for query in queries)
+        )
+
+    def test_tags_already_present_do_not_count_against_limit(self):
+        tags = Tag.objects.bulk_create(
+            Tag(name=f"tag {index}") for index in range(MAX_TAGS_PER_TASK)
+        )
+        self.tasks[0].tags.add(*tags)
+
+        response = self.post_json({
+            "tasks": self.task_ids(),
+            "action": "add_tags",
+            "tags": [tags[0].pk],
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(tags[0].tasks.count(), len(self.tasks))
+
+    def test_assignees_must_belong_to_the_team(self):
+        response = self.post_json({
+            "tasks": self.task_ids(),
+            "action": "add_assignees",
+            "assignees": [self.outsider.pk],
+        })
+        self.assertEqual(response.status_code, 400)
+
+        self.post_json({
+            "tasks": self.task_ids(),
+            "action": "add_assignees",
+            "assignees": [self.member.pk, self.teammate.pk],
+        })
+        self.assertEqual(self.teammate.tasks.count(), 3)
+
+        self.post_json({
+            "tasks": self.task_ids(),
+            "action": "remove_assignees",
+            "assignees": [self.teammate.pk],
+        })
+        self.assertEqual(self.teammate.tasks.count(), 0)
+        self.assertEqual(self.member.tasks.count(), 3)
+
+    def test_action_needs_its_value(self):
+        response = self.post_json({
+            "tasks": self.task_ids(),
+            "action": "priority",
+        })
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("priority", response.json()["errors"])
+
+    def test_only_post_is_allowed(self):
+        self.assertEqual(self.client.get(BULK_URL).status_code, 405)
+
+    def test_task_list_renders_bulk_form(self):
+        response = self.client.get(reverse("task-manager:task-list"))
+
+        self.assertContains(response, 'id="bulk-form"')
+        self.assertContains(
+            response,
+            f'name="tasks" value="{self.tasks[0].pk}"'
+        )
@@ -0,0 +1,149 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import LiveServerTestCase, TestCase
+
+from task_manager.models import (
+    Position,
+    Worker,
+    Team,
+    Project,
+    Task,
+    Tag,
+    TaskType,
+    TaskSearchDocument,
+)
+
+
+class GenerateLoadDataTests(TestCase):
+    def test_creates_requested_volumes(self):
+        call_command(
+            "generate_load_data",
+            positions=2,
+            workers=10,
+            teams=3,
+            projects=4,
+            tasks=25,
+            tags=5,
+            task_types=2,
+            seed=1,
+            stdout=StringIO(),
+        )
+
+        self.assertEqual(Position.objects.count(), 2)
+        self.assertEqual(Worker.objects.count(), 10)
+        self.assertEqual(Team.objects.count(), 3)
+        self.assertEqual(Project.objects.count(), 4)
+        self.assertEqual(Task.objects.count(), 25)
+        self.assertEqual(Tag.objects.count(), 5)
+        self.assertEqual(TaskType.objects.count(), 2)
+        self.assertEqual(TaskSearchDocument.objects.count(), 25)
+        for task in Task.objects.select_related("project__team"):
+            team_member_ids = set(
+                task.project.team.members.values_list("id", flat=True)
+            )
+            self.assertLessEqual(
+                set(task.assignees.values_list("id", flat=True)),
+                team_member_ids
+            )
+
+
+class BenchmarkUrlsTests(TestCase):
+    def test_writes_results_for_named_urls(self):
+        call_command(
+            "generate_load_data",
+            workers=5,
+            teams=1,
+            projects=1,
+            tasks=5,
+            stdout=StringIO(),
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory) / "results.json"
+            call_command(
+                "benchmark_urls",
+                iterations=2,
+                warmup=0,
+                output=str(output),
+                stdout=StringIO(),
+            )
+            report = json.loads(output.read_text())
+
+        results = report["results"]
+        self.assertNotIn("task-change-status", results)
+        for name in ("index", "task-list", "task-detail", "team-update"):
+            with self.subTest(url=name):
+                self.assertEqual(results[name]["status_code"], 200)
+                self.assertGreater(results[name]["queries"], 0)
+                self.assertLessEqual(
+                    results[name]["p50_ms"], results[name]["max_ms"]
+                )
+
+
+class BenchmarkConnectionsTests(TestCase):
+    def test_compares_new_and_persistent_connections(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory) / "connections.json"
+            call_command(
+                "benchmark_connections",
+                requests=5,
+                modes=["new", "persistent"],
+                output=str(output),
+                stdout=StringIO(),
+            )
+            report = json.loads(output.read_text())
+
+        for mode in ("new", "persistent"):
+            with self.subTest(mode=mode):
+                result = report["results"][mode]
+                self.assertEqual(result["requests"], 5)
+                self.assertLessEqual(result["mean_ms"], result["total_ms"])
+                self.assertIn("saved_per_request_ms", result)
+
+    def test_pool_is_skipped_without_postgresql(self):
+        stdout = StringIO()
+
+        call_command(
+            "benchmark_connections", requests=1, modes=["pool"], stdout=stdout
+        )
+
+        self.assertIn("pool        skipped", stdout.getvalue())
+
+
+class LoadTestTests(LiveServerTestCase):
+    # The flush after the test would drop the rows seeded by migrations,
+    # e.g. the ModelVersion rows, which later tests rely on.
+    serialized_rollback = True
+
+    def test_reports_throughput_against_running_server(self):
+        call_command(
+            "generate_load_data",
+            workers=5,
+            teams=1,
+            projects=1,
+            tasks=5,
+            stdout=StringIO(),
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory) / "load.json"
+            call_command(
+                "load_test",
+                self.live_server_url,
+                concurrency=4,
+                requests=16,
+                label="runserver",
+                output=str(output),
+                stdout=StringIO(),
+            )
+            report = json.loads(output.read_text())
+
+        self.assertEqual(report["label"], "runserver")
+        self.assertEqual(len(report["urls"]), 8)
+        self.assertEqual(report["results"]["requests"], 16)
+        self.assertEqual(report["results"]["errors"], 0)
+        self.assertGreater(report["results"]["requests_per_second"], 0)
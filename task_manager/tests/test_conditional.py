@@ -0,0 +1,164 @@
+from django.contrib.auth import get_user_model
+from django.contrib.messages import constants
+from django.contrib.messages.storage.base import Message
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.db import connection
+from django.http import HttpRequest
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.fragments import touch
+from task_manager.models import Team, Project, Task, Tag, ModelVersion
+from task_manager.versions import get_versions
+
+User = get_user_model()
+
+
+class ConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="member",
+            password="pass12345"
+        )
+        cls.team = Team.objects.create(name="Team")
+        cls.team.members.add(cls.user)
+        cls.project = Project.objects.create(name="Project", team=cls.team)
+        cls.task = Task.objects.create(name="Task", project=cls.project)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        # Pick up the CSRF cookie, which is part of the validator.
+        self.client.get(reverse("task-manager:index"))
+
+    def get(self, url, etag=None):
+        headers = {"if-none-match": etag} if etag else {}
+        return self.client.get(url, headers=headers)
+
+    def etag(self, url):
+        response = self.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response["ETag"]
+
+    def test_validators_are_sent(self):
+        response = self.get(reverse("task-manager:task-list"))
+
+        self.assertTrue(response.has_header("ETag"))
+        self.assertTrue(response.has_header("Last-Modified"))
+        self.assertIn("no-cache", response["Cache-Control"])
+        self.assertIn("private", response["Cache-Control"])
+
+    def test_unchanged_page_skips_querysets(self):
+        for name, kwargs in (
+            ("task-list", {}),
+            ("project-list", {}),
+            ("team-list", {}),
+            ("task-detail", {"pk": self.task.pk}),
+            ("project-detail", {"pk": self.project.pk}),
+            ("team-detail", {"pk": self.team.pk}),
+        ):
+            with self.subTest(view=name):
+                url = reverse(f"task-manager:{name}", kwargs=kwargs)
+                etag = self.etag(url)
+
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.get(url, etag)
+
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response["ETag"], etag)
+                self.assertFalse(any(
+                    "task_manager_task" in query["sql"]
+                    or "task_manager_project" in query["sql"]
+                    for query in queries
+                ))
+
+    def test_changes_produce_new_etag(self):
+        url = reverse("task-manager:task-detail", args=[self.task.pk])
+        etag = self.etag(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.assignees.add(self.user)
+        self.assertEqual(self.get(url, etag).status_code, 200)
+        etag = self.etag(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Tag.objects.create(name="backend")
+        self.assertEqual(self.get(url, etag).status_code, 200)
+
+    def test_deletion_produces_new_etag(self):
+        other = Task.objects.create(name="Other", project=self.project)
+        url = reverse("task-manager:project-detail", args=[self.project.pk])
+        etag = self.etag(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            other.delete()
+
+        response = self.get(url, etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, "Other")
+
+    def test_etag_depends_on_user(self):
+        url = reverse("task-manager:task-list")
+        etag = self.etag(url)
+        other = User.objects.create_user(
+            username="other",
+            password="pass12345"
+        )
+
+        self.client.force_login(other)
+
+        self.assertEqual(self.get(url, etag).status_code, 200)
+
+    def test_login_does_not_bump_worker_version(self):
+        before = get_versions(User)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.login(username="member", password="pass12345")
+
+        self.assertEqual(get_versions(User), before)
+
+    def test_pending_messages_disable_not_modified(self):
+        url = reverse("task-manager:task-list")
+        etag = self.etag(url)
+        storage = CookieStorage(HttpRequest())
+        self.client.cookies[storage.cookie_name] = storage._encode(
+            [Message(constants.SUCCESS, "Imported.")]
+        )
+
+        response = self.get(url, etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Imported.")
+
+    def test_versions_are_bumped_once_after_commit(self):
+        Task.objects.bulk_create(
+            Task(name=f"Task {index}", project=self.project)
+            for index in range(3)
+        )
+        before = get_versions(Task, Project)
+
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks() as callbacks:
+                self.project.delete()
+            self.assertEqual(get_versions(Task, Project), before)
+            for callback in callbacks:
+                callback()
+
+        bumps = [
+            query["sql"] for query in queries
+            if query["sql"].startswith('UPDATE "task_manager_modelversion"')
+        ]
+        self.assertEqual(len(bumps), 1)
+        self.assertNotEqual(get_versions(Task, Project), before)
+
+    def test_touch_bumps_version(self):
+        before = ModelVersion.objects.get(label="task_manager.task").version
+
+        with self.captureOnCommitCallbacks(execute=True):
+            touch(Task, [self.task.pk])
+
+        self.assertEqual(
+            ModelVersion.objects.get(label="task_manager.task").version,
+            before + 1
+        )
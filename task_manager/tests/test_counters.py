@@ -0,0 +1,154 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.models import Team, Project, Task, Position
+
+User = get_user_model()
+
+
+class CounterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.developer = Position.objects.create(name="Developer")
+        cls.designer = Position.objects.create(name="Designer")
+        cls.first = User.objects.create_user(
+            username="first",
+            password="pass12345",
+            position=cls.developer
+        )
+        cls.second = User.objects.create_user(
+            username="second",
+            password="pass12345",
+            position=cls.developer
+        )
+        cls.team = Team.objects.create(name="Team")
+        cls.other_team = Team.objects.create(name="Other team")
+        cls.project = Project.objects.create(name="Project", team=cls.team)
+        cls.other_project = Project.objects.create(
+            name="Other project",
+            team=cls.team
+        )
+
+    def assertCount(self, obj, field, expected):
+        obj.refresh_from_db(fields=[field])
+        self.assertEqual(getattr(obj, field), expected)
+
+    def test_member_count_follows_membership_changes(self):
+        self.team.members.add(self.first, self.second)
+        self.assertCount(self.team, "member_count", 2)
+
+        self.team.members.remove(self.first)
+        self.team.members.remove(self.first)
+        self.assertCount(self.team, "member_count", 1)
+
+        self.second.teams.add(self.other_team)
+        self.assertCount(self.other_team, "member_count", 1)
+
+        self.second.teams.clear()
+        self.assertCount(self.team, "member_count", 0)
+        self.assertCount(self.other_team, "member_count", 0)
+
+        self.team.members.set([self.first, self.second])
+        self.team.members.clear()
+        self.assertCount(self.team, "member_count", 0)
+
+    def test_worker_deletion_updates_counters(self):
+        self.team.members.add(self.first, self.second)
+
+        self.first.delete()
+
+        self.assertCount(self.team, "member_count", 1)
+        self.assertCount(self.developer, "worker_count", 1)
+
+    def test_task_count_follows_tasks(self):
+        task = Task.objects.create(name="Task", project=self.project)
+        Task.objects.create(name="Other", project=self.project)
+        self.assertCount(self.project, "task_count", 2)
+
+        task.project = self.other_project
+        task.save()
+        self.assertCount(self.project, "task_count", 1)
+        self.assertCount(self.other_project, "task_count", 1)
+
+        task.is_completed = True
+        task.save(update_fields=["is_completed"])
+        self.assertCount(self.other_project, "task_count", 1)
+
+        task.delete()
+        self.assertCount(self.other_project, "task_count", 0)
+
+    def test_cascade_delete_skips_counter_of_deleted_parent(self):
+        Task.objects.bulk_create(
+            Task(name=f"Task {index}", project=self.project)
+            for index in range(3)
+        )
+        Task.objects.create(name="Other", project=self.other_project)
+
+        for origin in (self.project, Team.objects.filter(pk=self.team.pk)):
+            with self.subTest(origin=origin):
+                with CaptureQueriesContext(connection) as queries:
+                    origin.delete()
+
+                self.assertFalse([
+                    query["sql"] for query in queries
+                    if query["sql"].startswith(
+                        'UPDATE "task_manager_project"'
+                    )
+                ])
+
+    def test_queryset_delete_of_tasks_updates_count(self):
+        Task.objects.create(name="Task", project=self.other_project)
+
+        self.project.delete()
+        Task.objects.filter(project=self.other_project).delete()
+
+        self.assertCount(self.other_project, "task_count", 0)
+
+    def test_worker_count_follows_position_changes(self):
+        self.assertCount(self.developer, "worker_count", 2)
+
+        self.first.position = self.designer
+        self.first.save()
+
+        self.assertCount(self.developer, "worker_count", 1)
+        self.assertCount(self.designer, "worker_count", 1)
+
+    def test_recount_repairs_drift(self):
+        self.team.members.add(self.first)
+        Task.objects.create(name="Task", project=self.project)
+        Team.objects.update(member_count=7)
+        Project.objects.update(task_count=0)
+        Position.objects.update(worker_count=0)
+
+        out = StringIO()
+        call_command("recount", stdout=out)
+
+        self.assertIn("teams.member_count: fixed 2 row(s)", out.getvalue())
+        self.assertCount(self.team, "member_count", 1)
+        self.assertCount(self.other_team, "member_count", 0)
+        self.assertCount(self.project, "task_count", 1)
+        self.assertCount(self.developer, "worker_count", 2)
+
+    def test_list_pages_do_not_aggregate(self):
+        self.team.members.add(self.first)
+        self.client.force_login(self.first)
+
+        for name in ("team-list", "project-list", "position-list"):
+            with self.subTest(view=name):
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(reverse(f"task-manager:{name}"))
+                self.assertEqual(response.status_code, 200)
+                self.assertFalse(any(
+                    "GROUP BY" in query["sql"] for query in queries
+                ))
+
+        self.assertContains(
+            self.client.get(reverse("task-manager:team-list")),
+            "1 member"
+        )
@@ -0,0 +1,141 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from task_manager.deadlines import scan_deadlines, send_deadline_reminders
+from task_manager.models import DeadlineNotice, Team, Project, Task
+
+User = get_user_model()
+
+
+class DeadlineReminderTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        cls.alice = User.objects.create_user(
+            username="alice",
+            password="pass12345",
+            email="alice@example.com"
+        )
+        cls.bob = User.objects.create_user(
+            username="bob",
+            password="pass12345",
+            email="bob@example.com"
+        )
+        cls.team = Team.objects.create(name="Team")
+        cls.project = Project.objects.create(name="Project", team=cls.team)
+
+        def task(name, deadline, **kwargs):
+            return Task.objects.create(
+                name=name,
+                project=cls.project,
+                deadline=deadline,
+                **kwargs
+            )
+
+        cls.due_soon = task("Due soon", now + timedelta(hours=3))
+        cls.overdue = task("Overdue", now - timedelta(days=1))
+        cls.later = task("Later", now + timedelta(days=5))
+        cls.ancient = task("Ancient", now - timedelta(days=30))
+        cls.done = task(
+            "Done", now + timedelta(hours=1), is_completed=True
+        )
+        for item in (
+            cls.due_soon, cls.overdue, cls.later, cls.ancient, cls.done
+        ):
+            item.assignees.add(cls.alice)
+        cls.due_soon.assignees.add(cls.bob)
+
+    def run_scanner(self):
+        call_command("send_deadline_reminders", stdout=StringIO())
+
+    def test_one_message_per_assignee(self):
+        self.run_scanner()
+
+        by_recipient = {message.to[0]: message for message in mail.outbox}
+        self.assertEqual(
+            set(by_recipient), {"alice@example.com", "bob@example.com"}
+        )
+        alice = by_recipient["alice@example.com"]
+        self.assertEqual(
+            alice.subject, "Task deadlines: 1 overdue, 1 due soon"
+        )
+        self.assertIn("Overdue: Overdue (Project)", alice.body)
+        self.assertIn("Due soon: Due soon (Project)", alice.body)
+        for name in ("Later", "Ancient", "Done"):
+            self.assertNotIn(f": {name} ", alice.body)
+
+    def test_reruns_send_nothing_new(self):
+        self.run_scanner()
+        self.run_scanner()
+
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertFalse(
+            DeadlineNotice.objects.filter(sent_at__isnull=True).exists()
+        )
+
+    def test_due_soon_task_is_reported_again_when_overdue(self):
+        self.run_scanner()
+        mail.outbox.clear()
+
+        scan_deadlines(now=timezone.now() + timedelta(hours=4))
+        send_deadline_reminders()
+
+        self.assertEqual(
+            sorted(message.subject for message in mail.outbox),
+            ["Task deadlines: 1 overdue", "Task deadlines: 1 overdue"]
+        )
+
+    def test_rescheduled_and_completed_tasks_are_dropped(self):
+        scan_deadlines()
+        Task.objects.filter(pk=self.due_soon.pk).update(
+            deadline=timezone.now() + timedelta(days=3)
+        )
+        Task.objects.filter(pk=self.overdue.pk).update(is_completed=True)
+
+        self.assertEqual(send_deadline_reminders(), (0, 0))
+        self.assertEqual(mail.outbox, [])
+
+    def test_scan_is_chunked(self):
+        Task.objects.bulk_create(
+            Task(
+                name=f"Batch {index}",
+                project=self.project,
+                deadline=self.due_soon.deadline
+            )
+            for index in range(5)
+        )
+
+        with self.assertNumQueries(8):
+            self.assertEqual(scan_deadlines(chunk_size=3), 7)
+
+    def test_zero_window_only_reports_overdue_tasks(self):
+        call_command(
+            "send_deadline_reminders",
+            window_hours=0,
+            lookback_days=0,
+            stdout=StringIO(),
+        )
+
+        self.assertFalse(DeadlineNotice.objects.exists())
+
+        self.assertEqual(scan_deadlines(window=timedelta(0)), 1)
+        self.assertEqual(
+            list(DeadlineNotice.objects.values_list("task", flat=True)),
+            [self.overdue.pk]
+        )
+
+    def test_workers_without_email_are_skipped(self):
+        User.objects.filter(pk=self.bob.pk).update(email="")
+
+        self.assertEqual(send_deadline_reminders(), (0, 0))
+        scan_deadlines()
+        messages, notices = send_deadline_reminders()
+
+        self.assertEqual((messages, notices), (1, 3))
+        self.assertEqual(mail.outbox[0].to, ["alice@example.com"])
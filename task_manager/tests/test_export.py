@@ -0,0 +1,151 @@
+import csv
+import json
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.models import Team, Project, Task, Tag, TaskType
+
+User = get_user_model()
+
+
+class ExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = User.objects.create_user(
+            username="member",
+            password="pass12345"
+        )
+        cls.outsider = User.objects.create_user(
+            username="outsider",
+            password="pass12345"
+        )
+        cls.team = Team.objects.create(name="Team")
+        cls.team.members.add(cls.member)
+        cls.other_team = Team.objects.create(name="Other team")
+        cls.other_team.members.add(cls.outsider)
+
+        cls.project = Project.objects.create(name="Project", team=cls.team)
+        cls.other_project = Project.objects.create(
+            name="Other project",
+            team=cls.other_team
+        )
+        cls.tag = Tag.objects.create(name="backend")
+        cls.task_type = TaskType.objects.create(name="Bug")
+
+        cls.task = Task.objects.create(
+            name="Fix login",
+            project=cls.project,
+            task_type=cls.task_type
+        )
+        cls.task.tags.add(cls.tag)
+        cls.task.assignees.add(cls.member)
+        cls.other_task = Task.objects.create(
+            name="Fix billing",
+            project=cls.other_project
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.member)
+
+    def export(self, url_name, **params):
+        response = self.client.get(reverse(url_name), params)
+        self.assertEqual(response.status_code, 200)
+        return b"".join(response.streaming_content).decode()
+
+    def test_task_csv_only_contains_visible_tasks(self):
+        rows = list(csv.DictReader(StringIO(
+            self.export("task-manager:task-export")
+        )))
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["name"], "Fix login")
+        self.assertEqual(rows[0]["project"], "Project")
+        self.assertEqual(rows[0]["team"], "Team")
+        self.assertEqual(rows[0]["task_type"], "Bug")
+        self.assertEqual(rows[0]["tags"], "backend")
+        self.assertEqual(rows[0]["assignees"], "member")
+
+    def test_task_jsonl_respects_search(self):
+        Task.objects.create(name="Write docs", project=self.project)
+
+        lines = self.export(
+            "task-manager:task-export", format="jsonl", name="login"
+        ).splitlines()
+
+        self.assertEqual(len(lines), 1)
+        row = json.loads(lines[0])
+        self.assertEqual(row["name"], "Fix login")
+        self.assertEqual(row["tags"], ["backend"])
+
+    def test_task_export_queries_do_not_grow_with_rows(self):
+        url = reverse("task-manager:task-export")
+        cache.clear()
+        with CaptureQueriesContext(connection) as single_row:
+            b"".join(self.client.get(url).streaming_content)
+
+        for index in range(5):
+            task = Task.objects.create(
+                name=f"Task {index}",
+                project=self.project,
+                task_type=self.task_type
+            )
+            task.tags.add(self.tag)
+            task.assignees.add(self.member)
+        cache.clear()
+
+        with CaptureQueriesContext(connection) as many_rows:
+            content = b"".join(self.client.get(url).streaming_content)
+
+        self.assertEqual(len(content.decode().splitlines()), 7)
+        self.assertEqual(len(many_rows), len(single_row))
+
+    def test_project_export_is_limited_to_user_teams(self):
+        rows = list(csv.DictReader(StringIO(
+            self.export("task-manager:project-export")
+        )))
+
+        self.assertEqual(
+            [(row["name"], row["task_count"]) for row in rows],
+            [("Project", "1")]
+        )
+
+    def test_worker_export_lists_teams(self):
+        lines = self.export(
+            "task-manager:worker-export", format="jsonl", username="mem"
+        ).splitlines()
+
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])["teams"], ["Team"])
+
+    def test_unknown_format_is_not_found(self):
+        response = self.client.get(
+            reverse("task-manager:task-export"), {"format": "xlsx"}
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_command_exports_everything_by_default(self):
+        out = StringIO()
+
+        call_command("export_data", "tasks", "--format", "jsonl", stdout=out)
+
+        names = {
+            json.loads(line)["name"] for line in out.getvalue().splitlines()
+        }
+        self.assertEqual(names, {"Fix login", "Fix billing"})
+
+    def test_command_applies_worker_visibility(self):
+        out = StringIO()
+
+        call_command("export_data", "tasks", username="outsider", stdout=out)
+
+        rows = list(csv.DictReader(StringIO(out.getvalue())))
+        self.assertEqual([row["name"] for row in rows], ["Fix billing"])
@@ -0,0 +1,152 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from task_manager.fragments import fragment_version, touch
+from task_manager.models import Team, Project, Task, Tag, TaskType
+
+User = get_user_model()
+
+
+class FragmentVersionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.team = Team.objects.create(name="Team")
+        cls.project = Project.objects.create(name="Project", team=cls.team)
+        cls.task = Task.objects.create(name="Task", project=cls.project)
+
+    def version(self):
+        self.task.refresh_from_db()
+        return fragment_version(self.task, self.task.tags.all())
+
+    def test_touch_changes_version(self):
+        version = self.version()
+
+        touch(Task, [self.task.pk, None])
+
+        self.assertNotEqual(self.version(), version)
+
+    def test_missing_objects_are_part_of_the_version(self):
+        self.assertNotEqual(
+            fragment_version(self.task, None),
+            fragment_version(self.task, []),
+        )
+
+    def test_tag_changes_touch_task(self):
+        tag = Tag.objects.create(name="backend")
+        version = self.version()
+
+        self.task.tags.add(tag)
+        added = self.version()
+        self.assertNotEqual(added, version)
+
+        tag.tasks.clear()
+        self.assertNotEqual(self.version(), added)
+
+    def test_worker_deletion_touches_tasks(self):
+        worker = User.objects.create_user(
+            username="worker",
+            password="pass12345"
+        )
+        self.task.assignees.add(worker)
+        version = self.version()
+
+        worker.delete()
+
+        self.assertNotEqual(self.version(), version)
+
+
+class CachedFragmentTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.user = User.objects.create_user(
+                username="member",
+                password="pass12345"
+            )
+            cls.team = Team.objects.create(name="Team")
+            cls.team.members.add(cls.user)
+            cls.project = Project.objects.create(
+                name="Project", team=cls.team
+            )
+            cls.task_type = TaskType.objects.create(name="Bug")
+            cls.tag = Tag.objects.create(name="backend")
+            cls.task = Task.objects.create(
+                name="Task",
+                project=cls.project,
+                task_type=cls.task_type
+            )
+            cls.task.tags.add(cls.tag)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def get(self, name, **kwargs):
+        return self.client.get(reverse(f"task-manager:{name}", kwargs=kwargs))
+
+    def test_task_rows_follow_related_changes(self):
+        self.assertContains(self.get("task-list"), "#backend")
+
+        self.tag.name = "frontend"
+        self.task_type.name = "Feature"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tag.save()
+            self.task_type.save()
+
+        response = self.get("task-list")
+        self.assertContains(response, "#frontend")
+        self.assertContains(response, "Feature")
+
+        self.task.assignees.add(self.user)
+        self.assertContains(self.get("task-list"), "1 Assignee")
+
+    def test_status_change_refreshes_row_and_project_panels(self):
+        self.assertContains(self.get("task-list"), "In progress")
+        self.get("project-detail", pk=self.project.pk)
+
+        self.client.post(
+            reverse("task-manager:task-change-status", args=[self.task.pk])
+        )
+
+        self.assertContains(self.get("task-list"), "Completed")
+        self.assertNotContains(
+            self.get("project-detail", pk=self.project.pk),
+            "No completed tasks."
+        )
+
+    def test_team_members_follow_membership(self):
+        self.assertContains(
+            self.get("team-detail", pk=self.team.pk),
+            "1 member"
+        )
+
+        other = User.objects.create_user(
+            username="newcomer",
+            password="pass12345"
+        )
+        self.team.members.add(other)
+
+        response = self.get("team-detail", pk=self.team.pk)
+        self.assertContains(response, "2 members")
+        self.assertContains(response, "newcomer")
+
+    def test_rows_are_served_from_cache(self):
+        self.get("task-list")
+        Tag.objects.update(name="renamed")
+
+        self.assertContains(self.get("task-list"), "#backend")
+
+    def test_sidebar_keeps_user_specific_parts_uncached(self):
+        self.get("task-list")
+        other = User.objects.create_user(
+            username="someone",
+            password="pass12345"
+        )
+        self.client.force_login(other)
+
+        response = self.get("task-list")
+
+        self.assertContains(response, "someone")
+        self.assertContains(response, "csrfmiddlewaretoken")
@@ -0,0 +1,189 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.imports import import_tasks
+from task_manager.models import Team, Project, Task, Tag, TaskType
+from task_manager.search import search_tasks
+
+User = get_user_model()
+
+CSV_HEADER = "name,priority,deadline,is_completed,task_type,tags,assignees\n"
+
+
+class TaskImportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = User.objects.create_user(
+            username="member",
+            password="pass12345"
+        )
+        cls.outsider = User.objects.create_user(
+            username="outsider",
+            password="pass12345"
+        )
+        cls.team = Team.objects.create(name="Team")
+        cls.team.members.add(cls.member)
+        cls.project = Project.objects.create(name="Project", team=cls.team)
+        cls.backend = Tag.objects.create(name="backend")
+        cls.api = Tag.objects.create(name="api")
+        cls.bug = TaskType.objects.create(name="Bug")
+
+    def setUp(self):
+        cache.clear()
+
+    def test_imports_rows_with_relations(self):
+        result = import_tasks(self.project, StringIO(
+            CSV_HEADER
+            + 'Fix login,High,2030-01-01 10:00,yes,Bug,"backend, api",'
+              "member\n"
+            + "Write docs,,,,,,\n"
+        ))
+
+        self.assertEqual(result.created, 2)
+        self.assertEqual(result.errors, [])
+        task = Task.objects.get(name="Fix login")
+        self.assertEqual(task.priority, Task.PriorityChoices.HIGH)
+        self.assertTrue(task.is_completed)
+        self.assertEqual(task.task_type, self.bug)
+        self.assertEqual(set(task.tags.all()), {self.backend, self.api})
+        self.assertEqual(list(task.assignees.all()), [self.member])
+        self.assertEqual(
+            Task.objects.get(name="Write docs").priority,
+            Task.PriorityChoices.MEDIUM
+        )
+        self.assertEqual(
+            list(search_tasks(Task.objects.all(), "backend")),
+            [task]
+        )
+
+    def test_invalid_rows_are_reported_and_skipped(self):
+        result = import_tasks(self.project, StringIO(
+            CSV_HEADER
+            + "Valid,,,,,,\n"
+            + ",,,,,,\n"
+            + "Bad tag,,,,,frontend,\n"
+            + "Outsider,,,,,,outsider\n"
+            + "Bad priority,Someday,,,,,\n"
+            + "Bad deadline,,tomorrow,,,,\n"
+        ))
+
+        self.assertEqual(result.created, 1)
+        self.assertEqual(
+            result.errors,
+            [
+                (3, "Name is required."),
+                (4, "Unknown tag: frontend."),
+                (5, "Unknown team member: outsider."),
+                (6, "Unknown priority: Someday."),
+                (7, "Invalid deadline: tomorrow."),
+            ]
+        )
+        self.assertEqual(
+            list(Task.objects.values_list("name", flat=True)),
+            ["Valid"]
+        )
+
+    def test_jsonl_rows(self):
+        lines = [
+            json.dumps({"name": "One", "tags": ["api"]}),
+            "not json",
+            json.dumps({"name": "Two", "assignees": ["member"]}),
+            json.dumps({"name": "Three", "tags": 5}),
+            json.dumps({"name": "Four", "assignees": True}),
+        ]
+
+        result = import_tasks(
+            self.project, StringIO("\n".join(lines)), "jsonl"
+        )
+
+        self.assertEqual(result.created, 2)
+        self.assertEqual(
+            result.errors,
+            [
+                (2, "Row is not a JSON object."),
+                (4, "Expected a list or a comma-separated string of tags."),
+                (
+                    5,
+                    "Expected a list or a comma-separated string of "
+                    "team members."
+                ),
+            ]
+        )
+
+    def test_queries_per_batch_do_not_grow_with_rows(self):
+        def count_queries(rows):
+            with CaptureQueriesContext(connection) as queries:
+                result = import_tasks(self.project, StringIO(
+                    CSV_HEADER + "".join(
+                        f"Task {index},,,,Bug,backend,member\n"
+                        for index in range(rows)
+                    )
+                ))
+            self.assertEqual(result.created, rows)
+            return len(queries)
+
+        self.assertEqual(count_queries(40), count_queries(1))
+
+    def test_upload_view(self):
+        self.client.force_login(self.member)
+        upload = SimpleUploadedFile(
+            "tasks.csv",
+            (CSV_HEADER + "Uploaded,,,,,,\nBroken,Never,,,,,\n").encode()
+        )
+
+        response = self.client.post(
+            reverse(
+                "task-manager:task-import",
+                kwargs={"project_pk": self.project.pk}
+            ),
+            {"file": upload},
+            follow=True
+        )
+
+        self.assertContains(response, "Imported 1 task.")
+        self.assertContains(response, "Skipped 1 invalid row")
+        self.assertTrue(Task.objects.filter(name="Uploaded").exists())
+
+    def test_upload_view_requires_team_membership(self):
+        self.client.force_login(self.outsider)
+
+        response = self.client.get(reverse(
+            "task-manager:task-import",
+            kwargs={"project_pk": self.project.pk}
+        ))
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_command_round_trips_export(self):
+        task = Task.objects.create(name="Exported", project=self.project)
+        task.tags.add(self.api)
+        task.assignees.add(self.member)
+        target = Project.objects.create(name="Target", team=self.team)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "tasks.jsonl"
+            call_command(
+                "export_data", "tasks", format="jsonl", output=str(path),
+                stdout=StringIO()
+            )
+            out = StringIO()
+            call_command(
+                "import_tasks", target.pk, str(path), stdout=out
+            )
+
+        self.assertIn("Imported 1 task(s)", out.getvalue())
+        imported = target.tasks.get()
+        self.assertEqual(imported.name, "Exported")
+        self.assertEqual(list(imported.tags.all()), [self.api])
+        self.assertEqual(list(imported.assignees.all()), [self.member])
@@ -0,0 +1,70 @@
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from task_manager.models import Team, Project, Task
+
+
+class TaskIndexPlanTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        team = Team.objects.create(name="Team")
+        cls.project = Project.objects.create(name="Project", team=team)
+        Task.objects.bulk_create(
+            Task(
+                name=f"Task {index}",
+                project=cls.project,
+                is_completed=index % 3 == 0,
+                deadline=timezone.now(),
+            )
+            for index in range(50)
+        )
+
+    def setUp(self):
+        if connection.vendor == "postgresql":
+            # Tiny test tables are cheaper to scan, so force the planner
+            # to show which index it would pick on a real data set.
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        elif connection.vendor != "sqlite":
+            self.skipTest("Plan assertions are written for SQLite/PostgreSQL")
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan)
+        return plan
+
+    def test_list_ordering_uses_composite_index(self):
+        plan = self.assertUsesIndex(
+            Task.objects.only("id")[:5], "task_status_name_idx"
+        )
+        if connection.vendor == "sqlite":
+            self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_project_tasks_by_status_use_composite_index(self):
+        for is_completed in (False, True):
+            with self.subTest(is_completed=is_completed):
+                plan = self.assertUsesIndex(
+                    self.project.tasks.filter(is_completed=is_completed),
+                    "task_project_status_idx"
+                )
+                if connection.vendor == "sqlite":
+                    self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_overdue_tasks_use_partial_index(self):
+        self.assertUsesIndex(
+            Task.objects.filter(
+                is_completed=False,
+                deadline__lt=timezone.now()
+            ).order_by("deadline"),
+            "task_open_deadline_idx"
+        )
+
+    def test_open_tasks_by_priority_use_partial_index(self):
+        self.assertUsesIndex(
+            Task.objects.filter(
+                is_completed=False,
+                priority=Task.PriorityChoices.URGENT
+            ),
+            "task_open_priority_idx"
+        )
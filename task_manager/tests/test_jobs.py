@@ -0,0 +1,212 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from task_manager.jobs import (
+    claim_jobs,
+    enqueue,
+    purge_finished_jobs,
+    run_job,
+    run_pending_jobs,
+)
+from task_manager.models import Job, Team, Project, Task
+
+User = get_user_model()
+
+
+class JobQueueTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.team = Team.objects.create(name="Empty team")
+
+    def enqueue_delete(self):
+        return enqueue("delete_empty_teams", team_ids=[self.team.pk])
+
+    def break_payload(self, job):
+        Job.objects.filter(pk=job.pk).update(payload={"unexpected": 1})
+
+    def test_unknown_job_is_rejected(self):
+        with self.assertRaises(ValueError):
+            enqueue("does_not_exist")
+
+    def test_due_jobs_are_processed(self):
+        job = self.enqueue_delete()
+        enqueue(
+            "delete_empty_teams",
+            run_after=timezone.now() + timedelta(hours=1),
+            team_ids=[],
+        )
+
+        self.assertEqual(run_pending_jobs(), [True])
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.StatusChoices.DONE)
+        self.assertEqual(job.attempts, 1)
+        self.assertFalse(Team.objects.filter(pk=self.team.pk).exists())
+
+    def test_claimed_job_is_not_handed_out_twice(self):
+        self.enqueue_delete()
+
+        self.assertEqual(len(claim_jobs("first", 10)), 1)
+        self.assertEqual(claim_jobs("second", 10), [])
+
+    @override_settings(JOB_RETRY_DELAY=60)
+    def test_failed_job_is_retried_later(self):
+        job = self.enqueue_delete()
+        self.break_payload(job)
+
+        self.assertEqual(run_pending_jobs(), [False])
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.StatusChoices.QUEUED)
+        self.assertIn("TypeError", job.last_error)
+        self.assertGreater(
+            job.run_after, timezone.now() + timedelta(seconds=50)
+        )
+        self.assertEqual(run_pending_jobs(), [])
+
+    @override_settings(JOB_MAX_ATTEMPTS=1)
+    def test_job_fails_after_last_attempt(self):
+        job = self.enqueue_delete()
+        self.break_payload(job)
+
+        run_pending_jobs()
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.StatusChoices.FAILED)
+
+    def test_expired_job_is_reclaimed(self):
+        self.enqueue_delete()
+        [stale] = claim_jobs("first", 10)
+        Job.objects.filter(pk=stale.pk).update(
+            locked_until=timezone.now() - timedelta(seconds=1)
+        )
+
+        [job] = claim_jobs("second", 10)
+        self.assertEqual(job.attempts, 2)
+        self.assertTrue(run_job(job, "second"))
+
+        with self.assertLogs("task_manager.jobs", "WARNING"):
+            run_job(stale, "first")
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.StatusChoices.DONE)
+
+    @override_settings(JOB_MAX_ATTEMPTS=1)
+    def test_expired_last_attempt_fails(self):
+        job = self.enqueue_delete()
+        claim_jobs("first", 10)
+        Job.objects.filter(pk=job.pk).update(
+            locked_until=timezone.now() - timedelta(seconds=1)
+        )
+
+        self.assertEqual(claim_jobs("second", 10), [])
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.StatusChoices.FAILED)
+
+    def test_purge_keeps_recent_and_failed_jobs(self):
+        old = self.enqueue_delete()
+        recent = self.enqueue_delete()
+        failed = self.enqueue_delete()
+        Job.objects.filter(pk=old.pk).update(
+            status=Job.StatusChoices.DONE,
+            updated_at=timezone.now() - timedelta(days=8),
+        )
+        Job.objects.filter(pk=recent.pk).update(status=Job.StatusChoices.DONE)
+        Job.objects.filter(pk=failed.pk).update(
+            status=Job.StatusChoices.FAILED,
+            updated_at=timezone.now() - timedelta(days=8),
+        )
+
+        self.assertEqual(purge_finished_jobs(timedelta(days=7)), 1)
+        self.assertEqual(
+            set(Job.objects.values_list("pk", flat=True)),
+            {recent.pk, failed.pk}
+        )
+
+
+class DeferredViewWorkTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_user(
+            username="staff",
+            password="pass12345",
+            is_staff=True
+        )
+        cls.lead = User.objects.create_user(
+            username="lead",
+            password="pass12345"
+        )
+        cls.leaving = User.objects.create_user(
+            username="leaving",
+            password="pass12345"
+        )
+        cls.team = Team.objects.create(name="Team")
+        cls.team.members.add(cls.lead, cls.leaving)
+        cls.solo_team = Team.objects.create(name="Solo team")
+        cls.solo_team.members.add(cls.leaving)
+        cls.project = Project.objects.create(name="Project", team=cls.team)
+        cls.task = Task.objects.create(name="Task", project=cls.project)
+        cls.task.assignees.add(cls.lead, cls.leaving)
+
+    def test_worker_deletion_removes_empty_teams_in_background(self):
+        self.client.force_login(self.staff)
+
+        self.client.post(
+            reverse("task-manager:worker-delete", args=[self.leaving.pk])
+        )
+
+        self.assertTrue(Team.objects.filter(pk=self.solo_team.pk).exists())
+        self.assertEqual(run_pending_jobs(), [True])
+        self.assertEqual(
+            list(Team.objects.values_list("name", flat=True)), ["Team"]
+        )
+
+    def test_team_update_defers_assignment_cleanup(self):
+        self.client.force_login(self.lead)
+
+        self.client.post(
+            reverse("task-manager:team-update", args=[self.team.pk]),
+            {"name": self.team.name, "members": [self.lead.pk]}
+        )
+
+        self.assertEqual(self.task.assignees.count(), 2)
+        self.assertEqual(run_pending_jobs(), [True])
+        self.assertEqual(list(self.task.assignees.all()), [self.lead])
+
+    def test_cleanup_skips_members_who_rejoined(self):
+        enqueue(
+            "drop_stale_assignments",
+            team_id=self.team.pk,
+            member_ids=[self.leaving.pk],
+        )
+
+        run_pending_jobs()
+
+        self.assertEqual(self.task.assignees.count(), 2)
+
+
+class RunWorkerTests(TransactionTestCase):
+    # Like LoadTestTests: the flush would otherwise recreate the content
+    # types under new ids and drop the migration-seeded rows.
+    serialized_rollback = True
+
+    def test_once_processes_due_jobs(self):
+        teams = Team.objects.bulk_create(
+            Team(name=f"Team {index}") for index in range(6)
+        )
+        for team in teams:
+            enqueue("delete_empty_teams", team_ids=[team.pk])
+        out = StringIO()
+
+        call_command("run_worker", threads=1, once=True, stdout=out)
+
+        self.assertIn("Processed 6 job(s), 0 failed.", out.getvalue())
+        self.assertFalse(Team.objects.exists())
+        self.assertFalse(
+            Job.objects.exclude(status=Job.StatusChoices.DONE).exists()
+        )
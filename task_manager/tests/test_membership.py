@@ -0,0 +1,188 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.jobs import run_pending_jobs
+from task_manager.membership import (
+    drop_stale_assignments,
+    get_user_team_ids,
+    is_team_member,
+)
+from task_manager.models import Team, Project, Task
+from task_manager.tests import SHARED_CACHES
+
+User = get_user_model()
+
+
+class DropStaleAssignmentsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.lead = User.objects.create_user(
+            username="lead",
+            password="pass12345"
+        )
+        cls.leaving = User.objects.create_user(
+            username="leaving",
+            password="pass12345"
+        )
+        cls.team = Team.objects.create(name="Team")
+        cls.team.members.add(cls.lead, cls.leaving)
+        cls.other_team = Team.objects.create(name="Other team")
+        cls.other_team.members.add(cls.leaving)
+
+        cls.project = Project.objects.create(name="Project", team=cls.team)
+        cls.other_project = Project.objects.create(
+            name="Other project",
+            team=cls.other_team
+        )
+        cls.tasks = []
+        for index in range(3):
+            task = Task.objects.create(
+                name=f"Task {index}",
+                project=cls.project
+            )
+            task.assignees.add(cls.lead, cls.leaving)
+            cls.tasks.append(task)
+        cls.other_task = Task.objects.create(
+            name="Other task",
+            project=cls.other_project
+        )
+        cls.other_task.assignees.add(cls.leaving)
+
+    def test_removes_assignments_in_one_delete(self):
+        with CaptureQueriesContext(connection) as queries:
+            dropped = drop_stale_assignments(self.team, {self.leaving.pk})
+
+        deletes = [
+            query for query in queries
+            if query["sql"].startswith("DELETE")
+        ]
+        self.assertEqual(len(deletes), 1)
+        self.assertEqual(dropped, 3)
+        for task in self.tasks:
+            self.assertEqual(list(task.assignees.all()), [self.lead])
+
+    def test_keeps_assignments_in_other_teams(self):
+        drop_stale_assignments(self.team, {self.leaving.pk})
+
+        self.assertEqual(list(self.other_task.assignees.all()), [self.leaving])
+
+    def test_nothing_to_remove(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(drop_stale_assignments(self.team, set()), 0)
+
+    def test_team_update_drops_assignments_of_removed_members(self):
+        self.client.force_login(self.lead)
+
+        response = self.client.post(
+            reverse("task-manager:team-update", kwargs={"pk": self.team.pk}),
+            {"name": self.team.name, "members": [self.lead.pk]},
+            follow=True
+        )
+
+        self.assertContains(
+            response,
+            "Task assignments of former team members will be removed"
+        )
+        self.assertEqual(run_pending_jobs(), [True])
+        self.assertFalse(
+            Task.objects.filter(
+                project=self.project,
+                assignees=self.leaving
+            ).exists()
+        )
+
+
+@override_settings(CACHES=SHARED_CACHES)
+class TeamMembershipCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = User.objects.create_user(
+            username="member",
+            password="pass12345"
+        )
+        cls.team = Team.objects.create(name="Team")
+        cls.other_team = Team.objects.create(name="Other team")
+        cls.team.members.add(cls.member)
+
+    def setUp(self):
+        cache.clear()
+
+    def team_ids(self):
+        return get_user_team_ids(User.objects.get(pk=self.member.pk))
+
+    def test_team_ids_are_cached_across_requests(self):
+        user = User.objects.get(pk=self.member.pk)
+        with self.assertNumQueries(1):
+            self.assertEqual(get_user_team_ids(user), {self.team.pk})
+            self.assertTrue(is_team_member(user, self.team.pk))
+
+        user = User.objects.get(pk=self.member.pk)
+        with self.assertNumQueries(0):
+            self.assertFalse(is_team_member(user, self.other_team.pk))
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_member_changes_invalidate_cache(self):
+        self.team_ids()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other_team.members.add(self.member)
+        self.assertEqual(
+            self.team_ids(),
+            {self.team.pk, self.other_team.pk}
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.team.members.remove(self.member)
+        self.assertEqual(self.team_ids(), {self.other_team.pk})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other_team.members.clear()
+        self.assertEqual(self.team_ids(), set())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.member.teams.add(self.team)
+        self.assertEqual(self.team_ids(), {self.team.pk})
+
+    def test_team_deletion_invalidates_cache(self):
+        self.team_ids()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.team.delete()
+
+        self.assertEqual(self.team_ids(), set())
+
+    def test_cache_is_kept_until_commit(self):
+        self.team_ids()
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.team.members.remove(self.member)
+            self.assertEqual(self.team_ids(), {self.team.pk})
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.team_ids(), set())
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            },
+        }
+    )
+    def test_process_local_cache_is_not_used(self):
+        user = User.objects.get(pk=self.member.pk)
+        get_user_team_ids(user)
+
+        user = User.objects.get(pk=self.member.pk)
+        with self.assertNumQueries(1):
+            self.assertTrue(is_team_member(user, self.team.pk))
+
+    def test_anonymous_user_has_no_teams(self):
+        self.assertEqual(get_user_team_ids(AnonymousUser()), set())
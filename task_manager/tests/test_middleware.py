@@ -0,0 +1,172 @@
+import threading
+
+from django.contrib.auth import get_user_model
+from django.db import connection, connections
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.middleware import (
+    DatabaseUnavailableMiddleware,
+    metrics_registry,
+)
+
+User = get_user_model()
+
+
+class RequestMetricsMiddlewareTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = User.objects.create_user(
+            username="member",
+            password="pass12345"
+        )
+        cls.staff = User.objects.create_user(
+            username="staff",
+            password="pass12345",
+            is_staff=True
+        )
+
+    def setUp(self):
+        metrics_registry.reset()
+
+    @override_settings(REQUEST_METRICS_SERVER_TIMING=True)
+    def test_server_timing_header(self):
+        self.client.force_login(self.member)
+
+        response = self.client.get(reverse("task-manager:task-list"))
+
+        timing = response["Server-Timing"]
+        self.assertIn("db;dur=", timing)
+        self.assertIn("queries", timing)
+        self.assertIn("tpl;dur=", timing)
+        self.assertIn("total;dur=", timing)
+
+    def test_requests_are_aggregated_per_view(self):
+        self.client.force_login(self.member)
+
+        self.client.get(reverse("task-manager:task-list"))
+        self.client.get(reverse("task-manager:task-list"))
+
+        stats = metrics_registry.snapshot()["task-manager:task-list"]
+        self.assertEqual(stats["requests"], 2)
+        self.assertGreater(stats["avg_queries"], 0)
+        self.assertGreater(stats["avg_template_ms"], 0)
+        self.assertEqual(sum(stats["latency_histogram"].values()), 2)
+
+    def test_index_template_time_is_recorded(self):
+        self.client.force_login(self.member)
+
+        self.client.get(reverse("task-manager:index"))
+
+        stats = metrics_registry.snapshot()["task-manager:index"]
+        self.assertGreater(stats["avg_template_ms"], 0)
+
+    def test_streamed_body_queries_are_counted(self):
+        self.client.force_login(self.member)
+        url = reverse("task-manager:task-export")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+            self.assertEqual(metrics_registry.snapshot(), {})
+            b"".join(response.streaming_content)
+
+        stats = metrics_registry.snapshot()["task-manager:task-export"]
+        self.assertEqual(stats["requests"], 1)
+        self.assertEqual(stats["max_queries"], len(queries))
+
+    @override_settings(REQUEST_METRICS_MAX_QUERIES=0)
+    def test_offenders_are_logged(self):
+        self.client.force_login(self.member)
+
+        with self.assertLogs("task_manager.middleware", "WARNING") as logs:
+            self.client.get(reverse("task-manager:task-list"))
+
+        self.assertIn("task-manager:task-list", logs.output[0])
+
+    def test_metrics_endpoint_is_staff_only(self):
+        url = reverse("task-manager:request-metrics")
+
+        self.client.force_login(self.member)
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        self.client.force_login(self.staff)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("task-manager:request-metrics", response.json())
+
+
+class DatabaseUnavailableMiddlewareTests(TestCase):
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        self.request = RequestFactory().get("/tasks/")
+
+    def handle(self, view):
+        # Like Django's handler, which calls process_exception inside the
+        # middleware for exceptions raised by the view.
+        def get_response(request):
+            try:
+                return view()
+            except Exception as error:
+                return middleware.process_exception(request, error)
+
+        middleware = DatabaseUnavailableMiddleware(get_response)
+        return middleware(self.request)
+
+    def fail_to_connect(self, alias, open_first=()):
+        # Connections are per thread, so a new thread can break the
+        # settings of its own connection without affecting the test.
+        result = {}
+
+        def view():
+            for name in open_first:
+                connections[name].ensure_connection()
+            failing = connections[alias]
+            failing.settings_dict = dict(
+                failing.settings_dict, NAME="/nonexistent/db.sqlite3"
+            )
+            with failing.cursor():
+                pass
+
+        def run():
+            result["response"] = self.handle(view)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        return result["response"]
+
+    def test_failed_connection_returns_503(self):
+        with self.assertLogs("task_manager.middleware", "ERROR"):
+            response = self.fail_to_connect("default")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "5")
+
+    def test_failed_replica_connection_returns_503(self):
+        with self.assertLogs("task_manager.middleware", "ERROR") as logs:
+            response = self.fail_to_connect(
+                "replica", open_first=["default"]
+            )
+
+        self.assertEqual(response.status_code, 503)
+        self.assertIn("Database replica unavailable", logs.output[0])
+
+    def test_query_errors_on_open_connection_are_not_handled(self):
+        def view():
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT * FROM missing_table")
+
+        self.assertIsNone(self.handle(view))
+
+    def test_other_exceptions_are_not_handled(self):
+        def view():
+            raise ValueError("boom")
+
+        self.assertIsNone(self.handle(view))
+
+    def test_connections_are_restored_after_the_request(self):
+        self.handle(lambda: None)
+
+        self.assertNotIn("ensure_connection", connection.__dict__)
@@ -0,0 +1,161 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.models import Team, Project, Task
+from task_manager.pagination import KeysetPaginator, encode_cursor
+
+User = get_user_model()
+
+
+class KeysetPaginatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.team = Team.objects.create(name="Team")
+        cls.project = Project.objects.create(name="Project", team=cls.team)
+        for index in range(7):
+            Task.objects.create(
+                name=f"Task {index % 3}",
+                project=cls.project,
+                is_completed=index % 2 == 0,
+            )
+        cls.ordered = list(Task.objects.order_by("is_completed", "name", "id"))
+        cls.ordered_by_pk = list(Task.objects.order_by("id"))
+
+    def walk_forward(self, paginator):
+        rows, cursor = [], None
+        while True:
+            page = paginator.page(cursor)
+            rows.extend(page)
+            if not page.has_next():
+                return rows, page
+            cursor = page.next_cursor
+
+    def test_pages_follow_model_ordering_with_pk_tie_breaker(self):
+        paginator = KeysetPaginator(Task.objects.all(), 3)
+
+        rows, last_page = self.walk_forward(paginator)
+
+        self.assertEqual(rows, self.ordered)
+        self.assertEqual(len(last_page), 1)
+
+    def test_previous_cursor_returns_preceding_page(self):
+        paginator = KeysetPaginator(Task.objects.all(), 3)
+        first = paginator.page()
+        second = paginator.page(first.next_cursor)
+
+        back = paginator.page(second.previous_cursor)
+
+        self.assertEqual(list(back), list(first))
+        self.assertFalse(back.has_previous())
+        self.assertTrue(back.has_next())
+
+    def test_deep_page_does_not_count_or_offset(self):
+        paginator = KeysetPaginator(Task.objects.all(), 3)
+        cursor = paginator.page().next_cursor
+
+        with CaptureQueriesContext(connection) as queries:
+            paginator.page(cursor)
+
+        self.assertEqual(len(queries), 1)
+        sql = queries[0]["sql"].upper()
+        self.assertNotIn("COUNT(", sql)
+        self.assertNotIn("OFFSET", sql)
+
+    def test_non_field_ordering_falls_back_to_offset_cursor(self):
+        queryset = Task.objects.extra(
+            select={"rank": "1"}, order_by=["rank", "id"]
+        )
+        paginator = KeysetPaginator(queryset, 3)
+
+        rows, _ = self.walk_forward(paginator)
+
+        self.assertFalse(paginator.is_keyset)
+        self.assertEqual(len(rows), 7)
+
+    async def test_async_pages_match_sync_pages(self):
+        ranked = Task.objects.extra(
+            select={"rank": "1"}, order_by=["rank", "id"]
+        )
+        for queryset, ordered in (
+            (Task.objects.all(), self.ordered),
+            (ranked, self.ordered_by_pk),
+        ):
+            paginator = KeysetPaginator(queryset, 3)
+            first = await paginator.apage()
+            second = await paginator.apage(first.next_cursor)
+            back = await paginator.apage(second.previous_cursor)
+
+            with self.subTest(keyset=paginator.is_keyset):
+                self.assertEqual([*first, *second], ordered[:6])
+                self.assertEqual(list(back), list(first))
+                self.assertFalse(back.has_previous())
+
+    def test_approximate_count(self):
+        paginator = KeysetPaginator(Task.objects.all(), 3)
+
+        self.assertEqual(paginator.approximate_count, 7)
+        self.assertFalse(paginator.approximate_count_is_capped)
+
+
+class KeysetPaginationViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = User.objects.create_user(
+            username="member",
+            password="pass12345"
+        )
+        cls.team = Team.objects.create(name="Team")
+        cls.project = Project.objects.create(name="Project", team=cls.team)
+        for index in range(6):
+            Task.objects.create(name=f"Task {index}", project=cls.project)
+
+    def setUp(self):
+        self.client.force_login(self.member)
+
+    def test_task_list_links_to_next_cursor(self):
+        url = reverse("task-manager:task-list")
+        response = self.client.get(url)
+        page = response.context["page_obj"]
+
+        self.assertTrue(response.context["is_paginated"])
+        self.assertContains(response, f"cursor={page.next_cursor}")
+
+        response = self.client.get(url, {"cursor": page.next_cursor})
+
+        self.assertEqual(
+            [task.name for task in response.context["task_list"]],
+            ["Task 5"]
+        )
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get(
+            reverse("task-manager:task-list"),
+            {"cursor": "not-a-cursor"}
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_crafted_cursor_values_are_rejected(self):
+        list_url = reverse("task-manager:task-list")
+        api_url = reverse(
+            "task-manager:api-list", kwargs={"resource": "tasks"}
+        )
+        for data, search in (
+            ({"k": ["abc", "x", "y"]}, ""),
+            ({"k": [True, "x", "notint"]}, ""),
+            ({"k": [True, "x", 10 ** 30]}, ""),
+            ({"k": [True, ["x"], 1]}, ""),
+            ({"o": 10 ** 30}, "Task"),
+            ({"o": True}, "Task"),
+        ):
+            params = {"cursor": encode_cursor(data), "name": search}
+            with self.subTest(data=data):
+                self.assertEqual(
+                    self.client.get(list_url, params).status_code, 404
+                )
+                self.assertEqual(
+                    self.client.get(api_url, params).status_code, 400
+                )
@@ -0,0 +1,88 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.models import Team, Project, Task, Tag, TaskType
+
+User = get_user_model()
+
+
+class TaskListQueryCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.member = User.objects.create_user(
+                username="member",
+                password="pass12345"
+            )
+            cls.other = User.objects.create_user(
+                username="other",
+                password="pass12345"
+            )
+            cls.team = Team.objects.create(name="Team")
+            cls.team.members.add(cls.member, cls.other)
+            cls.project = Project.objects.create(
+                name="Project", team=cls.team
+            )
+            cls.tag = Tag.objects.create(name="backend")
+            cls.extra_tag = Tag.objects.create(name="api")
+            cls.task_type = TaskType.objects.create(name="Bug")
+
+    def setUp(self):
+        self.client.force_login(self.member)
+
+    def create_tasks(self, count):
+        for _ in range(count):
+            task = Task.objects.create(
+                name=f"Task {Task.objects.count()}",
+                project=self.project,
+                task_type=self.task_type,
+            )
+            task.tags.add(self.tag, self.extra_tag)
+            task.assignees.add(self.member, self.other)
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries), response
+
+    def test_query_count_does_not_grow_with_rows(self):
+        urls = {
+            "task-list": reverse("task-manager:task-list"),
+            "tag-detail": reverse(
+                "task-manager:tag-detail",
+                kwargs={"pk": self.tag.pk}
+            ),
+            "task-type-detail": reverse(
+                "task-manager:task-type-detail",
+                kwargs={"pk": self.task_type.pk}
+            ),
+        }
+
+        self.create_tasks(1)
+        # Load the process-local reference tables; retagging tasks later on
+        # does not reload them.
+        for url in urls.values():
+            self.count_queries(url)
+        single_row = {
+            name: self.count_queries(url)[0] for name, url in urls.items()
+        }
+
+        self.create_tasks(4)
+        for name, url in urls.items():
+            with self.subTest(view=name):
+                queries, response = self.count_queries(url)
+                self.assertEqual(len(response.context["task_list"]), 5)
+                self.assertEqual(queries, single_row[name])
+
+    def test_rows_show_assignee_count(self):
+        self.create_tasks(1)
+
+        _, response = self.count_queries(reverse("task-manager:task-list"))
+
+        self.assertEqual(response.context["task_list"][0].assignee_count, 2)
+        self.assertContains(response, "2 Assignees")
+        self.assertContains(response, "#backend")
@@ -0,0 +1,126 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.forms import TaskForm
+from task_manager.models import Team, Project, Task, Tag, TaskType
+from task_manager.reference import attach_task_references, reference_table
+from task_manager.versions import bump_row_versions
+
+User = get_user_model()
+
+
+class ReferenceTableTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.member = User.objects.create_user(
+                username="member",
+                password="pass12345"
+            )
+            cls.team = Team.objects.create(name="Team")
+            cls.team.members.add(cls.member)
+            cls.project = Project.objects.create(
+                name="Project", team=cls.team
+            )
+            cls.bug = TaskType.objects.create(name="Bug")
+            cls.feature = TaskType.objects.create(name="Feature")
+            cls.ui = Tag.objects.create(name="ui")
+            cls.api = Tag.objects.create(name="api")
+            cls.task = Task.objects.create(
+                name="Task",
+                project=cls.project,
+                task_type=cls.bug
+            )
+            cls.task.tags.add(cls.ui, cls.api)
+
+    def test_table_is_reused_while_version_is_unchanged(self):
+        reference_table(TaskType)
+
+        with self.assertNumQueries(1):
+            table = reference_table(TaskType)
+
+        self.assertEqual(
+            [task_type.name for task_type in table.objects],
+            ["Bug", "Feature"]
+        )
+        self.assertEqual(table.by_id[self.bug.pk].name, "Bug")
+
+    def test_save_invalidates_table(self):
+        reference_table(TaskType)
+
+        self.feature.name = "Story"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.feature.save()
+
+        self.assertEqual(
+            reference_table(TaskType).by_id[self.feature.pk].name, "Story"
+        )
+
+    def test_version_bump_from_another_process_invalidates_table(self):
+        reference_table(Tag)
+        Tag.objects.filter(pk=self.ui.pk).update(name="frontend")
+
+        self.assertEqual(reference_table(Tag).by_id[self.ui.pk].name, "ui")
+        with self.captureOnCommitCallbacks(execute=True):
+            bump_row_versions(Tag)
+        self.assertEqual(
+            reference_table(Tag).by_id[self.ui.pk].name, "frontend"
+        )
+
+    def test_retagging_tasks_keeps_table(self):
+        reference_table(Tag)
+
+        self.task.tags.remove(self.api)
+        Task.objects.create(name="Other", project=self.project).tags.add(
+            self.api
+        )
+
+        with self.assertNumQueries(1):
+            reference_table(Tag)
+
+    def test_attach_task_references(self):
+        task = Task.objects.get(pk=self.task.pk)
+        attach_task_references([task])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(task.task_type.name, "Bug")
+            self.assertEqual(
+                [tag.name for tag in task.tag_list], ["api", "ui"]
+            )
+
+    def test_task_list_does_not_join_reference_tables(self):
+        self.client.force_login(self.member)
+        url = reverse("task-manager:task-list")
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {"name": "Task"})
+
+        self.assertContains(response, "#api")
+        for query in queries:
+            self.assertNotIn('JOIN "task_manager_tasktype"', query["sql"])
+            self.assertNotIn('JOIN "task_manager_tag"', query["sql"])
+
+    def test_form_choices_come_from_the_table(self):
+        reference_table(TaskType)
+        form = TaskForm(project=self.project)
+
+        with CaptureQueriesContext(connection) as queries:
+            html = str(form["task_type"])
+
+        self.assertIn("Feature", html)
+        self.assertFalse(
+            any("task_manager_tasktype" in q["sql"] for q in queries)
+        )
+
+    def test_unknown_reference_detail_is_404(self):
+        self.client.force_login(self.member)
+
+        response = self.client.get(
+            reverse("task-manager:tag-detail", args=[999999])
+        )
+
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,166 @@
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils.connection import ConnectionDoesNotExist
+
+from task_manager.membership import get_user_team_ids
+from task_manager.middleware import ReplicaPinningMiddleware
+from task_manager.models import Tag, Task, Team
+from task_manager.reference import reference_table
+from task_manager.routers import ReplicaRouter, replica_reads
+
+User = get_user_model()
+
+
+class FixedLagRouter(ReplicaRouter):
+    def __init__(self, lags):
+        super().__init__()
+        self.lags = lags
+
+    def measure_lag(self, alias):
+        return self.lags[alias]
+
+
+@override_settings(
+    DATABASE_REPLICAS=["replica"],
+    DATABASE_REPLICA_CHECK_INTERVAL=0,
+)
+class ReplicaRouterTests(TestCase):
+    def setUp(self):
+        self.router = ReplicaRouter()
+
+    def test_reads_outside_requests_use_primary(self):
+        self.assertIsNone(self.router.db_for_read(Task))
+        self.assertEqual(Task.objects.all().db, "default")
+
+    def test_each_block_reads_from_one_replica(self):
+        databases = []
+        with override_settings(DATABASE_REPLICAS=["replica", "default"]):
+            for _ in range(2):
+                with replica_reads():
+                    databases.append({
+                        self.router.db_for_read(Task) for _ in range(3)
+                    })
+
+        self.assertEqual(databases, [{"replica"}, {"default"}])
+
+    @override_settings(
+        DATABASE_REPLICAS=["near", "far"],
+        DATABASE_REPLICA_MAX_LAG=5,
+    )
+    def test_replica_lagging_past_limit_is_skipped(self):
+        router = FixedLagRouter({"near": 1, "far": 30})
+        databases = set()
+
+        with self.assertLogs("task_manager.routers"):
+            for _ in range(4):
+                with replica_reads():
+                    databases.add(router.db_for_read(Task))
+
+        self.assertEqual(databases, {"near"})
+
+    def test_writes_pin_later_reads_to_primary(self):
+        with replica_reads() as state:
+            self.assertEqual(Task.objects.all().db, "replica")
+            Tag.objects.create(name="pinned")
+            self.assertEqual(Task.objects.all().db, "default")
+
+        self.assertTrue(state.wrote)
+
+    def test_select_for_update_uses_primary(self):
+        with replica_reads():
+            self.assertEqual(
+                Task.objects.select_for_update().db, "default"
+            )
+
+    @override_settings(DATABASE_REPLICA_MAX_LAG=-1)
+    def test_lagging_replicas_fall_back_to_primary(self):
+        with replica_reads(), self.assertLogs("task_manager.routers"):
+            self.assertEqual(self.router.db_for_read(Task), "default")
+
+    def test_unknown_replica_alias_is_a_configuration_error(self):
+        with override_settings(DATABASE_REPLICAS=["missing"]):
+            with replica_reads(), self.assertRaises(
+                ConnectionDoesNotExist
+            ):
+                self.router.db_for_read(Task)
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+class CacheFillingReadsTests(TestCase):
+    # Only "default" is allowed here, so a query on "replica" would fail.
+
+    def test_reference_table_reads_primary(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Tag.objects.create(name="backend")
+
+        with replica_reads():
+            table = reference_table(Tag)
+
+        self.assertEqual([tag.name for tag in table.objects], ["backend"])
+
+    def test_team_ids_read_primary(self):
+        member = User.objects.create_user(
+            username="member",
+            password="pass12345"
+        )
+        team = Team.objects.create(name="Core")
+        team.members.add(member)
+
+        with replica_reads():
+            self.assertEqual(get_user_team_ids(member), {team.pk})
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+class ReplicaPinningMiddlewareTests(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.databases_used = []
+
+    def view(self, request):
+        self.databases_used.append(Task.objects.all().db)
+        if request.method == "POST":
+            Tag.objects.create(name="new")
+            self.databases_used.append(Tag.objects.all().db)
+        return HttpResponse()
+
+    def handle(self, request):
+        return ReplicaPinningMiddleware(self.view)(request)
+
+    def test_get_reads_from_replica(self):
+        response = self.handle(self.factory.get("/tasks/"))
+
+        self.assertEqual(self.databases_used, ["replica"])
+        self.assertNotIn("pin_primary", response.cookies)
+
+    def test_post_is_pinned_and_sets_cookie(self):
+        response = self.handle(self.factory.post("/tasks/create/"))
+
+        self.assertEqual(self.databases_used, ["default", "default"])
+        cookie = response.cookies["pin_primary"]
+        self.assertEqual(cookie["max-age"], 10)
+        self.assertTrue(cookie["httponly"])
+
+    def test_redirect_after_write_reads_from_primary(self):
+        request = self.factory.get("/tasks/1/")
+        request.COOKIES["pin_primary"] = "1"
+
+        self.handle(request)
+
+        self.assertEqual(self.databases_used, ["default"])
+
+    def test_client_requests_pass_through_router(self):
+        member = User.objects.create_user(
+            username="member",
+            password="pass12345"
+        )
+
+        response = self.client.post(
+            "/accounts/login/",
+            {"username": "member", "password": "pass12345"}
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertIn("pin_primary", response.cookies)
+        member.refresh_from_db()
+        self.assertIsNotNone(member.last_login)
@@ -0,0 +1,95 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from task_manager.models import Team, Project, Task, TaskType, Tag
+from task_manager.search import search_tasks
+
+User = get_user_model()
+
+
+class TaskSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = User.objects.create_user(
+            username="member",
+            password="pass12345"
+        )
+        cls.team = Team.objects.create(name="Team")
+        cls.team.members.add(cls.member)
+        cls.project = Project.objects.create(name="Project", team=cls.team)
+
+        cls.bug = TaskType.objects.create(name="Bug")
+        cls.backend = Tag.objects.create(name="backend")
+
+        cls.login_task = Task.objects.create(
+            name="Fix login form",
+            project=cls.project,
+        )
+        cls.typed_task = Task.objects.create(
+            name="Crash on startup",
+            project=cls.project,
+            task_type=cls.bug,
+        )
+        cls.tagged_task = Task.objects.create(
+            name="Cache warmup",
+            description="Warm the login cache on deploy",
+            project=cls.project,
+        )
+        cls.tagged_task.tags.add(cls.backend)
+
+    def search(self, query):
+        return list(search_tasks(Task.objects.all(), query))
+
+    def test_matches_name_prefix(self):
+        self.assertEqual(
+            self.search("logi"),
+            [self.login_task, self.tagged_task]
+        )
+
+    def test_name_match_ranks_above_description_match(self):
+        results = self.search("login")
+
+        self.assertEqual(results[0], self.login_task)
+
+    def test_matches_task_type_and_tag_names(self):
+        self.assertEqual(self.search("bug"), [self.typed_task])
+        self.assertEqual(self.search("backend"), [self.tagged_task])
+
+    def test_all_terms_must_match(self):
+        self.assertEqual(self.search("login cache"), [self.tagged_task])
+
+    def test_document_follows_tag_changes(self):
+        self.tagged_task.tags.remove(self.backend)
+        self.assertEqual(self.search("backend"), [])
+
+        self.backend.tasks.add(self.login_task)
+        self.backend.name = "server"
+        self.backend.save()
+
+        self.assertEqual(self.search("backend"), [])
+        self.assertEqual(self.search("server"), [self.login_task])
+
+    def test_document_follows_task_type_deletion(self):
+        self.bug.delete()
+
+        self.assertEqual(self.search("bug"), [])
+
+    def test_document_follows_task_rename(self):
+        self.login_task.name = "Fix signup form"
+        self.login_task.save()
+
+        self.assertEqual(self.search("signup"), [self.login_task])
+
+    def test_task_list_view_uses_search(self):
+        self.client.force_login(self.member)
+
+        response = self.client.get(
+            reverse("task-manager:task-list"),
+            {"name": "crash"}
+        )
+
+        self.assertEqual(
+            list(response.context["task_list"]),
+            [self.typed_task]
+        )
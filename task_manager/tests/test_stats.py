@@ -0,0 +1,82 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from task_manager.models import Team, Project, Task, Position
+from task_manager.stats import get_dashboard_stats
+
+User = get_user_model()
+
+
+@override_settings(DASHBOARD_STATS_CACHE_TIMEOUT=300)
+class DashboardStatsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = User.objects.create_user(
+            username="member",
+            password="pass12345"
+        )
+        Position.objects.create(name="Developer")
+        cls.team = Team.objects.create(name="Team")
+        cls.project = Project.objects.create(name="Project", team=cls.team)
+        Task.objects.create(
+            name="Open",
+            project=cls.project,
+            priority=Task.PriorityChoices.URGENT,
+        )
+        Task.objects.create(
+            name="Overdue",
+            project=cls.project,
+            deadline=timezone.now() - timedelta(days=1),
+        )
+        Task.objects.create(
+            name="Done",
+            project=cls.project,
+            is_completed=True,
+            deadline=timezone.now() - timedelta(days=1),
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_stats_are_computed_in_one_query(self):
+        with self.assertNumQueries(1):
+            stats = get_dashboard_stats()
+
+        self.assertEqual(stats["num_teams"], 1)
+        self.assertEqual(stats["num_workers"], 1)
+        self.assertEqual(stats["num_positions"], 1)
+        self.assertEqual(stats["num_projects"], 1)
+        self.assertEqual(stats["num_tasks"], 3)
+        self.assertEqual(stats["num_open_tasks"], 2)
+        self.assertEqual(stats["num_completed_tasks"], 1)
+        self.assertEqual(stats["num_overdue_tasks"], 1)
+        self.assertEqual(
+            stats["tasks_by_priority"],
+            [("Urgent", 1), ("High", 0), ("Medium", 2), ("Low", 0)]
+        )
+
+    def test_cached_stats_cost_no_queries(self):
+        get_dashboard_stats()
+
+        with self.assertNumQueries(0):
+            get_dashboard_stats()
+
+    def test_task_change_invalidates_cache(self):
+        get_dashboard_stats()
+
+        Task.objects.create(name="New", project=self.project)
+
+        self.assertEqual(get_dashboard_stats()["num_tasks"], 4)
+
+    def test_index_renders_stats(self):
+        self.client.force_login(self.member)
+
+        response = self.client.get(reverse("task-manager:index"))
+
+        self.assertEqual(response.context["num_tasks"], 3)
+        self.assertContains(response, "Overdue tasks")
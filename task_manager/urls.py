@@ -1,4 +1,11 @@
 from django.urls import path
+
+from task_manager.api import API_VERSION, ApiListView, ApiDetailView
+from task_manager.autocomplete import (
+    TagAutocompleteView,
+    TeamAutocompleteView,
+    WorkerAutocompleteView,
+)
 from task_manager.views import (
     index,
     WorkerListView,
@@ -10,6 +17,8 @@ from task_manager.views import (
     WorkerDetailView,
     PositionDetailView,
     ProjectDetailView,
+    ProjectBoardView,
+    ProjectBoardColumnView,
     TeamDetailView,
     PositionCreateView,
     TeamCreateView,
@@ -37,17 +46,29 @@ from task_manager.views import (
     TagDeleteView,
     TaskTypeDeleteView,
     change_task_status,
+    move_board_task,
     TaskCreateSelectTeamView,
     TaskCreateSelectProjectView,
     ProjectCreateSelectTeamView,
     UserTeamListView,
-    UserProjectListView
+    UserProjectListView,
+    RequestMetricsView,
+    TaskExportView,
+    ProjectExportView,
+    WorkerExportView,
+    TaskImportView,
+    TaskBulkView
 )
 
 
 urlpatterns = [
     path("", index, name="index"),
     path("workers/", WorkerListView.as_view(), name="worker-list"),
+    path(
+        "workers/export/",
+        WorkerExportView.as_view(),
+        name="worker-export"
+    ),
     path(
         "workers/<int:pk>/",
         WorkerDetailView.as_view(),
@@ -64,6 +85,11 @@ urlpatterns = [
         name="worker-create"
     ),
     path("tasks/", TaskListView.as_view(), name="task-list"),
+    path(
+        "tasks/export/",
+        TaskExportView.as_view(),
+        name="task-export"
+    ),
     path(
         "tasks/create/select-team/",
         TaskCreateSelectTeamView.as_view(),
@@ -80,12 +106,22 @@ urlpatterns = [
         TaskCreateView.as_view(),
         name="task-create"
     ),
+    path(
+        "projects/<int:project_pk>/tasks/import/",
+        TaskImportView.as_view(),
+        name="task-import"
+    ),
     path(
         "tasks/<int:pk>/update/",
         TaskUpdateView.as_view(),
         name="task-update"
     ),
     path("projects/", ProjectListView.as_view(), name="project-list"),
+    path(
+        "projects/export/",
+        ProjectExportView.as_view(),
+        name="project-export"
+    ),
     path(
         "projects/my-projects/",
         UserProjectListView.as_view(),
@@ -101,6 +137,16 @@ urlpatterns = [
         ProjectDetailView.as_view(),
         name="project-detail"
     ),
+    path(
+        "projects/<int:pk>/board/",
+        ProjectBoardView.as_view(),
+        name="project-board"
+    ),
+    path(
+        "projects/<int:pk>/board/<str:column>/",
+        ProjectBoardColumnView.as_view(),
+        name="project-board-column"
+    ),
     path(
         "teams/<int:team_pk>/projects/create/",
         ProjectCreateView.as_view(),
@@ -227,7 +273,47 @@ urlpatterns = [
         "tasks/<int:pk>/change-status/",
         change_task_status,
         name="task-change-status"
-    )
+    ),
+    path(
+        "tasks/bulk/",
+        TaskBulkView.as_view(),
+        name="task-bulk"
+    ),
+    path(
+        "tasks/<int:pk>/move/",
+        move_board_task,
+        name="task-move"
+    ),
+    path(
+        f"api/{API_VERSION}/<slug:resource>/",
+        ApiListView.as_view(),
+        name="api-list"
+    ),
+    path(
+        f"api/{API_VERSION}/<slug:resource>/<int:pk>/",
+        ApiDetailView.as_view(),
+        name="api-detail"
+    ),
+    path(
+        "autocomplete/workers/",
+        WorkerAutocompleteView.as_view(),
+        name="worker-autocomplete"
+    ),
+    path(
+        "autocomplete/tags/",
+        TagAutocompleteView.as_view(),
+        name="tag-autocomplete"
+    ),
+    path(
+        "autocomplete/teams/",
+        TeamAutocompleteView.as_view(),
+        name="team-autocomplete"
+    ),
+    path(
+        "metrics/requests/",
+        RequestMetricsView.as_view(),
+        name="request-metrics"
+    ),
 
 ]
 
@@ -0,0 +1,127 @@
+import hashlib
+import threading
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from task_manager.models import (
+    ModelVersion,
+    Position,
+    Project,
+    Tag,
+    Task,
+    TaskType,
+    Team,
+    Worker,
+)
+
+
+VERSIONED_MODELS = (Position, Project, Tag, Task, TaskType, Team, Worker)
+
+_pending = threading.local()
+
+
+def _label(model):
+    return model._meta.label_lower
+
+
+def rows_label(model):
+    # Bumped only when rows of the model itself are saved or deleted, not
+    # when their relations change.
+    return f"{_label(model)}:rows"
+
+
+def _bump(labels):
+    # Bumped once per label after the transaction commits: bumping inside
+    # it would lock the shared ModelVersion rows until the commit and
+    # serialize every writer. Labels of rolled back work are bumped with
+    # the next commit, which only costs a spurious cache miss.
+    pending = getattr(_pending, "labels", None)
+    if pending is None:
+        pending = _pending.labels = set()
+    pending.update(labels)
+    transaction.on_commit(_flush)
+
+
+def _flush():
+    labels = sorted(_pending.__dict__.pop("labels", ()))
+    if not labels:
+        return
+    changed_at = timezone.now()
+    updated = ModelVersion.objects.filter(label__in=labels).update(
+        version=F("version") + 1,
+        changed_at=changed_at,
+    )
+    if updated < len(labels):
+        ModelVersion.objects.bulk_create(
+            [
+                ModelVersion(label=label, version=1, changed_at=changed_at)
+                for label in labels
+            ],
+            ignore_conflicts=True,
+        )
+
+
+def bump_versions(*models):
+    _bump(_label(model) for model in models)
+
+
+def bump_row_versions(*models):
+    _bump(rows_label(model) for model in models)
+
+
+def _rows(labels, using=None):
+    return (
+        ModelVersion.objects
+        .using(using)
+        .filter(label__in=labels)
+        .values_list("label", "version", "changed_at")
+    )
+
+
+def _versions(labels, rows):
+    rows = dict(
+        (label, (version, changed_at))
+        for label, version, changed_at in rows
+    )
+    return {label: rows.get(label, (0, None)) for label in labels}
+
+
+def _get(labels, using=None):
+    labels = sorted(set(labels))
+    return _versions(labels, _rows(labels, using))
+
+
+def get_versions(*models):
+    return _get(_label(model) for model in models)
+
+
+async def aget_versions(*models):
+    labels = sorted({_label(model) for model in models})
+    return _versions(labels, [row async for row in _rows(labels)])
+
+
+def get_row_versions(*models):
+    # Read from the primary: they key process-wide snapshots, which must
+    # not be labelled with a version a lagging replica has not reached.
+    versions = _get(
+        (rows_label(model) for model in models), using=DEFAULT_DB_ALIAS
+    )
+    return {_label(model): versions[rows_label(model)] for model in models}
+
+
+def versions_etag(versions, *extra):
+    parts = [str(part) for part in extra]
+    parts.extend(
+        f"{label}:{version}" for label, (version, _) in versions.items()
+    )
+    digest = hashlib.md5(
+        "|".join(parts).encode(), usedforsecurity=False
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def versions_last_modified(versions):
+    changed = [changed_at for _, changed_at in versions.values() if changed_at]
+    return max(changed) if changed else None
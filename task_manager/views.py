@@ -1,12 +1,19 @@
+import codecs
+import csv
+import json
+
+from django.contrib import messages
 from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import PermissionDenied
-from django.db.models import (
-    Q, When, Value, Case,
-    IntegerField, Count, Prefetch
-)
-from django.shortcuts import render, get_object_or_404, redirect
+from django.db import transaction
+from django.db.models import Count, Prefetch, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404, redirect
+from django.template.defaultfilters import pluralize
+from django.template.response import TemplateResponse
 from django.urls import reverse_lazy, reverse
 from django.views import generic
 from django.views.decorators.http import require_POST
@@ -29,9 +36,41 @@ from task_manager.forms import (
     TaskTypeForm,
     PositionForm,
     ChooseTeamForm,
-    ChooseProjectForm
+    ChooseProjectForm,
+    TaskImportForm,
+    TaskBulkForm
+)
+from task_manager.mixins import (
+    AsyncConditionalGetMixin,
+    AsyncDetailMixin,
+    AsyncListMixin,
+    AsyncLoginRequiredMixin,
+    ConditionalGetMixin,
+    NextUrlRedirectMixin,
+    StaffRequiredMixin,
+    KeysetPaginationMixin
+)
+from task_manager.membership import get_user_team_ids, is_team_member
+from task_manager.board import (
+    BOARD_COLUMNS,
+    BOARD_PAGE_SIZE,
+    column_counts,
+    column_tasks,
+    is_board_column,
+    move_task,
+)
+from task_manager.bulk import BulkActionError, apply_bulk_action
+from task_manager.exports import EXPORT_FORMATS, export_lines
+from task_manager.imports import guess_format, import_tasks
+from task_manager.jobs import enqueue
+from task_manager.middleware import metrics_registry
+from task_manager.reference import (
+    attach_references,
+    attach_task_references,
+    get_reference_or_none,
 )
-from task_manager.mixins import NextUrlRedirectMixin, StaffRequiredMixin
+from task_manager.search import search_tasks
+from task_manager.stats import aget_dashboard_stats
 from task_manager.models import (
     Task,
     Project,
@@ -46,38 +85,53 @@ from task_manager.models import (
 def _ensure_team_member(user, team: Team) -> None:
     if not user.is_authenticated:
         raise PermissionDenied
-    if not team.members.filter(pk=user.pk).exists():
+    if not is_team_member(user, team.pk):
         raise PermissionDenied
 
 
+def _task_list_queryset():
+    assignee_count = (
+        Task.assignees.through.objects
+        .filter(task=OuterRef("pk"))
+        .order_by()
+        .values("task")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return (
+        Task.objects
+        .select_related("project")
+        .annotate(
+            assignee_count=Coalesce(Subquery(assignee_count), Value(0))
+        )
+    )
+
+
 @login_required
-def index(request):
-
-    num_teams = Team.objects.count()
-    num_workers = Worker.objects.count()
-    num_positions = Position.objects.count()
-    num_projects = Project.objects.count()
-    num_tasks = Task.objects.count()
-
-    context = {
-        "num_teams": num_teams,
-        "num_workers": num_workers,
-        "num_positions": num_positions,
-        "num_projects": num_projects,
-        "num_tasks": num_tasks,
-    }
+async def index(request):
+    # The counts are a single cached statement, which is cheaper than one
+    # acount() per model: the async ORM runs those one after the other on
+    # the request's sync thread anyway.
+    context = await aget_dashboard_stats()
 
-    return render(request, "task_manager/index.html", context=context)
+    return TemplateResponse(request, "task_manager/index.html", context)
 
 
-class WorkerListView(LoginRequiredMixin, generic.ListView):
+class WorkerListView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    KeysetPaginationMixin,
+    generic.ListView
+):
     model = get_user_model()
+    conditional_models = (Worker, Position)
     paginate_by = 5
 
     def get_context_data(
         self, *, object_list=None, **kwargs
     ):
         context = super(WorkerListView, self).get_context_data(**kwargs)
+        attach_references(context["object_list"], "position")
         username = self.request.GET.get("username", "")
         context["search_form"] = WorkerUsernameSearchForm(
             initial={"username": username}
@@ -86,11 +140,7 @@ class WorkerListView(LoginRequiredMixin, generic.ListView):
         return context
 
     def get_queryset(self):
-        queryset = (
-            super()
-            .get_queryset()
-            .select_related("position")
-        )
+        queryset = super().get_queryset()
         form = WorkerUsernameSearchForm(self.request.GET)
         if form.is_valid():
             return queryset.filter(
@@ -147,10 +197,7 @@ class WorkerDeleteView(StaffRequiredMixin, generic.DeleteView):
     context_object_name = "worker"
 
     def _get_last_member_teams(self, worker):
-        worker_team_ids = worker.teams.values_list("id", flat=True)
-        return Team.objects.filter(id__in=worker_team_ids).annotate(
-            member_count=Count("members", distinct=True)
-        ).filter(member_count=1).order_by("name")
+        return worker.teams.filter(member_count=1).order_by("name")
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -172,76 +219,56 @@ class WorkerDeleteView(StaffRequiredMixin, generic.DeleteView):
             .values_list("id", flat=True)
         )
 
-        response = super().form_valid(form)
-
-        Team.objects.annotate(
-            member_count=Count(
-                "members", distinct=True)
-        ).filter(
-            id__in=last_team_ids,
-            member_count=0
-        ).delete()
+        with transaction.atomic():
+            response = super().form_valid(form)
+            if last_team_ids:
+                enqueue("delete_empty_teams", team_ids=last_team_ids)
 
         return response
 
 
-class TaskListView(LoginRequiredMixin, generic.ListView):
+class TaskListView(
+    AsyncLoginRequiredMixin,
+    AsyncConditionalGetMixin,
+    AsyncListMixin,
+    KeysetPaginationMixin,
+    generic.ListView
+):
     model = Task
+    conditional_models = (Task, Project, TaskType, Tag)
     paginate_by = 5
+    paginate_with_count = True
 
     def get_context_data(
         self, *, object_list=None, **kwargs
     ):
         context = super(TaskListView, self).get_context_data(**kwargs)
+        attach_task_references(context["task_list"])
         name = self.request.GET.get("name", "")
         context["search_form"] = TaskNameSearchForm(initial={"name": name})
+        context["bulk_form"] = TaskBulkForm()
         context["search_query"] = name
         return context
 
     def get_queryset(self):
-        queryset = (
-            Task.objects
-            .select_related("task_type", "project")
-            .prefetch_related("assignees", "tags")
-        )
+        queryset = _task_list_queryset()
         form = TaskNameSearchForm(self.request.GET)
         if form.is_valid():
             query = form.cleaned_data.get("name")
             if query:
-                queryset = (
-                    queryset
-                    .filter(
-                        Q(name__icontains=query) |
-                        Q(task_type__name__icontains=query) |
-                        Q(tags__name__icontains=query)
-                    )
-                    .annotate(
-                        search_rank=Case(
-                            When(
-                                name__icontains=query,
-                                then=Value(1)
-                            ),
-                            When(
-                                task_type__name__icontains=query,
-                                then=Value(2)
-                            ),
-                            When(
-                                tags__name__icontains=query,
-                                then=Value(3)
-                            ),
-                            default=Value(4),
-                            output_field=IntegerField(),
-                        )
-                    )
-                    .order_by("search_rank", "name")
-                    .distinct()
-                )
+                queryset = search_tasks(queryset, query)
 
         return queryset
 
 
-class TaskDetailView(LoginRequiredMixin, generic.DetailView):
+class TaskDetailView(
+    AsyncLoginRequiredMixin,
+    AsyncConditionalGetMixin,
+    AsyncDetailMixin,
+    generic.DetailView
+):
     model = Task
+    conditional_models = (Task, TaskType, Project, Team, Tag, Worker, Position)
     queryset = (
         Task.objects
         .select_related("task_type", "project", "project__team")
@@ -256,10 +283,8 @@ class TaskDetailView(LoginRequiredMixin, generic.DetailView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["task_in_project_user_team"] = (
-            self.object.project.team.members.filter(
-                pk=self.request.user.pk
-            ).exists()
+        context["task_in_project_user_team"] = is_team_member(
+            self.request.user, self.object.project.team_id
         )
         return context
 
@@ -292,6 +317,121 @@ class TaskCreateView(LoginRequiredMixin, generic.CreateView):
         )
 
 
+class TaskImportView(LoginRequiredMixin, generic.FormView):
+    form_class = TaskImportForm
+    template_name = "task_manager/task_import_form.html"
+    errors_shown = 10
+
+    def dispatch(self, request, *args, **kwargs):
+        self.project = get_object_or_404(
+            Project.objects.select_related("team"),
+            pk=self.kwargs["project_pk"]
+        )
+        _ensure_team_member(request.user, self.project.team)
+        return super().dispatch(request, *args, **kwargs)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["project"] = self.project
+        return context
+
+    def form_valid(self, form):
+        upload = form.cleaned_data["file"]
+        try:
+            result = import_tasks(
+                self.project,
+                codecs.iterdecode(upload, "utf-8-sig"),
+                guess_format(upload.name)
+            )
+        except (UnicodeDecodeError, csv.Error) as error:
+            form.add_error("file", f"Could not read the file: {error}")
+            return self.form_invalid(form)
+
+        messages.success(
+            self.request,
+            f"Imported {result.created} task{pluralize(result.created)}."
+        )
+        if result.errors:
+            details = "; ".join(
+                f"line {line}: {error}"
+                for line, error in result.errors[:self.errors_shown]
+            )
+            if len(result.errors) > self.errors_shown:
+                details += "; ..."
+            messages.warning(
+                self.request,
+                f"Skipped {len(result.errors)} invalid "
+                f"row{pluralize(len(result.errors))} ({details})"
+            )
+        return redirect("task-manager:project-detail", pk=self.project.pk)
+
+
+class TaskBulkView(
+    LoginRequiredMixin,
+    NextUrlRedirectMixin,
+    generic.FormView
+):
+    form_class = TaskBulkForm
+    http_method_names = ["post"]
+    success_url = reverse_lazy("task-manager:task-list")
+
+    def wants_json(self):
+        return self.request.content_type == "application/json"
+
+    def get_form_kwargs(self):
+        kwargs = super().get_form_kwargs()
+        if self.wants_json():
+            try:
+                data = json.loads(self.request.body)
+            except ValueError:
+                data = None
+            kwargs["data"] = data if isinstance(data, dict) else {}
+        return kwargs
+
+    def form_valid(self, form):
+        data = form.cleaned_data
+        try:
+            result = apply_bulk_action(
+                self.request.user,
+                data["tasks"],
+                data["action"],
+                priority=data["priority"],
+                tag_ids=[tag.pk for tag in data["tags"]],
+                worker_ids=[worker.pk for worker in data["assignees"]],
+            )
+        except PermissionDenied as error:
+            return self.error_response(str(error), 403)
+        except BulkActionError as error:
+            return self.error_response(str(error), 400)
+
+        if self.wants_json():
+            return JsonResponse(
+                {"action": result.action, "tasks": result.tasks}
+            )
+        messages.success(
+            self.request,
+            f"Updated {result.tasks} task{pluralize(result.tasks)}."
+        )
+        return redirect(self.get_success_url())
+
+    def form_invalid(self, form):
+        if self.wants_json():
+            return JsonResponse({"errors": form.errors}, status=400)
+        return self.error_response(
+            "; ".join(
+                f"{field}: {' '.join(errors)}"
+                for field, errors in form.errors.items()
+            ),
+            400
+        )
+
+    def error_response(self, message, status):
+        if self.wants_json():
+            return JsonResponse({"error": message}, status=status)
+        messages.error(self.request, message)
+        return redirect(self.get_success_url())
+
+
 class TaskUpdateView(LoginRequiredMixin, generic.UpdateView):
     model = Task
     form_class = TaskForm
@@ -329,8 +469,15 @@ class TaskDeleteView(LoginRequiredMixin, generic.DeleteView):
         return super().dispatch(request, *args, **kwargs)
 
 
-class ProjectListView(LoginRequiredMixin, generic.ListView):
+class ProjectListView(
+    AsyncLoginRequiredMixin,
+    AsyncConditionalGetMixin,
+    AsyncListMixin,
+    KeysetPaginationMixin,
+    generic.ListView
+):
     model = Project
+    conditional_models = (Project, Team, Task)
     paginate_by = 5
 
     def get_context_data(
@@ -344,17 +491,11 @@ class ProjectListView(LoginRequiredMixin, generic.ListView):
         context["search_query"] = name
         context["page_title"] = "All projects"
         context["is_user_projects_page"] = False
-        context["user_team_ids"] = set(
-            self.request.user.teams.values_list("id", flat=True)
-        )
+        context["user_team_ids"] = get_user_team_ids(self.request.user)
         return context
 
     def get_queryset(self):
-        queryset = (
-            Project.objects
-            .select_related("team")
-            .annotate(task_count=Count("tasks", distinct=True))
-        )
+        queryset = Project.objects.select_related("team")
         form = ProjectNameSearchForm(self.request.GET)
         if form.is_valid():
             return queryset.filter(
@@ -363,8 +504,15 @@ class ProjectListView(LoginRequiredMixin, generic.ListView):
         return queryset
 
 
-class UserProjectListView(LoginRequiredMixin, generic.ListView):
+class UserProjectListView(
+    AsyncLoginRequiredMixin,
+    AsyncConditionalGetMixin,
+    AsyncListMixin,
+    KeysetPaginationMixin,
+    generic.ListView
+):
     model = Project
+    conditional_models = (Project, Team, Task)
     paginate_by = 5
     template_name = "task_manager/project_list.html"
 
@@ -379,9 +527,7 @@ class UserProjectListView(LoginRequiredMixin, generic.ListView):
         context["search_query"] = name
         context["page_title"] = "My projects"
         context["is_user_projects_page"] = True
-        context["user_team_ids"] = set(
-            self.request.user.teams.values_list("id", flat=True)
-        )
+        context["user_team_ids"] = get_user_team_ids(self.request.user)
         return context
 
     def get_queryset(self):
@@ -389,7 +535,6 @@ class UserProjectListView(LoginRequiredMixin, generic.ListView):
             Project.objects
             .select_related("team")
             .filter(team__members=self.request.user)
-            .annotate(task_count=Count("tasks", distinct=True))
         )
         form = ProjectNameSearchForm(self.request.GET)
         if form.is_valid():
@@ -399,22 +544,66 @@ class UserProjectListView(LoginRequiredMixin, generic.ListView):
         return queryset
 
 
-class ProjectDetailView(LoginRequiredMixin, generic.DetailView):
+class ProjectDetailView(
+    AsyncLoginRequiredMixin,
+    AsyncConditionalGetMixin,
+    AsyncDetailMixin,
+    generic.DetailView
+):
     model = Project
+    conditional_models = (Project, Team, Task)
     queryset = Project.objects.select_related("team")
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["tasks_in_progress"] = (
-            self.object.tasks.filter(is_completed=False)
+        tasks = self.object.tasks.only("name", "updated_at")
+        context["tasks_in_progress"] = tasks.filter(is_completed=False)
+        context["tasks_completed"] = tasks.filter(is_completed=True)
+        context["project_in_user_team"] = is_team_member(
+            self.request.user, self.object.team_id
         )
-        context["tasks_completed"] = (
-            self.object.tasks.filter(is_completed=True)
+        return context
+
+
+class ProjectBoardView(LoginRequiredMixin, generic.DetailView):
+    model = Project
+    template_name = "task_manager/project_board.html"
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        counts = column_counts(self.object)
+        context["columns"] = [
+            {"key": key, "label": label, "count": counts[key]}
+            for key, label in BOARD_COLUMNS
+        ]
+        context["project_in_user_team"] = is_team_member(
+            self.request.user, self.object.team_id
         )
-        context["project_in_user_team"] = (
-            self.object.team.members.filter(
-                pk=self.request.user.pk
-            ).exists()
+        return context
+
+
+class ProjectBoardColumnView(
+    LoginRequiredMixin,
+    KeysetPaginationMixin,
+    generic.ListView
+):
+    template_name = "task_manager/project_board_column.html"
+    context_object_name = "task_list"
+    paginate_by = BOARD_PAGE_SIZE
+
+    def get_queryset(self):
+        column = self.kwargs["column"]
+        if not is_board_column(column):
+            raise Http404("Unknown board column.")
+        self.project = get_object_or_404(
+            Project.objects.only("team_id"), pk=self.kwargs["pk"]
+        )
+        return column_tasks(self.project, column)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["project_in_user_team"] = is_team_member(
+            self.request.user, self.project.team_id
         )
         return context
 
@@ -480,8 +669,14 @@ class ProjectDeleteView(LoginRequiredMixin, generic.DeleteView):
         return super().dispatch(request, *args, **kwargs)
 
 
-class PositionListView(LoginRequiredMixin, generic.ListView):
+class PositionListView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    KeysetPaginationMixin,
+    generic.ListView
+):
     model = Position
+    conditional_models = (Position, Worker)
     paginate_by = 5
 
     def get_context_data(
@@ -496,9 +691,7 @@ class PositionListView(LoginRequiredMixin, generic.ListView):
         return context
 
     def get_queryset(self):
-        queryset = Position.objects.annotate(
-            worker_count=Count("workers", distinct=True)
-        )
+        queryset = Position.objects.all()
         form = PositionNameSearchForm(self.request.GET)
         if form.is_valid():
             return queryset.filter(
@@ -537,8 +730,15 @@ class PositionDeleteView(StaffRequiredMixin, generic.DeleteView):
     success_url = reverse_lazy("task-manager:position-list")
 
 
-class TeamListView(LoginRequiredMixin, generic.ListView):
+class TeamListView(
+    AsyncLoginRequiredMixin,
+    AsyncConditionalGetMixin,
+    AsyncListMixin,
+    KeysetPaginationMixin,
+    generic.ListView
+):
     model = Team
+    conditional_models = (Team,)
     paginate_by = 5
 
     def get_context_data(
@@ -552,12 +752,11 @@ class TeamListView(LoginRequiredMixin, generic.ListView):
         context["search_query"] = name
         context["page_title"] = f"All teams"
         context["is_user_team_page"] = False
+        context["user_team_ids"] = get_user_team_ids(self.request.user)
         return context
 
     def get_queryset(self):
-        queryset = Team.objects.annotate(
-            member_count=Count("members", distinct=True)
-        )
+        queryset = Team.objects.all()
         form = TeamNameSearchForm(self.request.GET)
         if form.is_valid():
             return queryset.filter(
@@ -566,8 +765,15 @@ class TeamListView(LoginRequiredMixin, generic.ListView):
         return queryset
 
 
-class UserTeamListView(LoginRequiredMixin, generic.ListView):
+class UserTeamListView(
+    AsyncLoginRequiredMixin,
+    AsyncConditionalGetMixin,
+    AsyncListMixin,
+    KeysetPaginationMixin,
+    generic.ListView
+):
     model = Team
+    conditional_models = (Team,)
     paginate_by = 5
     template_name = "task_manager/team_list.html"
 
@@ -582,16 +788,13 @@ class UserTeamListView(LoginRequiredMixin, generic.ListView):
         context["search_query"] = name
         context["page_title"] = f"My teams"
         context["is_user_team_page"] = True
+        context["user_team_ids"] = get_user_team_ids(self.request.user)
         return context
 
     def get_queryset(self):
         queryset = (
             Team.objects
             .filter(members=self.request.user)
-            .annotate(
-                member_count=Count("members", distinct=True)
-            )
-            .prefetch_related("members")
         )
         form = TeamNameSearchForm(self.request.GET)
         if form.is_valid():
@@ -601,8 +804,14 @@ class UserTeamListView(LoginRequiredMixin, generic.ListView):
         return queryset
 
 
-class TeamDetailView(LoginRequiredMixin, generic.DetailView):
+class TeamDetailView(
+    AsyncLoginRequiredMixin,
+    AsyncConditionalGetMixin,
+    AsyncDetailMixin,
+    generic.DetailView
+):
     model = Team
+    conditional_models = (Team, Worker, Project)
     queryset = Team.objects.prefetch_related(
         Prefetch(
             "members",
@@ -613,10 +822,8 @@ class TeamDetailView(LoginRequiredMixin, generic.DetailView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["user_in_team"] = (
-            self.object.members.filter(
-                pk=self.request.user.pk
-            ).exists()
+        context["user_in_team"] = is_team_member(
+            self.request.user, self.object.pk
         )
         return context
 
@@ -661,21 +868,27 @@ class TeamUpdateView(LoginRequiredMixin, generic.UpdateView):
         return super().dispatch(request, *args, **kwargs)
 
     def form_valid(self, form):
-        team = self.get_object()
-        old_member_ids = set(team.members.values_list("id", flat=True))
-
-        response = super().form_valid(form)
-
-        new_member_ids = set(self.object.members.values_list("id", flat=True))
+        old_member_ids = {member.pk for member in self.object.members.all()}
+        new_member_ids = {
+            member.pk for member in form.cleaned_data["members"]
+        }
         removed_member_ids = old_member_ids - new_member_ids
 
+        with transaction.atomic():
+            response = super().form_valid(form)
+            if removed_member_ids:
+                enqueue(
+                    "drop_stale_assignments",
+                    team_id=self.object.pk,
+                    member_ids=sorted(removed_member_ids),
+                )
+
         if removed_member_ids:
-            tasks = Task.objects.filter(
-                project__team=self.object,
-                assignees__id__in=removed_member_ids
-            ).distinct()
-            for task in tasks:
-                task.assignees.remove(*removed_member_ids)
+            messages.info(
+                self.request,
+                "Task assignments of former team members will be removed "
+                "shortly."
+            )
 
         return response
 
@@ -699,8 +912,14 @@ class TeamDeleteView(LoginRequiredMixin, generic.DeleteView):
         return super().dispatch(request, *args, **kwargs)
 
 
-class TagListView(LoginRequiredMixin, generic.ListView):
+class TagListView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    KeysetPaginationMixin,
+    generic.ListView
+):
     model = Tag
+    conditional_models = (Tag,)
     paginate_by = 5
 
     def get_context_data(
@@ -724,62 +943,39 @@ class TagListView(LoginRequiredMixin, generic.ListView):
         return queryset
 
 
-class TagDetailView(LoginRequiredMixin, generic.ListView):
+class TagDetailView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    KeysetPaginationMixin,
+    generic.ListView
+):
     model = Task
+    conditional_models = (Task, Project, TaskType, Tag)
     template_name = "task_manager/task_list.html"
     context_object_name = "task_list"
     paginate_by = 5
 
     def get_queryset(self):
-        self.tag = get_object_or_404(Tag, pk=self.kwargs["pk"])
+        self.tag = get_reference_or_none(Tag, self.kwargs["pk"])
+        if self.tag is None:
+            raise Http404("No tag found matching the query.")
 
-        queryset = (
-            Task.objects
-            .filter(tags=self.tag)
-            .select_related("task_type", "project")
-            .prefetch_related("assignees", "tags")
-            .distinct()
-        )
+        queryset = _task_list_queryset().filter(tags=self.tag).distinct()
 
         form = TaskNameSearchForm(self.request.GET)
         if form.is_valid():
             query = form.cleaned_data.get("name")
             if query:
-                queryset = (
-                    queryset
-                    .filter(
-                        Q(name__icontains=query) |
-                        Q(task_type__name__icontains=query) |
-                        Q(tags__name__icontains=query)
-                    )
-                    .annotate(
-                        search_rank=Case(
-                            When(
-                                name__icontains=query,
-                                then=Value(1)
-                            ),
-                            When(
-                                task_type__name__icontains=query,
-                                then=Value(2)
-                            ),
-                            When(
-                                tags__name__icontains=query,
-                                then=Value(3)
-                            ),
-                            default=Value(4),
-                            output_field=IntegerField(),
-                        )
-                    )
-                    .order_by("search_rank", "name")
-                    .distinct()
-                )
+                queryset = search_tasks(queryset, query)
 
         return queryset
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        attach_task_references(context["task_list"])
         name = self.request.GET.get("name", "")
         context["search_form"] = TaskNameSearchForm(initial={"name": name})
+        context["bulk_form"] = TaskBulkForm()
         context["page_title"] = f"Tasks with tag: #{self.tag.name}"
         context["empty_message"] = "There are no tasks with this tag."
         context["sub_title"] = context["page_title"].title()
@@ -808,8 +1004,14 @@ class TagDeleteView(LoginRequiredMixin, generic.DeleteView):
     success_url = reverse_lazy("task-manager:tag-list")
 
 
-class TaskTypeListView(LoginRequiredMixin, generic.ListView):
+class TaskTypeListView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    KeysetPaginationMixin,
+    generic.ListView
+):
     model = TaskType
+    conditional_models = (TaskType,)
     context_object_name = "task_type_list"
     template_name = "task_manager/task_type_list.html"
     paginate_by = 5
@@ -835,61 +1037,39 @@ class TaskTypeListView(LoginRequiredMixin, generic.ListView):
         return queryset
 
 
-class TaskTypeDetailView(LoginRequiredMixin, generic.ListView):
+class TaskTypeDetailView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    KeysetPaginationMixin,
+    generic.ListView
+):
     model = TaskType
+    conditional_models = (Task, Project, TaskType, Tag)
     context_object_name = "task_list"
     template_name = "task_manager/task_list.html"
     paginate_by = 5
 
     def get_queryset(self):
-        self.task_type = get_object_or_404(TaskType, pk=self.kwargs["pk"])
+        self.task_type = get_reference_or_none(TaskType, self.kwargs["pk"])
+        if self.task_type is None:
+            raise Http404("No task type found matching the query.")
 
-        queryset = (
-            Task.objects
-            .filter(task_type=self.task_type)
-            .select_related("task_type", "project")
-            .prefetch_related("assignees", "tags")
-        )
+        queryset = _task_list_queryset().filter(task_type=self.task_type)
 
         form = TaskNameSearchForm(self.request.GET)
         if form.is_valid():
             query = form.cleaned_data.get("name")
             if query:
-                queryset = (
-                    queryset
-                    .filter(
-                        Q(name__icontains=query) |
-                        Q(task_type__name__icontains=query) |
-                        Q(tags__name__icontains=query)
-                    )
-                    .annotate(
-                        search_rank=Case(
-                            When(
-                                name__icontains=query,
-                                then=Value(1)
-                            ),
-                            When(
-                                task_type__name__icontains=query,
-                                then=Value(2)
-                            ),
-                            When(
-                                tags__name__icontains=query,
-                                then=Value(3)
-                            ),
-                            default=Value(4),
-                            output_field=IntegerField(),
-                        )
-                    )
-                    .order_by("search_rank", "name")
-                    .distinct()
-                )
+                queryset = search_tasks(queryset, query)
 
         return queryset
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        attach_task_references(context["task_list"])
         name = self.request.GET.get("name", "")
         context["search_form"] = TaskNameSearchForm(initial={"name": name})
+        context["bulk_form"] = TaskBulkForm()
         context["page_title"] = f"Tasks with task type: {self.task_type.name}"
         context["empty_message"] = "There are no tasks with this task type."
         context["sub_title"] = context["page_title"].title()
@@ -925,19 +1105,45 @@ class TaskTypeDeleteView(LoginRequiredMixin, generic.DeleteView):
 @login_required
 def change_task_status(request, pk):
     task = get_object_or_404(
-        Task.objects.select_related("project__team"),
+        Task.objects.select_related("project"),
         pk=pk,
     )
 
-    if not task.project.team.members.filter(pk=request.user.pk).exists():
+    if not is_team_member(request.user, task.project.team_id):
         raise PermissionDenied
 
     task.is_completed = not task.is_completed
-    task.save(update_fields=["is_completed"])
+    task.save(update_fields=["is_completed", "updated_at"])
 
     return redirect("task-manager:task-detail", pk=task.pk)
 
 
+@require_POST
+@login_required
+def move_board_task(request, pk):
+    column = request.POST.get("column", "")
+    if not is_board_column(column):
+        return JsonResponse({"error": "Unknown board column."}, status=400)
+
+    task = get_object_or_404(
+        Task.objects
+        .select_related("project")
+        .only("priority", "is_completed", "project__team_id"),
+        pk=pk,
+    )
+
+    if not is_team_member(request.user, task.project.team_id):
+        raise PermissionDenied
+
+    move_task(task, column)
+
+    return JsonResponse({
+        "id": task.pk,
+        "column": column,
+        "counts": column_counts(task.project),
+    })
+
+
 class TaskCreateSelectTeamView(LoginRequiredMixin, generic.FormView):
     form_class = ChooseTeamForm
     template_name = "task_manager/task_choose_team.html"
@@ -949,11 +1155,7 @@ class TaskCreateSelectTeamView(LoginRequiredMixin, generic.FormView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data()
-        context["has_teams"] = (
-            Team.objects.filter(
-                members=self.request.user
-            ).exists()
-        )
+        context["has_teams"] = bool(get_user_team_ids(self.request.user))
         return context
 
     def form_valid(self, form):
@@ -1008,13 +1210,59 @@ class ProjectCreateSelectTeamView(LoginRequiredMixin, generic.FormView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["has_teams"] = (
-            Team.objects.filter(
-                members=self.request.user
-            ).exists()
-        )
+        context["has_teams"] = bool(get_user_team_ids(self.request.user))
         return context
 
     def form_valid(self, form):
         team = form.cleaned_data["team"]
         return redirect("task-manager:project-create", team_pk=team.id)
+
+
+class RequestMetricsView(StaffRequiredMixin, generic.View):
+    def get(self, request, *args, **kwargs):
+        return JsonResponse(metrics_registry.snapshot())
+
+
+class ExportView(LoginRequiredMixin, generic.View):
+    kind = None
+    search_form_class = None
+    search_field = "name"
+    content_types = {
+        "csv": "text/csv",
+        "jsonl": "application/x-ndjson",
+    }
+
+    def get(self, request, *args, **kwargs):
+        export_format = request.GET.get("format", "csv")
+        if export_format not in EXPORT_FORMATS:
+            raise Http404(f"Unknown export format '{export_format}'.")
+
+        query = ""
+        form = self.search_form_class(request.GET)
+        if form.is_valid():
+            query = form.cleaned_data[self.search_field]
+
+        response = StreamingHttpResponse(
+            export_lines(self.kind, export_format, request.user, query),
+            content_type=self.content_types[export_format],
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{self.kind}.{export_format}"'
+        )
+        return response
+
+
+class TaskExportView(ExportView):
+    kind = "tasks"
+    search_form_class = TaskNameSearchForm
+
+
+class ProjectExportView(ExportView):
+    kind = "projects"
+    search_form_class = ProjectNameSearchForm
+
+
+class WorkerExportView(ExportView):
+    kind = "workers"
+    search_form_class = WorkerUsernameSearchForm
+    search_field = "username"